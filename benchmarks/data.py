@@ -0,0 +1,73 @@
+import datetime
+import random
+import yaml
+
+
+sizes = {
+    'small': {'individuals': 5, 'words': 1000},
+    'medium': {'individuals': 20, 'words': 20000},
+    'large': {'individuals': 50, 'words': 200000}}
+
+first_names = ['James', 'Jane', 'Tim', 'Mary', 'Ahmed', 'Chen', 'Olga', 'Luis']
+last_names = ['Smith', 'Doe', 'Jones', 'Khan', 'Wang', 'Ivanova', 'Garcia']
+cities = ['London', 'New York', 'Paris', 'Lagos', 'Tokyo', 'Lima']
+pets = ['ginger', 'rex', 'cat', 'biscuit', 'luna']
+
+
+def word_list(count, seed=0):
+    """
+    Return count distinct lower case
+    words of 3 to 10 letters
+    """
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        words.add(''.join(
+            rng.choice('abcdefghijklmnopqrstuvwxyz')
+            for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+
+def individual(rng):
+    """
+    Return one synthetic individual
+    using every category
+    """
+    first, last = rng.choice(first_names), rng.choice(last_names)
+    dob = datetime.date(rng.randint(1940, 2005), rng.randint(1, 12), rng.randint(1, 28))
+    family_dob = datetime.date(rng.randint(1920, 1990), rng.randint(1, 12), rng.randint(1, 28))
+    return {first + ' ' + last: [
+        {'core_bio': {
+            'first_name': first,
+            'last_name': last,
+            'city': rng.choice(cities),
+            'dob': dob}},
+        {'family': [{'individual_1': {
+            'first_name': rng.choice(first_names),
+            'last_name': last,
+            'dob': family_dob}}]},
+        {'free_data': {'pet': rng.choice(pets)}}]}
+
+
+def individuals(count, seed=0):
+    """
+    Return count synthetic individuals
+    """
+    rng = random.Random(seed)
+    return [individual(rng) for _ in range(count)]
+
+
+def write_size(size, directory):
+    """
+    Write the target YAML and word list
+    for a size, returning their paths
+    """
+    yaml_path = directory + '/' + size + '.yaml'
+    words_path = directory + '/' + size + '.txt'
+    with open(yaml_path, 'w') as yaml_file:
+        yaml.dump(
+            {'individuals': individuals(sizes[size]['individuals'])},
+            yaml_file, default_flow_style=False)
+    with open(words_path, 'w') as words_file:
+        words_file.write('\n'.join(word_list(sizes[size]['words'])) + '\n')
+    return yaml_path, words_path
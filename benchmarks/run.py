@@ -0,0 +1,330 @@
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from . import stubs
+from .data import sizes, write_size
+from pata_password_cracker.__main__ import process_input
+from pata_password_cracker.cache import transform_cache
+from pata_password_cracker.categories import Categories
+from pata_password_cracker.input import ProcessInputYaml, ProcessInputWords
+from pata_password_cracker.output import ProcessOutputWordlist
+from pata_password_cracker.pipeline import hash_clear_text
+from pata_password_cracker.substitutors.simple import MungSubstitutor
+from pata_password_cracker.substitutors.rules import RuleSubstitutor
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+encryption = ['md5', 'sha1', 'sha224', 'sha256', 'sha384', 'sha512', 'bcrypt']
+substitutors = ['simple', 'simplerandom', 'common', 'leet']
+hash_sample = 20000
+bcrypt_sample = 50
+baseline_file = os.path.join(os.path.dirname(__file__), 'baseline.json')
+min_seconds = 0.05
+repeat = 5
+
+
+class Timer():
+    """
+    Context manager recording
+    the seconds it was open for
+    """
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self.start
+
+
+def best_time(func):
+    """
+    Return the fastest of repeat runs
+    of func, in seconds, as timeit does
+    """
+    times = []
+    for _ in range(repeat):
+        with Timer() as timer:
+            func()
+        times.append(timer.seconds)
+    return min(times)
+
+
+def rate(count, seconds):
+    """
+    Return count per second
+    """
+    return count / seconds if seconds else 0.0
+
+
+def peak_rss_mb():
+    """
+    Return the peak resident set size
+    of the process so far, in MB, or
+    None where it is not available
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def calibrate():
+    """
+    Return the time of a fixed workload,
+    so results can be compared across
+    machines and CPU speeds
+    """
+    values = [str(i) for i in range(50000)]
+    return best_time(lambda: [
+        hashlib.md5(v.encode('utf-8')).hexdigest().upper() for v in values])
+
+
+def plugins():
+    """
+    Return the plugins used
+    for every benchmark
+    """
+    return {
+        'pata_password_cracker.encryption': encryption,
+        'pata_password_cracker.substitutors': substitutors}
+
+
+def bench_words(words_path, results):
+    """
+    Time loading the word list into
+    memory and memory mapping it
+    """
+    results['words.load_sec'] = best_time(
+        lambda: ProcessInputWords().words_processor(words_path))
+    results['words.mmap_sec'] = best_time(
+        lambda: ProcessInputWords().mapped_words_processor(words_path))
+    return ProcessInputWords().words_processor(words_path)
+
+
+def bench_generate(yaml_path, words, results):
+    """
+    Time generating the unhashed candidates
+    of every individual, returning them
+    """
+    candidates = []
+    with Timer() as timer:
+        for individual in ProcessInputYaml().individuals_processor(yaml_path):
+            categories = Categories(individual, words, plugins())
+            for target in individual:
+                candidates.extend(categories.stream_target(target))
+    results['generate.candidates'] = len(candidates)
+    results['generate_sec'] = timer.seconds
+    results['generate.candidates_per_sec'] = rate(len(candidates), timer.seconds)
+    return candidates
+
+
+def bench_substitute(words, results):
+    """
+    Time MungSubstitutor.munger, each
+    substitutor plugin and a batch of the
+    default rules over a sample of the
+    word list
+    """
+    sample = words[:hash_sample]
+    table = MungSubstitutor.substitution_table_simple.items()
+    munger = MungSubstitutor()
+    seconds = best_time(lambda: [munger.munger(word, table) for word in sample])
+    results['substitute.munger_per_sec'] = rate(len(sample), seconds)
+
+    loaded = Categories({}, [], plugins()).loaded_substitutors_plugin_dict
+    for name in substitutors:
+        substitute = loaded[name]().substitute
+        seconds = best_time(lambda: [substitute(word) for word in sample])
+        results['substitute.' + name + '_per_sec'] = rate(len(sample), seconds)
+
+    rules = RuleSubstitutor()
+    seconds = best_time(lambda: rules.substitute_many(sample))
+    results['substitute.rules_batch_per_sec'] = rate(len(sample), seconds)
+
+
+def bench_hash(candidates, results):
+    """
+    Time each encryption plugin over
+    a sample of the candidates. bcrypt
+    uses the minimum cost and a small
+    sample
+    """
+    clear_text = [c.clear_text for c in candidates[:hash_sample]]
+    loaded = Categories({}, [], plugins()).loaded_encryption_plugin_dict
+    BcryptEncryption.rounds = 4
+    for name in encryption:
+        sample = clear_text[:bcrypt_sample] if name == 'bcrypt' else clear_text
+        encryptor = loaded[name]()
+        seconds = best_time(lambda: hash_clear_text(encryptor, sample))
+        results['hash.' + name + '_per_sec'] = rate(len(sample), seconds)
+
+
+def bench_output(candidates, directory, results):
+    """
+    Time writing the candidates
+    out as a wordlist
+    """
+    output = ProcessOutputWordlist()
+    output.file_name = os.path.join(directory, 'bench.txt')
+    records = [('0:bench', c._replace(encrypted={})) for c in candidates]
+    seconds = best_time(lambda: output.stream_processor(records))
+    results['output_sec'] = seconds
+    results['output.records_per_sec'] = rate(len(records), seconds)
+
+
+def bench_end_to_end(yaml_path, words_path, directory, results):
+    """
+    Time a whole streamed run hashing
+    with md5 and writing a wordlist
+    """
+    options = {
+        'stream': True,
+        'output_format': 'wordlist',
+        'output_dir': os.path.join(directory, 'out')}
+    plugins_to_use = {
+        'pata_password_cracker.encryption': ['md5'],
+        'pata_password_cracker.substitutors': substitutors[:3]}
+    with Timer() as timer:
+        process_input(yaml_path, words_path, plugins_to_use, options)
+    results['end_to_end_sec'] = timer.seconds
+
+
+def run_size(size):
+    """
+    Run every benchmark for
+    one size, returning results
+    """
+    random.seed(0)
+    transform_cache.clear()
+    results = {'calibration_sec': calibrate()}
+    with tempfile.TemporaryDirectory() as directory:
+        yaml_path, words_path = write_size(size, directory)
+        words = bench_words(words_path, results)
+        candidates = bench_generate(yaml_path, words, results)
+        bench_substitute(words, results)
+        bench_hash(candidates, results)
+        bench_output(candidates, directory, results)
+        transform_cache.clear()
+        bench_end_to_end(yaml_path, words_path, directory, results)
+    results['peak_rss_mb'] = peak_rss_mb()
+    return results
+
+
+def regressions(results, baseline, tolerance):
+    """
+    Return a line for every result worse
+    than the baseline by more than
+    tolerance. Rates should not fall,
+    times and memory should not grow.
+    Rates and times are first scaled by
+    the calibration time, and times too
+    short to measure reliably are skipped
+    """
+    found = []
+    for size, metrics in results.items():
+        base_metrics = baseline.get(size, {})
+        speed = 1.0
+        if base_metrics.get('calibration_sec'):
+            speed = metrics['calibration_sec'] / base_metrics['calibration_sec']
+        for name, value in metrics.items():
+            base = base_metrics.get(name)
+            if not base or value is None or name == 'calibration_sec':
+                continue
+            if name.endswith('_per_sec'):
+                base = base / speed
+                change = (base - value) / base
+            elif name.endswith('_sec') and base < min_seconds:
+                continue
+            elif name.endswith('_sec'):
+                base = base * speed
+                change = (value - base) / base
+            elif name.endswith('_mb'):
+                change = (value - base) / base
+            else:
+                continue
+            if change > tolerance:
+                found.append('%s %s: %.4g against a baseline of %.4g (%.0f%% worse)' % (
+                    size, name, value, base, change * 100))
+    return found
+
+
+def report(results):
+    """
+    Print the results as a table
+    """
+    names = sorted(set(n for metrics in results.values() for n in metrics))
+    print('%-32s' % 'benchmark' + ''.join('%14s' % size for size in results))
+    for name in names:
+        values = [results[size].get(name) for size in results]
+        print('%-32s' % name + ''.join(
+            '%14s' % ('-' if v is None else '%.4g' % v) for v in values))
+
+
+def main():
+    """
+    Run the benchmarks, comparing them
+    with a baseline when one is given
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--sizes",
+        default="small,medium",
+        help="sizes to run, from " + ",".join(sizes))
+    parser.add_argument(
+        "--baseline",
+        help="baseline results to compare with, e.g. " + baseline_file)
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="store these results as the new baseline, in --baseline or "
+             + baseline_file)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="fraction a result may be worse than the baseline")
+    parser.add_argument(
+        "--json",
+        help="also write the results to this file")
+    args = parser.parse_args()
+
+    stubs.install()
+    results = {}
+    for size in args.sizes.split(','):
+        print("Running %s benchmarks" % size, file=sys.stderr)
+        results[size] = run_size(size)
+    report(results)
+
+    if args.json:
+        with open(args.json, 'w') as json_file:
+            json.dump(results, json_file, indent=2, sort_keys=True)
+
+    if args.save:
+        with open(args.baseline or baseline_file, 'w') as baseline_out:
+            json.dump(results, baseline_out, indent=2, sort_keys=True)
+        return 0
+
+    if not args.baseline:
+        return 0
+    with open(args.baseline) as baseline_in:
+        found = regressions(results, json.load(baseline_in), args.tolerance)
+    for line in found:
+        print("Regression: " + line)
+    return 1 if found else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+import zlib
+from pata_password_cracker.generators import gen_password
+
+
+class StubTransform():
+    """
+    Stand in for the patalib transforms
+    that need WordNet. Results are picked
+    from a fixed vocabulary using a checksum
+    of the input, so every run does the
+    same work without network access
+    """
+    vocabulary = [
+        'metropolis', 'borough', 'hamlet', 'canine', 'feline', 'spark',
+        'harbour', 'meadow', 'summit', 'river', 'ember', 'willow',
+        'anchor', 'falcon', 'quartz', 'copper', 'lantern', 'orchard']
+    count = 4
+
+    def results(self, word, offset):
+        """
+        Return count words for
+        an input word
+        """
+        start = zlib.crc32(word.encode('utf-8')) + offset
+        return {'results': [
+            self.vocabulary[(start + i) % len(self.vocabulary)]
+            for i in range(self.count)]}
+
+    def generate_synonym(self, word):
+        return self.results(word, 0)
+
+    def generate_antonym(self, word):
+        return self.results(word, 5)
+
+    def generate_syzygy(self, word):
+        return self.results(word, 11)
+
+
+def install():
+    """
+    Replace the WordNet transforms
+    used by PasswordGenerator. Anomaly
+    and Clinamen only use the word list
+    so the real ones are kept
+    """
+    gen_password.Synonym = StubTransform
+    gen_password.Antonym = StubTransform
+    gen_password.Syzygy = StubTransform
@@ -42,7 +42,8 @@ setup(
     packages=find_packages('src'),
     entry_points={
         'console_script': [
-            'pata_password_cracker = pata_password_cracker.__main__:main'
+            'pata_password_cracker = pata_password_cracker.__main__:main',
+            'pata_password_cracker_serve = pata_password_cracker.serve:main'
         ],
         'pata_password_cracker.plugins': [
             'core_bio = pata_password_cracker.generators.core_bio:CoreBioGenerator',
@@ -61,7 +62,9 @@ setup(
         'pata_password_cracker.substitutors': [
             'simple = pata_password_cracker.substitutors.simple:MungSubstitutor',
             'simplerandom = pata_password_cracker.substitutors.simplerandom:MungSubstitutorRandom',
-            'common = pata_password_cracker.substitutors.common:MungSubstitutorCommon'
+            'common = pata_password_cracker.substitutors.common:MungSubstitutorCommon',
+            'leet = pata_password_cracker.substitutors.leet:MungSubstitutorLeet',
+            'rules = pata_password_cracker.substitutors.rules:RuleSubstitutor'
         ]
     },
     install_requires=[
@@ -1,8 +1,22 @@
 import argparse
-from .input import ProcessInputYaml, ProcessInputWords
+import os
+from .input import ProcessInputYaml, ProcessInputJsonLines, ProcessInputWords
 from .gen_logo import Logo
 from .categories import Categories
-from .output import ProcessOutputYaml
+from .output import output_writer, output_file_name, digest_text
+from .plugins import plugin_processor
+from .parallel import parallel_password_lists
+from .cache import transform_cache, PersistentTransformStore
+from .substitutors.simple import MungSubstitutor
+from .substitutors.rules import RuleSubstitutor
+from .encryption.bcrypt import BcryptEncryption, parse_salt
+from .dedup import seen_filter, individual_filter
+from .pipeline import unique_records
+from .targets import target_hashes
+from .scheduler import PriorityScheduler
+from .stats import stats
+from .combinator import option_combinator
+from .stages import threaded_writer
 
 
 def main():
@@ -22,46 +36,391 @@ def main():
     parser.add_argument(
         "encryption",
         help="list of encryption to be used in output ")
+    parser.add_argument(
+        "--bcrypt-salt",
+        help="bcrypt salt, or a captured bcrypt hash, to hash every password with")
+    parser.add_argument(
+        "--bcrypt-rounds",
+        type=int,
+        default=12,
+        help="bcrypt cost used when no salt is given")
+    parser.add_argument(
+        "--bcrypt-workers",
+        type=int,
+        default=1,
+        help="number of processes used to compute bcrypt hashes")
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="report a running count of bcrypt hashes")
+    parser.add_argument(
+        "--substitutors",
+        default="simple,simplerandom,common",
+        help="list of substitutors to apply e.g. simple,common,leet")
+    parser.add_argument(
+        "--max-variants",
+        type=int,
+        default=32,
+        help="maximum variants per word from combinatorial substitutors such as leet, "
+             "0 for no cap")
+    parser.add_argument(
+        "--rules",
+        help="hashcat or John the Ripper rule file for the rules substitutor")
+    parser.add_argument(
+        "--combine-fields",
+        type=int,
+        default=0,
+        help="also join the values of up to this many fields, e.g. 2 for pairs")
+    parser.add_argument(
+        "--combine-separators",
+        default="",
+        help="comma separated separators to join fields with e.g. ',_,.'")
+    parser.add_argument(
+        "--combine-budget",
+        type=int,
+        default=10000,
+        help="maximum combined candidates per individual, shortest first")
+    parser.add_argument(
+        "--output-format",
+        choices=["yaml", "wordlist", "potfile"],
+        default="yaml",
+        help="write a YAML report, a plain wordlist or hash:plain potfile lines")
+    parser.add_argument(
+        "--output-dir",
+        help="write each individual to its own file in this directory")
+    parser.add_argument(
+        "--target-hashes",
+        help="file of captured hashes to crack, only matching candidates are output")
+    parser.add_argument(
+        "--schedule",
+        choices=["fixed", "priority"],
+        help="run transforms in their fixed order, or cheapest and most likely "
+             "first (the default with --target-hashes)")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="stream candidates to the output as they are generated")
+    parser.add_argument(
+        "--pipeline",
+        action="store_true",
+        help="when streaming, generate, hash and write candidates in concurrent "
+             "stages joined by bounded queues")
+    parser.add_argument(
+        "--hash-threads",
+        type=int,
+        default=2,
+        help="number of threads hashing candidates in the pipeline")
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=64,
+        help="number of batches or records each pipeline queue holds")
+    parser.add_argument(
+        "--dedup",
+        choices=["none", "individual", "global"],
+        default="none",
+        help="drop repeated streamed candidates per individual or across the run")
+    parser.add_argument(
+        "--dedup-error-rate",
+        type=float,
+        default=0.0,
+        help="use a fixed size Bloom filter with this false positive rate for dedup")
+    parser.add_argument(
+        "--dedup-capacity",
+        type=int,
+        default=1000000,
+        help="number of candidates the dedup Bloom filter is sized for")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes used to generate individuals in parallel")
+    parser.add_argument(
+        "--mmap-words",
+        action="store_true",
+        help="memory map the word list instead of loading it into memory")
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print the time, calls and items of each stage of the run")
+    parser.add_argument(
+        "--stats-json",
+        help="write the stats of each stage of the run to this JSON file")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help="number of WordNet transform results to keep in memory, 0 disables")
+    parser.add_argument(
+        "--cache-dir",
+        help="directory for a persistent WordNet transform cache reused across runs")
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=64,
+        help="size in MB above which the persistent cache evicts old results")
 
     args = parser.parse_args()
     plugins = plugin_processor('pata_password_cracker.encryption', args.encryption)
-    process_input(args.yaml, args.words, plugins)
+    plugins.update(
+        plugin_processor('pata_password_cracker.substitutors', args.substitutors))
+    options = option_processor(args)
+    process_input(args.yaml, args.words, plugins, options)
 
 
-def plugin_processor(cat, plugins):
+def option_processor(args):
     """
-    Return a list of plugins
-    to use
+    Return a dict of the run
+    options to use
     """
-    plugins_to_use = {}
-    plugins_to_use[cat] = plugins.split(',')
-    return plugins_to_use
+    options = {}
+    options['stream'] = args.stream
+    options['target_hashes'] = args.target_hashes
+    options['schedule'] = args.schedule or (
+        'priority' if args.target_hashes else 'fixed')
+    options['output_format'] = args.output_format
+    options['output_dir'] = args.output_dir
+    options['workers'] = args.workers
+    options['mmap_words'] = args.mmap_words
+    options['cache_size'] = args.cache_size
+    options['cache_dir'] = args.cache_dir
+    options['cache_max_mb'] = args.cache_max_mb
+    options['max_variants'] = args.max_variants
+    options['rules'] = args.rules
+    options['combine_fields'] = args.combine_fields
+    options['combine_separators'] = args.combine_separators
+    options['combine_budget'] = args.combine_budget
+    options['bcrypt_salt'] = args.bcrypt_salt
+    options['bcrypt_rounds'] = args.bcrypt_rounds
+    options['bcrypt_workers'] = args.bcrypt_workers
+    options['progress'] = args.progress
+    options['pipeline'] = args.pipeline
+    options['hash_threads'] = args.hash_threads
+    options['queue_size'] = args.queue_size
+    options['dedup'] = args.dedup
+    options['dedup_error_rate'] = args.dedup_error_rate
+    options['dedup_capacity'] = args.dedup_capacity
+    options['stats'] = args.stats
+    options['stats_json'] = args.stats_json
+    return options
 
 
-def process_input(yaml_file, words_file, plugins):
+def process_input(yaml_file, words_file, plugins, options=None):
     """
     Create a new YAML parsing object
     and dump the content out as a dict
     """
     print ("Processing input YAML")
-    yaml_to_dict = ProcessInputYaml()
-    yaml_to_dict = yaml_to_dict.yaml_processor(yaml_file)
+    options = options or {}
+    if 'cache_size' in options:
+        transform_cache.resize(options['cache_size'])
+    if 'max_variants' in options:
+        MungSubstitutor.max_variants = options['max_variants']
+    RuleSubstitutor.rules_file = options.get('rules')
+    if options.get('output_dir'):
+        os.makedirs(options['output_dir'], exist_ok=True)
+    BcryptEncryption.salt = (
+        parse_salt(options['bcrypt_salt']) if options.get('bcrypt_salt') else None)
+    if 'bcrypt_rounds' in options:
+        BcryptEncryption.rounds = options['bcrypt_rounds']
+    if 'bcrypt_workers' in options:
+        BcryptEncryption.workers = options['bcrypt_workers']
+    if 'progress' in options:
+        BcryptEncryption.progress = options['progress']
+    Categories.scheduler = (
+        PriorityScheduler() if options.get('schedule') == 'priority' else None)
+    Categories.combinator = option_combinator(options)
+    if options.get('dedup', 'none') != 'none' and not stream_mode(options):
+        print ("Ignoring --dedup, it only applies with --stream or --target-hashes")
+    if options.get('target_hashes'):
+        load_targets(options['target_hashes'], plugins)
+    if options.get('cache_dir'):
+        transform_cache.store = PersistentTransformStore(
+            options['cache_dir'],
+            options.get('cache_max_mb', 64) * 1024 * 1024)
+    if options.get('stats') or options.get('stats_json'):
+        stats.reset()
+        stats.enabled = True
+
+    try:
+        generate_individuals(yaml_file, words_file, plugins, options)
+    finally:
+        transform_cache.close()
+        BcryptEncryption.close()
+    report_stats(options)
+
+
+def report_stats(options):
+    """
+    Print and or save the
+    stats of the run
+    """
+    if options.get('stats'):
+        print (stats.table())
+    if options.get('stats_json'):
+        stats.write_json(options['stats_json'])
+
+
+def load_targets(path, plugins):
+    """
+    Load the target hashes up front,
+    reporting and dropping any that cannot
+    be cracked with the selected encryption
+    """
+    targets = target_hashes(path)
+    print ("Loaded %d target hashes" % len(targets))
+    if targets.unknown:
+        print ("Skipped %d unrecognised target hashes" % targets.unknown)
+    encryption = plugins.get('pata_password_cracker.encryption', [])
+    missing = targets.missing(encryption)
+    if missing:
+        print ("Not cracking %s target hashes, add them to the encryption list"
+               % ",".join(missing))
+    return targets.select(encryption)
+
+
+def stream_mode(options):
+    """
+    Return True when candidates are
+    streamed rather than collected,
+    as they always are when cracking
+    """
+    return bool(options.get('stream') or options.get('target_hashes'))
+
+
+def generate_individuals(yaml_file, words_file, plugins, options):
+    """
+    Generate and write out the password
+    list of every individual in the input.
+    When cracking, stops once every target
+    hash is cracked
+    """
     words_to_list = ProcessInputWords()
-    words_to_list = words_to_list.words_processor(words_file)
+    if options.get('mmap_words'):
+        words_to_list = words_to_list.mapped_words_processor(
+            words_file, options.get('cache_dir'))
+    else:
+        words_to_list = words_to_list.words_processor(words_file)
+    individuals = individual_processor(yaml_file)
+    seen = None
+    if stream_mode(options) and options.get('dedup') == 'global':
+        seen = seen_filter(options)
+    targets = None
+    if options.get('target_hashes'):
+        targets = target_hashes(options['target_hashes'])
+
+    if options.get('workers', 1) > 1:
+        results = parallel_password_lists(
+            individuals, words_to_list, plugins, options)
+        for count, (x, passwords) in enumerate(results):
+            if seen is not None:
+                passwords = unique_records(passwords, seen)
+            output_password_list(passwords, options, x, count)
+            if targets is not None and targets.cracked():
+                break
+    else:
+        for count, x in enumerate(individuals):
+            generate_password_list(
+                x, words_to_list, plugins, options, seen, count)
+            if targets is not None and targets.cracked():
+                break
+
+    if targets is not None and targets.cracked():
+        print ("All target hashes cracked")
+
+
+def individual_processor(yaml_file):
+    """
+    Yield each individual from the input
+    file in turn. .jsonl and .ndjson files
+    are read as JSON Lines, anything else
+    as YAML
+    """
+    if yaml_file.endswith(('.jsonl', '.ndjson')):
+        individuals = ProcessInputJsonLines()
+    else:
+        individuals = ProcessInputYaml()
+    return individuals.individuals_processor(yaml_file)
+
+
+def generate_password_list(
+        individual, words_to_list, plugins, options=None, seen=None, count=0):
+    """
+    Kick off the password list generation.
+    In stream mode candidates are written
+    out as they are generated, optionally
+    dropping repeats using seen, and with
+    the pipeline option in concurrent
+    stages. count is
+    the individuals position in the run.
+    Given target hashes only the candidates
+    that crack one are written out
+    """
+    options = options or {}
+    categories = Categories(individual, words_to_list, plugins)
+
+    if options.get('target_hashes'):
+        passwords = categories.crack_categories(
+            target_hashes(options['target_hashes']),
+            individual_filter(options, seen))
+    elif options.get('stream') and options.get('pipeline'):
+        passwords = categories.staged_categories(
+            individual_filter(options, seen),
+            options.get('queue_size', 64),
+            options.get('hash_threads', 2))
+    elif options.get('stream'):
+        passwords = categories.stream_categories(
+            individual_filter(options, seen))
+    else:
+        passwords = categories.process_categories()
+    output_password_list(passwords, options, individual, count)
+
+
+def output_password_list(passwords, options=None, individual=None, count=0):
+    """
+    Write an individuals passwords out
+    using the selected mode, on an I/O
+    thread with the pipeline option.
+    Without an output directory every
+    individual after the first is
+    appended to the same file
+    """
+    options = options or {}
+    output = output_writer(options)
+    output.file_name = output_file_name(
+        output, options, individual or {}, count)
+    if count and not options.get('output_dir'):
+        output.mode = 'a'
 
-    for i in yaml_to_dict:
-        for x in i['individuals']:
-            generate_password_list(x, words_to_list, plugins)
+    if options.get('target_hashes'):
+        passwords = report_cracked(
+            passwords, target_hashes(options['target_hashes']))
+    if stream_mode(options) and options.get('pipeline'):
+        threaded_writer(
+            output.stream_processor, passwords, options.get('queue_size', 64))
+    elif stream_mode(options):
+        output.stream_processor(passwords)
+    else:
+        output.output_processor(passwords)
 
 
-def generate_password_list(individual, words_to_list, plugins):
+def report_cracked(records, targets):
     """
-    Kick off the password list generation
+    Print each cracked hash as it is
+    found, passing the records through.
+    Hashes cracked in worker processes
+    are marked cracked in targets here,
+    and a hash already reported, such as
+    one cracked by two workers, is dropped
     """
-    individuals_passwords = Categories(
-        individual, words_to_list, plugins).process_categories()
-    dict_to_yaml = ProcessOutputYaml()
-    dict_to_yaml.output_processor(individuals_passwords)
+    for indv_key, candidate in records:
+        cracked = targets.report(candidate.encrypted)
+        if not cracked:
+            continue
+        for algorithm, digest in cracked.items():
+            print ("Cracked %s %s:%s" % (
+                algorithm, digest_text(digest), candidate.clear_text), flush=True)
+        yield indv_key, candidate._replace(encrypted=cracked)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,305 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from .stats import stats
+
+
+class TransformCache():
+    """
+    Bounded LRU cache of patalib transform
+    results, keyed on the transform, the
+    input value and a fingerprint of the
+    word list the transform depends on
+    """
+
+    def __init__(self, maxsize=4096):
+        """
+        Create an empty cache holding
+        at most maxsize results
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.store_hits = 0
+        self.results = OrderedDict()
+        self.lock = threading.Lock()
+        self.store = None
+
+    def get(self, transform, value, fingerprint, generate):
+        """
+        Return the cached results for a
+        transform. On a miss the persistent
+        store, if any, is checked before
+        calling generate to compute them.
+        Hits and misses are also counted
+        in the run stats when enabled
+        """
+        key = (transform, value, fingerprint)
+
+        with self.lock:
+            hit = key in self.results
+            if hit:
+                self.results.move_to_end(key)
+                self.hits += 1
+                results = self.results[key]
+            else:
+                self.misses += 1
+        if stats.enabled:
+            stats.count('cache.hits' if hit else 'cache.misses')
+        if hit:
+            return results
+
+        results = None
+        if self.store is not None:
+            results = self.store.get(transform, value, fingerprint)
+
+        if results is not None:
+            self.store_hits += 1
+            if stats.enabled:
+                stats.count('cache.store_hits')
+        else:
+            results = tuple(generate())
+            if self.store is not None:
+                self.store.put(transform, value, fingerprint, results)
+
+        if self.maxsize > 0:
+            with self.lock:
+                self.results[key] = results
+                while len(self.results) > self.maxsize:
+                    self.results.popitem(last=False)
+        return results
+
+    def resize(self, maxsize):
+        """
+        Change the maximum number of
+        results held, 0 disables caching
+        """
+        with self.lock:
+            self.maxsize = maxsize
+            while len(self.results) > max(maxsize, 0):
+                self.results.popitem(last=False)
+
+    def clear(self):
+        """
+        Drop all results and
+        reset the counters
+        """
+        with self.lock:
+            self.results.clear()
+            self.hits = 0
+            self.misses = 0
+            self.store_hits = 0
+
+    def close(self):
+        """
+        Close the persistent store, if any
+        """
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def stats(self):
+        """
+        Return the hit/miss counters
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'store_hits': self.store_hits,
+            'size': len(self.results),
+            'maxsize': self.maxsize}
+
+
+class PersistentTransformStore():
+    """
+    sqlite backed store of transform
+    results that is reused across runs.
+    Results are keyed on the transform,
+    value, word list fingerprint and
+    patalib version. Once the stored
+    results exceed max_bytes the least
+    recently used are evicted
+    """
+    file_name = 'transforms.sqlite'
+    evict_every = 256
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024):
+        """
+        Open, or create, the store
+        under the given directory
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, self.file_name)
+        self.max_bytes = max_bytes
+        self.version = patalib_version()
+        self.puts = 0
+        self.pid = None
+        self.connection = None
+        self.lock = threading.Lock()
+        self.connect()
+        self.evict()
+
+    def connect(self):
+        """
+        Open a connection for this process.
+        Forked workers reconnect rather than
+        share their parents connection
+        """
+        self.pid = os.getpid()
+        self.connection = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS transforms ('
+            'transform TEXT, value TEXT, fingerprint TEXT, version TEXT, '
+            'results TEXT, size INTEGER, accessed REAL, '
+            'PRIMARY KEY (transform, value, fingerprint, version))')
+        self.connection.execute(
+            'CREATE INDEX IF NOT EXISTS transforms_accessed '
+            'ON transforms (accessed)')
+        self.connection.commit()
+
+    def cursor(self):
+        """
+        Return a connection usable
+        from the current process
+        """
+        if self.pid != os.getpid():
+            self.connect()
+        return self.connection
+
+    def get(self, transform, value, fingerprint):
+        """
+        Return the stored results
+        or None when not stored
+        """
+        key = (transform, value, fingerprint or '', self.version)
+
+        with self.lock:
+            connection = self.cursor()
+            row = connection.execute(
+                'SELECT results FROM transforms WHERE transform = ? '
+                'AND value = ? AND fingerprint = ? AND version = ?',
+                key).fetchone()
+            if row is None:
+                return None
+
+            connection.execute(
+                'UPDATE transforms SET accessed = ? WHERE transform = ? '
+                'AND value = ? AND fingerprint = ? AND version = ?',
+                (time.time(),) + key)
+            connection.commit()
+        return tuple(json.loads(row[0]))
+
+    def put(self, transform, value, fingerprint, results):
+        """
+        Store the results of a transform
+        """
+        encoded = json.dumps(list(results))
+
+        with self.lock:
+            connection = self.cursor()
+            connection.execute(
+                'INSERT OR REPLACE INTO transforms VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (transform, value, fingerprint or '', self.version,
+                 encoded, len(encoded), time.time()))
+            connection.commit()
+            self.puts += 1
+
+        if self.puts % self.evict_every == 0:
+            self.evict()
+
+    def size(self):
+        """
+        Return the total size in bytes
+        of the stored results
+        """
+        with self.lock:
+            row = self.cursor().execute(
+                'SELECT COALESCE(SUM(size), 0) FROM transforms').fetchone()
+        return row[0]
+
+    def evict(self):
+        """
+        Drop the least recently used results
+        until the store fits in max_bytes
+        """
+        excess = self.size() - self.max_bytes
+        if excess <= 0:
+            return
+
+        with self.lock:
+            connection = self.cursor()
+            rows = connection.execute(
+                'SELECT rowid, size FROM transforms ORDER BY accessed')
+            evicted = []
+            for rowid, size in rows:
+                if excess <= 0:
+                    break
+                evicted.append((rowid,))
+                excess -= size
+
+            connection.executemany(
+                'DELETE FROM transforms WHERE rowid = ?', evicted)
+            connection.commit()
+
+    def close(self):
+        """
+        Evict down to size and
+        close the connection
+        """
+        self.evict()
+        with self.lock:
+            self.connection.close()
+
+
+def patalib_version():
+    """
+    Return the installed patalib version,
+    stored results are not reused once
+    patalib is upgraded
+    """
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        from pkg_resources import get_distribution as version
+        from pkg_resources import DistributionNotFound as PackageNotFoundError
+
+    try:
+        distribution_version = version('patalib')
+    except PackageNotFoundError:
+        return 'unknown'
+    return getattr(distribution_version, 'version', distribution_version)
+
+
+transform_cache = TransformCache()
+
+last_fingerprint = (None, None)
+
+
+def words_fingerprint(words):
+    """
+    Return a digest identifying the
+    contents of a word list. The last
+    list seen is remembered so a run
+    only fingerprints its list once
+    """
+    global last_fingerprint
+    if last_fingerprint[0] is words:
+        return last_fingerprint[1]
+
+    fingerprint = getattr(words, 'fingerprint', None)
+    if fingerprint is None:
+        digest = hashlib.sha1()
+        for word in words:
+            digest.update(word.encode('utf-8'))
+            digest.update(b'\n')
+        fingerprint = digest.hexdigest()
+
+    last_fingerprint = (words, fingerprint)
+    return fingerprint
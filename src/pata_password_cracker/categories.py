@@ -1,4 +1,10 @@
-import pkg_resources
+from concurrent.futures import ThreadPoolExecutor
+from .plugins import iter_entry_points
+from .pipeline import encrypt_candidates, crack_candidates, unique_candidates
+from .pipeline import hash_clear_text
+from .scheduler import Work
+from .stages import threaded, ordered_map, candidate_batches
+from .stats import timed, timed_iter
 
 
 class Categories:
@@ -17,6 +23,8 @@ class Categories:
     loaded_substitutors_plugin_dict = {}
     words = []
     inc_plugins = {}
+    scheduler = None
+    combinator = None
 
     def __init__(self, bio_data, words, inc_plugins):
         """
@@ -28,10 +36,13 @@ class Categories:
         self.loaded_cat_plugin_dict = self.load_plugins(
             self.category_plugin)
         self.loaded_encryption_plugin_dict = self.load_plugins(
-            self.encryption_plugin)
+            self.encryption_plugin,
+            self.inc_plugins.get(self.encryption_plugin))
         self.loaded_substitutors_plugin_dict = self.load_plugins(
-            self.substitutors_plugin)
+            self.substitutors_plugin,
+            self.inc_plugins.get(self.substitutors_plugin))
         self.exclude_encrypt()
+        self.exclude_substitutors()
 
     def exclude_encrypt(self):
         """
@@ -48,16 +59,37 @@ class Categories:
             del self.loaded_encryption_plugin_dict[r]
 
 
-    def load_plugins(self, plugin):
+    def exclude_substitutors(self):
         """
-        Load the plugin and store object in array
+        Exclude any substitutors
+        not required when the user
+        has chosen which to use
+        """
+        if self.substitutors_plugin not in self.inc_plugins:
+            return
+
+        remove_list = []
+        for p in self.loaded_substitutors_plugin_dict:
+            if p not in self.inc_plugins[self.substitutors_plugin]:
+                remove_list.append(p)
+
+        for r in remove_list:
+            del self.loaded_substitutors_plugin_dict[r]
+
+    @timed('plugins', len)
+    def load_plugins(self, plugin, names=None):
+        """
+        Load the plugin and store object in array.
+        Given names, only those plugins are imported
         """
         plugin_dict = {}
 
-        for p in pkg_resources.iter_entry_points(plugin):
+        for p in iter_entry_points(plugin):
+            if names is None or p.name in names:
                 plugin_dict[p.name] = p.load()
         return plugin_dict
 
+    @timed('generate')
     def process_categories(self):
         """
         Process an individuals categories data
@@ -84,6 +116,164 @@ class Categories:
                                     v,
                                     self.loaded_encryption_plugin_dict,
                                     self.loaded_substitutors_plugin_dict)})
+            if self.combinator is not None:
+                target_vals.append({'combined': self.combined(target)})
             individual[indv_key] = target_vals
 
         return individual
+
+    def stream_categories(self, seen=None):
+        """
+        Lazily process an individuals
+        categories data, yielding
+        (key, candidate) pairs as each
+        candidate is hashed. Given a seen
+        filter, repeated clear text is
+        dropped before hashing
+        """
+        for indv_key, candidates in self.stream_targets(seen):
+            candidates = encrypt_candidates(
+                candidates,
+                self.loaded_encryption_plugin_dict)
+            for candidate in candidates:
+                yield indv_key, candidate
+
+    def staged_categories(self, seen=None, queue_size=64, hash_threads=2):
+        """
+        As stream_categories, but candidates
+        are generated in their own thread and
+        hashed in batches on a pool of threads,
+        the stages joined by bounded queues so
+        the slowest stage sets the pace.
+        Encryption process pools are started
+        now, before any stage thread
+        """
+        for encryption in self.loaded_encryption_plugin_dict.values():
+            if hasattr(encryption, 'start'):
+                encryption.start()
+        return self.staged_records(seen, queue_size, hash_threads)
+
+    def staged_records(self, seen, queue_size, hash_threads):
+        """
+        Lazily yield the (key, candidate)
+        records of staged_categories
+        """
+        batches = threaded(
+            candidate_batches(self.stream_targets(seen)), queue_size)
+        with ThreadPoolExecutor(max_workers=hash_threads) as executor:
+            for indv_key, candidates in ordered_map(
+                    self.encrypt_batch, batches, executor, queue_size):
+                for candidate in candidates:
+                    yield indv_key, candidate
+
+    def encrypt_batch(self, batch):
+        """
+        Hash a (key, candidates)
+        batch of candidates
+        """
+        indv_key, candidates = batch
+        return indv_key, list(encrypt_candidates(
+            candidates, self.loaded_encryption_plugin_dict))
+
+    def crack_categories(self, targets, seen=None):
+        """
+        Lazily check an individuals candidates
+        against target hashes, yielding
+        (key, candidate) pairs only for
+        candidates that crack a target.
+        Generation stops as soon as the
+        targets are done
+        """
+        for indv_key, candidates in self.stream_targets(seen):
+            if targets.done():
+                return
+            candidates = crack_candidates(
+                candidates,
+                targets,
+                self.loaded_encryption_plugin_dict)
+            for candidate in candidates:
+                if self.scheduler is not None:
+                    self.scheduler.hit(candidate.transform)
+                yield indv_key, candidate
+
+    def stream_targets(self, seen=None):
+        """
+        Yield each targets key and its
+        lazy stream of unhashed candidates,
+        in scheduler priority order when
+        a scheduler is set
+        """
+        count = 0
+        for target in self.bio_data:
+            indv_key = str(count) + ":" + target
+            indv_key = indv_key.replace(" ", "")
+            count = count + 1
+
+            if self.scheduler is not None:
+                candidates = self.scheduler.schedule(self.target_work(target))
+            else:
+                candidates = self.stream_target(target)
+            if seen is not None:
+                candidates = unique_candidates(candidates, seen)
+            yield indv_key, candidates
+
+    @timed_iter('generate')
+    def stream_target(self, target):
+        """
+        Lazily generate unhashed candidates
+        for each of a targets categories,
+        then their combined field values
+        """
+        for category in self.bio_data[target]:
+            for k, v in category.items():
+                if k in self.loaded_cat_plugin_dict:
+                    for candidate in self.loaded_cat_plugin_dict[k]().stream_data(
+                            k,
+                            self.words,
+                            v,
+                            self.loaded_substitutors_plugin_dict):
+                        yield candidate
+        if self.combinator is not None:
+            for candidate in self.combinator.combine(self.bio_data[target]):
+                yield candidate
+
+    def combined(self, target):
+        """
+        Return the combined field values
+        of a target and their hashes
+        """
+        clear_text = [
+            c.clear_text for c in self.combinator.combine(self.bio_data[target])]
+        encrypted = {}
+        for e in self.loaded_encryption_plugin_dict:
+            encrypted[e] = hash_clear_text(
+                self.loaded_encryption_plugin_dict[e](), clear_text)
+
+        return {'clear_text': clear_text, 'encrypted': encrypted}
+
+    def target_work(self, target):
+        """
+        Yield the lazy units of work of all
+        a targets categories. Plugins without
+        stream_work are run as a single unit,
+        as are the combined field values
+        """
+        for category in self.bio_data[target]:
+            for k, v in category.items():
+                if k in self.loaded_cat_plugin_dict:
+                    plugin = self.loaded_cat_plugin_dict[k]()
+                    if hasattr(plugin, 'stream_work'):
+                        for work in plugin.stream_work(
+                                k,
+                                self.words,
+                                v,
+                                self.loaded_substitutors_plugin_dict):
+                            yield work
+                    else:
+                        yield Work(None, plugin.stream_data(
+                            k,
+                            self.words,
+                            v,
+                            self.loaded_substitutors_plugin_dict))
+        if self.combinator is not None:
+            yield Work('combined', self.combinator.combine(self.bio_data[target]))
@@ -0,0 +1,150 @@
+import heapq
+from itertools import islice, permutations
+from .pipeline import Candidate
+from .generators.dates import parse_date
+from .stats import timed_iter
+
+
+def ordered_product(parts, separator):
+    """
+    Lazily yield every join of one part from
+    each list of parts, shortest first. Each
+    list must be sorted by length. Joins are
+    found best first from a heap of the next
+    candidates, each reached from a single
+    parent by moving on one of its parts at
+    or after its last moved part, so the heap
+    only grows with the joins yielded so far
+    """
+    if not parts or not all(parts):
+        return
+    first = (0,) * len(parts)
+    heap = [(sum(len(p[0]) for p in parts), first)]
+    while heap:
+        length, indexes = heapq.heappop(heap)
+        yield separator.join(p[i] for p, i in zip(parts, indexes))
+        last = max([j for j, i in enumerate(indexes) if i] or [0])
+        for j in range(last, len(parts)):
+            i = indexes[j]
+            if i + 1 < len(parts[j]):
+                heapq.heappush(heap, (
+                    length - len(parts[j][i]) + len(parts[j][i + 1]),
+                    indexes[:j] + (i + 1,) + indexes[j + 1:]))
+
+
+def combined_candidates(field, clear_texts):
+    """
+    Lazily wrap combined clear
+    text as candidates
+    """
+    for clear_text in clear_texts:
+        yield Candidate('combined', field, 'combined', clear_text, None)
+
+
+class Combinator():
+    """
+    Joins the values of pairs, or up to size,
+    of an individuals fields, such as a pet
+    name and birth year. Every ordering of
+    fields and every separator is merged into
+    one lazy stream, shortest first, and the
+    stream stops after budget candidates
+    """
+
+    def __init__(self, size=2, separators=('',), budget=10000):
+        """
+        Combine up to size fields using
+        each separator, yielding at most
+        budget candidates per individual
+        """
+        self.size = size
+        self.separators = separators
+        self.budget = budget
+
+    def fields(self, categories):
+        """
+        Return a dict of field name to its
+        parts sorted by length. Family members
+        prefix their fields, date values give
+        their year, and spaces are removed
+        """
+        fields = {}
+        for category in categories:
+            for k, v in category.items():
+                self.add_fields(fields, '', v)
+        return {
+            field: sorted(dict.fromkeys(parts), key=len)
+            for field, parts in fields.items() if parts}
+
+    def add_fields(self, fields, prefix, values):
+        """
+        Add the parts of each field of a
+        category, descending into the
+        members of a family
+        """
+        if isinstance(values, list):
+            for value in values:
+                if isinstance(value, dict):
+                    self.add_fields(fields, prefix, value)
+            return
+
+        for k, v in values.items():
+            if isinstance(v, dict):
+                self.add_fields(fields, prefix + k + '.', v)
+            else:
+                fields.setdefault(prefix + k, []).extend(
+                    part for value in (v if isinstance(v, list) else [v])
+                    for part in self.parts(value))
+
+    def parts(self, value):
+        """
+        Return the parts a value
+        contributes to a combination
+        """
+        day = parse_date(value)
+        if day is not None:
+            return ['%04d' % day.year, '%02d' % (day.year % 100)]
+        value = str(value).replace(' ', '')
+        return [value] if value else []
+
+    def streams(self, fields):
+        """
+        Yield a lazy stream of candidates, shortest
+        first, for each ordering of fields and
+        each separator
+        """
+        names = sorted(fields)
+        for count in range(2, self.size + 1):
+            for chosen in permutations(names, count):
+                parts = [fields[name] for name in chosen]
+                field = '+'.join(chosen)
+                for separator in self.separators:
+                    yield combined_candidates(
+                        field, ordered_product(parts, separator))
+
+    @timed_iter('combine')
+    def combine(self, categories):
+        """
+        Lazily yield up to budget combined
+        candidates of an individuals
+        categories, shortest first
+        """
+        merged = heapq.merge(
+            *self.streams(self.fields(categories)),
+            key=lambda candidate: len(candidate.clear_text))
+        return islice(merged, self.budget)
+
+
+def option_combinator(options):
+    """
+    Return the Combinator for the
+    run options, or None when fields
+    are not combined
+    """
+    size = options.get('combine_fields') or 0
+    if size < 2:
+        return None
+    return Combinator(
+        size,
+        options.get('combine_separators', '').split(','),
+        options.get('combine_budget', 10000))
@@ -0,0 +1,126 @@
+import hashlib
+import math
+
+
+class SeenSet():
+    """
+    Set of candidates already seen. Only
+    the 64 bit hash of each clear text is
+    kept rather than the string itself
+    """
+
+    def __init__(self):
+        """
+        Create an empty set
+        """
+        self.hashes = set()
+
+    def add(self, value):
+        """
+        Mark value as seen, returning
+        True if it had not been seen
+        """
+        value_hash = hash(value)
+        if value_hash in self.hashes:
+            return False
+        self.hashes.add(value_hash)
+        return True
+
+    def __contains__(self, value):
+        return hash(value) in self.hashes
+
+    def __len__(self):
+        return len(self.hashes)
+
+
+class BloomFilter():
+    """
+    Fixed size Bloom filter of candidates
+    already seen. Memory does not grow with
+    the number of candidates, at the cost of
+    dropping roughly error_rate of unique
+    candidates once capacity are held
+    """
+
+    def __init__(self, capacity=1000000, error_rate=0.001):
+        """
+        Size the filter for capacity
+        candidates at the given
+        false positive rate
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(1, int(math.ceil(
+            -capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.hash_count = max(1, int(round(
+            self.size / capacity * math.log(2))))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def positions(self, value):
+        """
+        Return the bit positions for a value
+        using double hashing of one digest
+        """
+        digest = hashlib.blake2b(
+            value.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        return [
+            (first + i * second) % self.size
+            for i in range(self.hash_count)]
+
+    def add(self, value):
+        """
+        Mark value as seen, returning
+        True if it had not been seen
+        """
+        added = False
+        for position in self.positions(value):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                self.bits[byte] |= 1 << bit
+                added = True
+
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, value):
+        for position in self.positions(value):
+            byte, bit = divmod(position, 8)
+            if not self.bits[byte] & (1 << bit):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+
+def seen_filter(options):
+    """
+    Return an empty filter for the dedup
+    options, a Bloom filter when a false
+    positive rate is given and an exact
+    set otherwise
+    """
+    error_rate = options.get('dedup_error_rate') or 0
+    if error_rate > 0:
+        return BloomFilter(
+            options.get('dedup_capacity', 1000000), error_rate)
+    return SeenSet()
+
+
+def individual_filter(options, shared=None):
+    """
+    Return the filter to dedup one individual
+    with, the shared filter for global dedup,
+    a new one for per individual dedup, or
+    None when dedup is off
+    """
+    dedup = options.get('dedup', 'none')
+    if dedup == 'global' and shared is not None:
+        return shared
+    if dedup in ('individual', 'global'):
+        return seen_filter(options)
+    return None
@@ -1,11 +1,143 @@
+import re
+import sys
+import threading
 import bcrypt
+from concurrent.futures import ProcessPoolExecutor
+
+
+salt_format = re.compile(r'^\$2[abxy]\$(\d\d)\$[./A-Za-z0-9]{22}')
+
+pool = None
+pool_lock = threading.Lock()
 
 
 class BcryptEncryption():
+    """
+    bcrypt encryption. Given a target salt,
+    or a captured hash to take it from, every
+    password is hashed with that salt so the
+    output can be compared with the capture.
+    Batches can be hashed across a pool of
+    processes
+    """
+    salt = None
+    rounds = 12
+    workers = 1
+    chunk_size = 8
+    progress = False
+    hashed = 0
+
+    def __init__(self, salt=None):
+        """
+        Optionally hash with a salt
+        other than the configured one
+        """
+        if salt is not None:
+            self.salt = salt
 
     def hash(self, pwd):
         """
         Return a bcrypt hash value
         """
-        hash_val = bcrypt.hashpw(pwd.encode('utf-8'), bcrypt.gensalt())
+        hash_val = bcrypt.hashpw(pwd.encode('utf-8'), self.gen_salt())
         return hash_val
+
+    def gen_salt(self):
+        """
+        Return the target salt, or a new
+        random salt at the configured cost
+        """
+        if self.salt:
+            return parse_salt(self.salt)
+        return bcrypt.gensalt(self.rounds)
+
+    def hash_many(self, pwds):
+        """
+        Return the hash of each password
+        in order. With workers the batch is
+        hashed in chunks across a process pool
+        """
+        pairs = [(pwd, self.gen_salt()) for pwd in pwds]
+        if self.workers < 2 or len(pairs) < 2:
+            return self.count(hash_chunk(pairs))
+
+        chunks = [
+            pairs[i:i + self.chunk_size]
+            for i in range(0, len(pairs), self.chunk_size)]
+        hashed = []
+
+        for chunk in get_pool(self.workers).map(hash_chunk, chunks):
+            hashed.extend(self.count(chunk))
+        return hashed
+
+    def count(self, hashed):
+        """
+        Add to the running count of hashed
+        passwords, reporting it if asked
+        """
+        BcryptEncryption.hashed += len(hashed)
+        if self.progress:
+            sys.stderr.write('\rbcrypt: %d hashed' % BcryptEncryption.hashed)
+            sys.stderr.flush()
+        return hashed
+
+    @classmethod
+    def start(cls):
+        """
+        Start the process pool, if one is
+        used, while the process has a single
+        thread, as forking from a threaded
+        process is unsafe. The pool only forks
+        its workers once given a task
+        """
+        if cls.workers > 1:
+            get_pool(cls.workers).submit(int).result()
+
+    @classmethod
+    def close(cls):
+        """
+        Shut down the process pool, if any
+        """
+        global pool
+        if pool is not None:
+            pool.shutdown()
+            pool = None
+        if cls.progress and cls.hashed:
+            sys.stderr.write('\n')
+
+
+def parse_salt(salt):
+    """
+    Return the bcrypt salt from a salt
+    or full hash such as $2b$12$...
+    """
+    if isinstance(salt, bytes):
+        salt = salt.decode('ascii')
+
+    match = salt_format.match(salt)
+    if match is None or not 4 <= int(match.group(1)) <= 31:
+        raise ValueError('Invalid bcrypt salt: ' + salt)
+    return match.group(0).encode('ascii')
+
+
+def hash_chunk(pairs):
+    """
+    Hash a chunk of (password, salt) pairs
+    """
+    return [bcrypt.hashpw(pwd.encode('utf-8'), salt) for pwd, salt in pairs]
+
+
+def get_pool(workers):
+    """
+    Return the process pool, started on
+    first use and kept for the run. Hashing
+    threads may ask for it at once
+    """
+    from ...parallel import pool_context
+
+    global pool
+    with pool_lock:
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=pool_context())
+    return pool
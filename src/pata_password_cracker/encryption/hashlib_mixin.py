@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+
+class HashlibMixin(object):
+    """
+    Mixin giving hashlib based encryption
+    plugins a bulk hash_many API.
+    """
+    hash_function = None
+    chunk_size = 4096
+
+    def hash_many(self, pwds, workers=None):
+        """
+        Return the hash of each password
+        in order. With workers the batch is
+        split into chunks and hashed on a
+        thread pool. hashlib only releases
+        the GIL for large inputs so this
+        pays off for long values only
+        """
+        if not workers or workers < 2:
+            return self.hash_chunk(pwds)
+
+        pwds = list(pwds)
+        chunks = [
+            pwds[i:i + self.chunk_size]
+            for i in range(0, len(pwds), self.chunk_size)]
+        hashed = []
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for chunk in executor.map(self.hash_chunk, chunks):
+                hashed.extend(chunk)
+        return hashed
+
+    def hash_chunk(self, pwds):
+        """
+        Hash a chunk of passwords by copying
+        one pre-initialised hash object
+        rather than building a new one
+        """
+        template = self.hash_function()
+        hashed = []
+
+        for pwd in pwds:
+            hash_val = template.copy()
+            hash_val.update(pwd.encode('utf-8'))
+            hashed.append(hash_val.hexdigest())
+        return hashed
@@ -1,7 +1,10 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class MD5Encryption():
+class MD5Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.md5)
+
     def hash(self, pwd):
         """
         Return a md5 hash value
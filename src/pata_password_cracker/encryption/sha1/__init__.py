@@ -1,7 +1,9 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class SHA1Encryption():
+class SHA1Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.sha1)
 
     def hash(self, pwd):
         """
@@ -1,7 +1,10 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class SHA224Encryption():
+class SHA224Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.sha224)
+
     def hash(self, pwd):
         """
         Return a sha224 hash value
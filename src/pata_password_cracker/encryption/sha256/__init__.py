@@ -1,7 +1,9 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class SHA256Encryption():
+class SHA256Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.sha256)
 
     def hash(self, pwd):
         """
@@ -1,7 +1,10 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class SHA384Encryption():
+class SHA384Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.sha384)
+
     def hash(self, pwd):
         """
         Return a sha384 hash value
@@ -1,7 +1,9 @@
 import hashlib
+from ..hashlib_mixin import HashlibMixin
 
 
-class SHA512Encryption():
+class SHA512Encryption(HashlibMixin):
+    hash_function = staticmethod(hashlib.sha512)
 
     def hash(self, pwd):
         """
@@ -36,3 +36,55 @@ class CoreBioGenerator(DateNameMixin):
             encryption_dict,
             substitutors_dict).process_individual())
         return bio_passwords
+
+    def stream_data(
+            self,
+            k,
+            words,
+            core_bio_data,
+            substitutors_dict):
+        """
+        Lazily process the core bio data,
+        yielding unhashed candidates
+        """
+        self.cat = k
+        self.words = words
+        self.encryption_dict = {}
+        self.substitutors_dict = substitutors_dict
+
+        for candidate in self.stream_name_dob(core_bio_data):
+            yield candidate
+
+        for candidate in PasswordGenerator(
+                k,
+                words,
+                core_bio_data,
+                {},
+                substitutors_dict).stream_individual():
+            yield candidate
+
+    def stream_work(
+            self,
+            k,
+            words,
+            core_bio_data,
+            substitutors_dict):
+        """
+        Yield the lazy units of work for
+        the core bio data, for scheduling
+        """
+        self.cat = k
+        self.words = words
+        self.encryption_dict = {}
+        self.substitutors_dict = substitutors_dict
+
+        for work in self.stream_name_dob_work(core_bio_data):
+            yield work
+
+        for work in PasswordGenerator(
+                k,
+                words,
+                core_bio_data,
+                {},
+                substitutors_dict).stream_work():
+            yield work
@@ -1,4 +1,5 @@
 from .gen_password import PasswordGenerator
+from .dates import parse_date
 
 class DateNameMixin(object):
     """
@@ -17,25 +18,58 @@ class DateNameMixin(object):
         dob      
 
         """
-        name_dob_combo = {}
-
-        if values.get('first_name') and values.get('dob'):
-            name_dob_combo['first_name_dob'] = self.date_and_name_processor(
-                values['first_name'], values['dob'])
-
-        if values.get('last_name') and values.get('dob'):
-            name_dob_combo['last_name_dob'] = self.date_and_name_processor(
-                values['last_name'], values['dob'])
-
         name_dob_combo = PasswordGenerator(
             self.cat,
             self.words,
-            name_dob_combo,
+            self.name_dob_combo(values),
             self.encryption_dict,
             self.substitutors_dict).process_individual()
 
         return name_dob_combo
 
+    def stream_name_dob(self, values):
+        """
+        Lazily generate unhashed name/dob
+        candidates, see name_dob
+        """
+        return PasswordGenerator(
+            self.cat,
+            self.words,
+            self.name_dob_combo(values),
+            {},
+            self.substitutors_dict).stream_individual()
+
+    def stream_name_dob_work(self, values):
+        """
+        Yield the lazy units of work
+        for the name/dob candidates
+        """
+        return PasswordGenerator(
+            self.cat,
+            self.words,
+            self.name_dob_combo(values),
+            {},
+            self.substitutors_dict).stream_work()
+
+    def name_dob_combo(self, values):
+        """
+        Build the name/dob clear text
+        values for an individual. dob may
+        be a date or a date-like string
+        """
+        name_dob_combo = {}
+        dob = parse_date(values.get('dob'))
+
+        if values.get('first_name') and dob:
+            name_dob_combo['first_name_dob'] = self.date_and_name_processor(
+                values['first_name'], dob)
+
+        if values.get('last_name') and dob:
+            name_dob_combo['last_name_dob'] = self.date_and_name_processor(
+                values['last_name'], dob)
+
+        return name_dob_combo
+
     def date_and_name_processor(self, name, dob):
         """
         Date and Name processor
@@ -0,0 +1,111 @@
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import chain, product
+
+
+separators = ('', '-', '/', '.', '_')
+
+# Orders of the parts of a date, including
+# reversed and partial dates. d and m are
+# not zero padded
+orders = (
+    ('dd', 'mm', 'yyyy'), ('dd', 'mm', 'yy'),
+    ('d', 'm', 'yyyy'), ('d', 'm', 'yy'),
+    ('mm', 'dd', 'yyyy'), ('mm', 'dd', 'yy'),
+    ('m', 'd', 'yyyy'), ('m', 'd', 'yy'),
+    ('yyyy', 'mm', 'dd'), ('yy', 'mm', 'dd'),
+    ('yyyy', 'dd', 'mm'), ('yy', 'dd', 'mm'),
+    ('dd', 'mm'), ('mm', 'dd'),
+    ('mm', 'yyyy'), ('mm', 'yy'),
+    ('yyyy',), ('yy',))
+
+
+def build_formats():
+    """
+    Return the format string of every
+    order with every separator, built
+    once when the module is loaded
+    """
+    formats = []
+    for parts in orders:
+        for separator in separators if len(parts) > 1 else ('',):
+            formats.append(separator.join('%(' + p + ')s' for p in parts))
+    return tuple(dict.fromkeys(formats))
+
+
+date_formats = build_formats()
+
+input_formats = (
+    '%Y-%m-%d', '%Y/%m/%d', '%Y.%m.%d', '%Y%m%d',
+    '%d/%m/%Y', '%d-%m-%Y', '%d.%m.%Y', '%m/%d/%Y')
+date_like = re.compile(r'^(\d{8}|\d{1,4}[./-]\d{1,2}[./-]\d{1,4})$')
+
+# Years of plausible dates, numbers such as
+# PINs and postcodes otherwise parse as dates
+min_year = 1900
+max_year = 2099
+
+
+def parse_date(value):
+    """
+    Return value as a date, accepting
+    dates, datetimes and strings in the
+    input_formats, or None when it is
+    not date-like. Undelimited dates must
+    have 8 digits, and string dates a
+    year from min_year to max_year
+    """
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if not date_like.match(value):
+        return None
+    for input_format in input_formats:
+        try:
+            day = datetime.strptime(value, input_format).date()
+        except ValueError:
+            continue
+        if min_year <= day.year <= max_year:
+            return day
+    return None
+
+
+@lru_cache(maxsize=1024)
+def date_patterns(day):
+    """
+    Return every distinct formatting of
+    a date. Each date is formatted once
+    and the result reused
+    """
+    parts = {
+        'd': str(day.day),
+        'dd': '%02d' % day.day,
+        'm': str(day.month),
+        'mm': '%02d' % day.month,
+        'yy': '%02d' % (day.year % 100),
+        'yyyy': '%04d' % day.year}
+    return tuple(dict.fromkeys(f % parts for f in date_formats))
+
+
+def name_date_product(names, patterns):
+    """
+    Lazily yield each name followed
+    and preceded by each date pattern
+    """
+    for name, pattern in product(names, patterns):
+        yield name + pattern
+        yield pattern + name
+
+
+def date_candidates(day, names=()):
+    """
+    Lazily yield the patterns of a date
+    then their combinations with names
+    """
+    patterns = date_patterns(day)
+    return chain(patterns, name_date_product(names, patterns))
@@ -1,5 +1,7 @@
+from itertools import chain
 from ..gen_password import PasswordGenerator
 from ..date_name_mixin import DateNameMixin
+from ...scheduler import Work
 
 class FamilyGenerator(DateNameMixin):
     """
@@ -56,3 +58,70 @@ class FamilyGenerator(DateNameMixin):
 
         return individual
 
+    def stream_data(
+            self,
+            k,
+            words,
+            family_bio_data,
+            substitutors_dict):
+        """
+        Lazily process the family bio data,
+        yielding unhashed candidates. Fields
+        are prefixed with the family member
+        """
+        self.family_data = family_bio_data
+        self.cat = k
+        self.words = words
+        self.encryption_dict = {}
+        self.substitutors_dict = substitutors_dict
+
+        for ind in self.family_data:
+            for bio, values in ind.items():
+                for candidate in chain(
+                        self.stream_name_dob(values),
+                        PasswordGenerator(
+                            self.cat,
+                            self.words,
+                            values,
+                            {},
+                            self.substitutors_dict).stream_individual()):
+                    yield candidate._replace(
+                        field=bio + '.' + candidate.field)
+
+    def stream_work(
+            self,
+            k,
+            words,
+            family_bio_data,
+            substitutors_dict):
+        """
+        Yield the lazy units of work for
+        the family bio data, for scheduling
+        """
+        self.family_data = family_bio_data
+        self.cat = k
+        self.words = words
+        self.encryption_dict = {}
+        self.substitutors_dict = substitutors_dict
+
+        for ind in self.family_data:
+            for bio, values in ind.items():
+                for work in chain(
+                        self.stream_name_dob_work(values),
+                        PasswordGenerator(
+                            self.cat,
+                            self.words,
+                            values,
+                            {},
+                            self.substitutors_dict).stream_work()):
+                    yield Work(
+                        work.transform,
+                        self.prefix_field(bio, work.candidates))
+
+    def prefix_field(self, bio, candidates):
+        """
+        Prefix candidate fields
+        with the family member
+        """
+        for candidate in candidates:
+            yield candidate._replace(field=bio + '.' + candidate.field)
@@ -28,3 +28,37 @@ class FreeDataGenerator():
             encryption_dict,
             substitutors_dict).process_individual()
         return free_bio_passwords
+
+    def stream_data(
+            self,
+            k,
+            words,
+            free_bio_data,
+            substitutors_dict):
+        """
+        Lazily process the free bio data,
+        yielding unhashed candidates
+        """
+        return PasswordGenerator(
+            k,
+            words,
+            free_bio_data,
+            {},
+            substitutors_dict).stream_individual()
+
+    def stream_work(
+            self,
+            k,
+            words,
+            free_bio_data,
+            substitutors_dict):
+        """
+        Yield the lazy units of work for
+        the free bio data, for scheduling
+        """
+        return PasswordGenerator(
+            k,
+            words,
+            free_bio_data,
+            {},
+            substitutors_dict).stream_work()
@@ -1,4 +1,10 @@
 from patalib import Antonym, Synonym, Syzygy, Anomaly, Clinamen
+from ..pipeline import Candidate, hash_clear_text
+from ..cache import transform_cache, words_fingerprint
+from ..words import neighbour_index
+from ..scheduler import Work
+from ..stats import timed, timed_iter
+from .dates import parse_date, date_candidates
 
 
 class PasswordGenerator:
@@ -58,22 +64,100 @@ class PasswordGenerator:
         pata_data.append(self.syzygy(bio_val))
         pata_data.append(self.anomaly(bio_val))
         pata_data.append(self.clinamen(bio_val))
+        day = parse_date(bio_val)
+        if day is not None:
+            pata_data.append(self.dates(day))
 
         return pata_data
 
+    def stream_individual(self):
+        """
+        Lazily generate an individuals
+        candidates one field at a time
+        instead of building the nested
+        dict. Candidates are yielded
+        unhashed, see encrypt_candidates
+        """
+        for k, v in self.bio_data.items():
+            if not isinstance(v, list):
+                v = [v]
+            for listval in v:
+                for candidate in self.stream_pata_data(k, str(listval)):
+                    yield candidate
+
+    def stream_work(self):
+        """
+        Yield the lazy units of work for
+        an individual, one per transform
+        of each field value, in the order
+        stream_individual runs them
+        """
+        for k, v in self.bio_data.items():
+            if not isinstance(v, list):
+                v = [v]
+            for listval in v:
+                for work in self.pata_work(k, str(listval)):
+                    yield work
+
+    def stream_pata_data(self, field, bio_val):
+        """
+        Lazily generate Pata Data
+        for a single field value
+        """
+        for work in self.pata_work(field, bio_val):
+            for candidate in work.candidates:
+                yield candidate
+
+    def pata_work(self, field, bio_val):
+        """
+        Return the units of work for a
+        single field value. No transform
+        runs until its candidates are read
+        """
+        works = [Work('original', iter([
+            Candidate(self.key, field, 'original', bio_val, None)]))]
+
+        for transform, clear_text_for in self.pata_transforms():
+            works.append(Work(transform, self.stream_transform(
+                field, bio_val, transform, clear_text_for)))
+        day = parse_date(bio_val)
+        if day is not None:
+            works.append(Work('dates', self.stream_transform(
+                field, day, 'dates', self.date_clear_text)))
+        return works
+
+    def stream_transform(self, field, bio_val, transform, clear_text_for):
+        """
+        Lazily generate the candidates
+        of one transform of a value
+        """
+        for clear_text in clear_text_for(bio_val):
+            yield Candidate(self.key, field, transform, clear_text, None)
+
+    def pata_transforms(self):
+        """
+        Transform names, as used in the
+        output, and their clear text
+        generators
+        """
+        return [
+            ('synonym', self.synonym_clear_text),
+            ('antonyms', self.antonym_clear_text),
+            ('syzygys', self.syzygy_clear_text),
+            ('anomalies', self.anomaly_clear_text),
+            ('clinamen', self.clinamen_clear_text)]
+
     def gen_enc_list(self, clear_text):
         """
         Generate a list of encrypted
-        items
+        items, one bulk call per
+        encryption plugin
         """
         encrypted = {}
-        temp_enc_list = []
 
         for e in self.encryption_dict:
-            for p in clear_text:
-                temp_enc_list.append(self.encryption_dict[e]().hash(p))
-            encrypted[e] = temp_enc_list
-            temp_enc_list = []
+            encrypted[e] = hash_clear_text(
+                self.encryption_dict[e](), clear_text)
 
         return encrypted
 
@@ -81,16 +165,7 @@ class PasswordGenerator:
         """
         Generate synonyms of input data
         """
-        synonyms = Synonym().generate_synonym(bio_val)
-        synonyms = list(set(synonyms['results']))
-        new_synonyms = []
-        clear_text = []
-        encrypted = {}
-
-        for i in synonyms:
-            new_synonyms = new_synonyms + self.subsitutor(i)
-
-        clear_text = list(set(new_synonyms + synonyms))
+        clear_text = self.synonym_clear_text(bio_val)
         encrypted = self.gen_enc_list(clear_text)
 
         return {'synonym': {'clear_text': clear_text, 'encrypted': encrypted}}
@@ -99,16 +174,7 @@ class PasswordGenerator:
         """
         Generate antonyms of input data
         """
-        antonyms = Antonym().generate_antonym(bio_val)
-        antonyms = list(set(antonyms['results']))
-        new_antonyms = []
-        clear_text = []
-        encrypted = {}
-
-        for i in antonyms:
-            new_antonyms = new_antonyms + self.subsitutor(i)
-
-        clear_text = list(set(new_antonyms + antonyms))
+        clear_text = self.antonym_clear_text(bio_val)
         encrypted = self.gen_enc_list(clear_text)
 
         return {'antonyms': {'clear_text': clear_text, 'encrypted': encrypted}}
@@ -117,16 +183,7 @@ class PasswordGenerator:
         """
         Generate syzygy of input data
         """
-        syzygys = Syzygy().generate_syzygy(bio_val)
-        syzygys = list(set(syzygys['results']))
-        new_syzygys = []
-        clear_text = []
-        encrypted = {}
-
-        for i in syzygys:
-            new_syzygys = new_syzygys + self.subsitutor(i)
-
-        clear_text = list(set(new_syzygys + syzygys))
+        clear_text = self.syzygy_clear_text(bio_val)
         encrypted = self.gen_enc_list(clear_text)
 
         return {'syzygys': {'clear_text': clear_text, 'encrypted': encrypted}}
@@ -135,16 +192,7 @@ class PasswordGenerator:
         """
         Generate anomaly of input data
         """
-        anomalies = Anomaly().generate_anomaly(bio_val, self.words, 1)
-        anomalies = list(set(anomalies['results']))
-        new_anomalies = []
-        clear_text = []
-        encrypted = {}
-
-        for i in anomalies:
-            new_anomalies = new_anomalies + self.subsitutor(i)
-
-        clear_text = list(set(new_anomalies + anomalies))
+        clear_text = self.anomaly_clear_text(bio_val)
         encrypted = self.gen_enc_list(clear_text)
 
         return {
@@ -156,33 +204,162 @@ class PasswordGenerator:
         """
         Generate clinamen of input data
         """
-        clinamen = Clinamen().generate_clinamen(bio_val, self.words, 1)
-        clinamen = list(set(clinamen['results']))
-        new_clinamen = []
-        clear_text = []
-        encrypted = {}
+        clear_text = self.clinamen_clear_text(bio_val)
+        encrypted = self.gen_enc_list(clear_text)
+
+        return {'clinamen': {'clear_text': clear_text, 'encrypted': encrypted}}
 
-        for i in clinamen:
-            new_clinamen = new_clinamen + self.subsitutor(i)
+    @timed('transform.synonym', len)
+    def synonym_clear_text(self, bio_val):
+        """
+        Clear text synonyms and their
+        substitutions
+        """
+        synonyms = transform_cache.get(
+            'synonym', bio_val, None,
+            lambda: Synonym().generate_synonym(bio_val)['results'])
+        return self.expand_clear_text(synonyms)
 
-        clear_text = list(set(new_clinamen + clinamen))
+    @timed('transform.antonyms', len)
+    def antonym_clear_text(self, bio_val):
+        """
+        Clear text antonyms and their
+        substitutions
+        """
+        antonyms = transform_cache.get(
+            'antonym', bio_val, None,
+            lambda: Antonym().generate_antonym(bio_val)['results'])
+        return self.expand_clear_text(antonyms)
+
+    @timed('transform.syzygys', len)
+    def syzygy_clear_text(self, bio_val):
+        """
+        Clear text syzygys and their
+        substitutions
+        """
+        syzygys = transform_cache.get(
+            'syzygy', bio_val, None,
+            lambda: Syzygy().generate_syzygy(bio_val)['results'])
+        return self.expand_clear_text(syzygys)
+
+    @timed('transform.anomalies', len)
+    def anomaly_clear_text(self, bio_val):
+        """
+        Clear text anomalies and their
+        substitutions. Anomalies are a
+        random draw so are not cached
+        """
+        anomalies = Anomaly().generate_anomaly(bio_val, self.words, 1)
+        return self.expand_clear_text(anomalies['results'])
+
+    @timed('transform.clinamen', len)
+    def clinamen_clear_text(self, bio_val):
+        """
+        Clear text clinamen and their
+        substitutions
+        """
+        clinamen = transform_cache.get(
+            'clinamen', bio_val, words_fingerprint(self.words),
+            lambda: Clinamen().generate_clinamen(
+                bio_val, self.clinamen_words(bio_val), 1)['results'])
+        return self.expand_clear_text(clinamen)
+
+    def clinamen_words(self, bio_val):
+        """
+        Words Clinamen considers for bio_val.
+        Rather than the whole list, only the
+        words within one edit of bio_val and
+        of the lengths Clinamen accepts, over
+        half and up to the length of bio_val,
+        are looked up in the word list index
+        """
+        return neighbour_index(self.words).neighbours(
+            bio_val, len(bio_val) // 2 + 1, len(bio_val))
+
+    def dates(self, day):
+        """
+        Generate the formattings of a
+        date and their combinations with
+        the names of the individual
+        """
+        clear_text = list(self.date_clear_text(day))
         encrypted = self.gen_enc_list(clear_text)
 
-        return {'clinamen': {'clear_text': clear_text, 'encrypted': encrypted}}
+        return {'dates': {'clear_text': clear_text, 'encrypted': encrypted}}
+
+    @timed_iter('transform.dates')
+    def date_clear_text(self, day):
+        """
+        Lazily generate the clear text
+        date patterns of a date
+        """
+        return date_candidates(day, self.name_values())
+
+    def name_values(self):
+        """
+        Names to combine with dates, the
+        values of fields such as first_name,
+        last_name or pet1_name
+        """
+        return [
+            str(v) for k, v in self.bio_data.items()
+            if k.endswith('name') and not isinstance(v, list)]
 
+    def expand_clear_text(self, results):
+        """
+        De-duplicate pata results and add
+        the substituted variants of each
+        """
+        results = list(set(results))
+        new_results = []
+
+        for i in results:
+            new_results.extend(self.subsitutor(i))
+        new_results.extend(self.batch_subsitutor(results))
+
+        return list(set(new_results + results))
+
+    @timed('substitute', len)
     def subsitutor(self, pwd):
         """
         Generate common character
-        substitutions
+        substitutions. Substitutors may
+        return a single string or a list
+        of variants. Substitutors with a
+        substitute_many API are left to
+        batch_subsitutor
         """
         new_pwds = []
 
         for s in self.substitutors_dict:
             generator_class = self.substitutors_dict[s]()
-            new_pwds.append(generator_class.substitute(pwd))
+            if getattr(type(generator_class), 'substitute_many', None):
+                continue
+            substituted = generator_class.substitute(pwd)
+            if isinstance(substituted, str):
+                new_pwds.append(substituted)
+            else:
+                new_pwds.extend(substituted)
 
         #mung_it = MungSubstitutor()
         # new_pwds.append(mung_it.total_mung_simple(pwd))
         # new_pwds.append(mung_it.random_mung_simple(pwd))
 
         return new_pwds
+
+    @timed('substitute', len)
+    def batch_subsitutor(self, pwds):
+        """
+        Run a batch of passwords through each
+        substitutor with a substitute_many
+        API, such as the rule engine and
+        the MungSubstitutor family
+        """
+        new_pwds = []
+
+        for s in self.substitutors_dict:
+            generator_class = self.substitutors_dict[s]()
+            if getattr(type(generator_class), 'substitute_many', None):
+                new_pwds.extend(generator_class.substitute_many(pwds))
+
+        return new_pwds
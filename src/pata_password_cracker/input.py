@@ -1,4 +1,40 @@
+import datetime
+import json
+import re
 import yaml
+from yaml.composer import Composer
+from yaml.constructor import SafeConstructor
+from yaml.events import (
+    MappingEndEvent,
+    MappingStartEvent,
+    SequenceEndEvent,
+    SequenceStartEvent,
+    StreamEndEvent)
+from yaml.resolver import Resolver
+from .words import MappedWords
+from .stats import timed, timed_iter
+
+try:
+    from yaml.cyaml import CParser
+except ImportError:
+    CParser = None
+
+
+if CParser is not None:
+    class StreamingLoader(CParser, Composer, SafeConstructor, Resolver):
+        """
+        Safe loader pairing libyaml's parser
+        with the Python composer so single
+        nodes can be composed from a stream
+        """
+
+        def __init__(self, stream):
+            CParser.__init__(self, stream)
+            Composer.__init__(self)
+            SafeConstructor.__init__(self)
+            Resolver.__init__(self)
+else:
+    StreamingLoader = yaml.SafeLoader
 
 
 class ProcessInputYaml():
@@ -13,10 +49,87 @@ class ProcessInputYaml():
         Open the YAML doc and return to
         caller
         """
-        socialdata = {}
-        opendoc = open(yamldoc, "r")
-        socialdata = yaml.safe_load_all(opendoc)
-        return socialdata
+        with open(yamldoc, "r") as opendoc:
+            for socialdata in yaml.load_all(opendoc, Loader=StreamingLoader):
+                yield socialdata
+
+    @timed_iter('input')
+    def individuals_processor(self, yamldoc):
+        """
+        Yield each individual from every
+        document in turn. Only one individual
+        is loaded at a time, the rest of the
+        document is parsed but not built
+        """
+        with open(yamldoc, "r") as opendoc:
+            loader = StreamingLoader(opendoc)
+            try:
+                for individual in self.stream_individuals(loader):
+                    yield individual
+            finally:
+                loader.dispose()
+
+    def stream_individuals(self, loader):
+        """
+        Walk the parser events yielding each
+        item of a top level individuals list
+        """
+        loader.get_event()
+
+        while not loader.check_event(StreamEndEvent):
+            loader.get_event()
+
+            if loader.check_event(MappingStartEvent):
+                loader.get_event()
+                while not loader.check_event(MappingEndEvent):
+                    key = loader.construct_document(loader.compose_node(None, None))
+                    if key == 'individuals' and loader.check_event(SequenceStartEvent):
+                        loader.get_event()
+                        while not loader.check_event(SequenceEndEvent):
+                            yield loader.construct_document(
+                                loader.compose_node(None, None))
+                        loader.get_event()
+                    else:
+                        loader.compose_node(None, None)
+                loader.get_event()
+            else:
+                loader.compose_node(None, None)
+
+            loader.get_event()
+            loader.anchors = {}
+
+
+class ProcessInputJsonLines():
+    """
+    Class to take an input JSON Lines
+    file with one individual per line
+    """
+    date_format = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
+    @timed_iter('input')
+    def individuals_processor(self, jsondoc):
+        """
+        Yield each individual in turn.
+        Blank lines are skipped
+        """
+        with open(jsondoc, "r") as opendoc:
+            for line in opendoc:
+                if line.strip():
+                    yield json.loads(line, object_hook=self.parse_dates)
+
+    def parse_dates(self, values):
+        """
+        Read YYYY-MM-DD strings as dates,
+        as YAML does, so dob values work
+        the same in either format
+        """
+        for k, v in values.items():
+            if isinstance(v, str) and self.date_format.match(v):
+                try:
+                    values[k] = datetime.date.fromisoformat(v)
+                except ValueError:
+                    pass
+        return values
 
 
 class ProcessInputWords():
@@ -25,6 +138,7 @@ class ProcessInputWords():
     it for use in pataphysial algos
     """
 
+    @timed('words', len)
     def words_processor(self, worddoc):
         """
         Process input word list
@@ -34,3 +148,11 @@ class ProcessInputWords():
             for line in file:
                 worddata.append(line.strip())
         return worddata
+
+    @timed('words', len)
+    def mapped_words_processor(self, worddoc, index_dir=None):
+        """
+        Memory map the word list rather
+        than reading it into a list
+        """
+        return MappedWords(worddoc, index_dir)
@@ -1,12 +1,195 @@
+import os
+import re
 import yaml
+from .stats import timed
 
 
 class ProcessOutputYaml():
+    file_name = 'passwords.yaml'
+    mode = 'w'
 
+    @timed('output')
     def output_processor(self, ind_dict):
         """
         Output the processed results
-        to a YAMl file
-        """ 
-        output_doc = open('passwords.yaml', 'w')
-        yaml.dump(ind_dict, output_doc, default_flow_style=False)
+        to a YAMl file, one document
+        per individual
+        """
+        with open(self.file_name, self.mode) as output_doc:
+            yaml.dump(
+                ind_dict,
+                output_doc,
+                explicit_start=True,
+                default_flow_style=False)
+
+    @timed('output')
+    def stream_processor(self, records):
+        """
+        Output (key, candidate) records to a
+        YAML file as they are produced, one
+        document per candidate
+        """
+        with open(self.file_name, self.mode) as output_doc:
+            for indv_key, candidate in records:
+                record = {'individual': indv_key}
+                record.update(candidate._asdict())
+                yaml.dump(
+                    record,
+                    output_doc,
+                    explicit_start=True,
+                    default_flow_style=False,
+                    sort_keys=False)
+
+
+class ProcessOutputBuffered():
+    """
+    Write lines of text out in large
+    blocks rather than one write per
+    line
+    """
+    file_name = 'passwords.txt'
+    mode = 'w'
+    block_size = 1024 * 1024
+
+    def write_lines(self, lines):
+        """
+        Write lines to the output file,
+        flushing a block at a time
+        """
+        with open(
+                self.file_name,
+                self.mode,
+                buffering=self.block_size) as output_doc:
+            block = []
+            block_bytes = 0
+            for line in lines:
+                block.append(line)
+                block_bytes += len(line) + 1
+                if block_bytes >= self.block_size:
+                    output_doc.write('\n'.join(block) + '\n')
+                    block = []
+                    block_bytes = 0
+
+            if block:
+                output_doc.write('\n'.join(block) + '\n')
+
+    @timed('output')
+    def output_processor(self, ind_dict):
+        """
+        Output the processed results
+        """
+        self.write_lines(self.dict_lines(ind_dict))
+
+    @timed('output')
+    def stream_processor(self, records):
+        """
+        Output (key, candidate) records
+        as they are produced
+        """
+        self.write_lines(self.stream_lines(records))
+
+
+class ProcessOutputWordlist(ProcessOutputBuffered):
+    """
+    Plain wordlist of clear text,
+    one password per line
+    """
+    file_name = 'passwords.txt'
+
+    def dict_lines(self, ind_dict):
+        for clear_text, _ in dict_passwords(ind_dict):
+            yield clear_text
+
+    def stream_lines(self, records):
+        for _, candidate in records:
+            yield candidate.clear_text
+
+
+class ProcessOutputPotfile(ProcessOutputBuffered):
+    """
+    Potfile of hash:plain lines, one
+    per password and encryption
+    """
+    file_name = 'passwords.pot'
+
+    def dict_lines(self, ind_dict):
+        for clear_text, encrypted in dict_passwords(ind_dict):
+            for digest in encrypted.values():
+                yield digest_text(digest) + ':' + clear_text
+
+    def stream_lines(self, records):
+        for _, candidate in records:
+            for digest in candidate.encrypted.values():
+                yield digest_text(digest) + ':' + candidate.clear_text
+
+
+def output_writer(options):
+    """
+    Return the writer for the
+    selected output format
+    """
+    writers = {
+        'yaml': ProcessOutputYaml,
+        'wordlist': ProcessOutputWordlist,
+        'potfile': ProcessOutputPotfile}
+    return writers[options.get('output_format', 'yaml')]()
+
+
+def digest_text(digest):
+    """
+    Return a digest as text, bcrypt
+    hashes are returned as bytes
+    """
+    if isinstance(digest, bytes):
+        return digest.decode('ascii')
+    return digest
+
+
+def dict_passwords(ind_dict):
+    """
+    Walk the nested password dict yielding
+    (clear_text, {encryption: digest}) for
+    every password. Original values are
+    not hashed so have no digests
+    """
+    if isinstance(ind_dict, dict):
+        if 'clear_text' in ind_dict and 'encrypted' in ind_dict:
+            encrypted = ind_dict['encrypted']
+            for i, clear_text in enumerate(ind_dict['clear_text']):
+                yield clear_text, {e: encrypted[e][i] for e in encrypted}
+            return
+
+        for k, v in ind_dict.items():
+            if k == 'original':
+                yield v, {}
+            else:
+                for password in dict_passwords(v):
+                    yield password
+    elif isinstance(ind_dict, list):
+        for v in ind_dict:
+            for password in dict_passwords(v):
+                yield password
+
+
+def individual_name(individual):
+    """
+    Name of an individual safe
+    to use in a file name
+    """
+    for name in individual:
+        return re.sub(r'[^\w.-]', '', str(name))
+    return ''
+
+
+def output_file_name(output, options, individual, count):
+    """
+    Return the file an individuals passwords
+    are written to, a shard per individual
+    under output_dir or the writers file
+    """
+    if options.get('output_dir'):
+        extension = os.path.splitext(output.file_name)[1]
+        shard = str(count) + '_' + individual_name(individual) + extension
+        return os.path.join(options['output_dir'], shard)
+    return output.file_name
+
@@ -0,0 +1,126 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from .categories import Categories
+from .dedup import individual_filter
+from .targets import target_hashes
+from .scheduler import PriorityScheduler
+from .combinator import option_combinator
+from .stats import stats
+from .substitutors.rules import RuleSubstitutor
+from .encryption.bcrypt import BcryptEncryption
+
+
+worker_args = ()
+
+
+def pool_context():
+    """
+    Prefer forking workers so the word
+    list is shared copy-on-write rather
+    than pickled to every process
+    """
+    if 'fork' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('fork')
+    return multiprocessing.get_context()
+
+
+def init_worker(words_to_list, plugins, options, cancel=None):
+    """
+    Store the per run state once
+    in each worker process. cancel is
+    shared with the parent to stop
+    cracking once every target is found.
+    Workers hash bcrypt in turn, as the
+    workers already use every process
+    """
+    global worker_args
+    worker_args = (words_to_list, plugins, options)
+    BcryptEncryption.workers = 1
+    if options.get('rules'):
+        RuleSubstitutor.rules_file = options['rules']
+    if options.get('schedule') == 'priority':
+        Categories.scheduler = PriorityScheduler()
+    Categories.combinator = option_combinator(options)
+    if options.get('stats') or options.get('stats_json'):
+        stats.enabled = True
+    if cancel is not None:
+        targets = target_hashes(options['target_hashes'])
+        targets.select(plugins.get('pata_password_cracker.encryption', []))
+        targets.cancel = cancel
+
+
+def build_worker_password_list(individual):
+    """
+    Generate a single individuals
+    passwords inside a worker. Streams
+    are drained so they can be sent back
+    to the parent, along with the workers
+    stats when they are enabled
+    """
+    words_to_list, plugins, options = worker_args
+    categories = Categories(individual, words_to_list, plugins)
+    stats.reset()
+
+    if options.get('target_hashes'):
+        result = list(categories.crack_categories(
+            target_hashes(options['target_hashes']), individual_filter(options)))
+    elif options.get('stream'):
+        result = list(categories.stream_categories(individual_filter(options)))
+    else:
+        result = categories.process_categories()
+
+    if stats.enabled:
+        return result, stats.stages
+    return result
+
+
+def worker_result(future):
+    """
+    Return the result of a worker,
+    merging its stats into the parents
+    """
+    result = future.result()
+    if stats.enabled:
+        result, stages = result
+        stats.merge(stages)
+    return result
+
+
+def parallel_password_lists(individuals, words_to_list, plugins, options):
+    """
+    Generate password lists across a pool
+    of worker processes, yielding each
+    individual and its result in input
+    order. Only a bounded window of
+    individuals is in flight at once.
+    When cracking, no more individuals
+    are started once the targets are done
+    """
+    workers = options['workers']
+    pending = deque()
+    context = pool_context()
+    targets = None
+    cancel = None
+    if options.get('target_hashes'):
+        targets = target_hashes(options['target_hashes'])
+        cancel = targets.cancel = context.Event()
+
+    with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(words_to_list, plugins, options, cancel)) as executor:
+        for individual in individuals:
+            if targets is not None and targets.done():
+                break
+            pending.append((
+                individual,
+                executor.submit(build_worker_password_list, individual)))
+            if len(pending) >= workers * 2:
+                individual, future = pending.popleft()
+                yield individual, worker_result(future)
+
+        while pending:
+            individual, future = pending.popleft()
+            yield individual, worker_result(future)
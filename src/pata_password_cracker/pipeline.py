@@ -0,0 +1,95 @@
+from collections import namedtuple
+from itertools import groupby
+from .stats import timed
+
+
+Candidate = namedtuple(
+    'Candidate',
+    ['category', 'field', 'transform', 'clear_text', 'encrypted'])
+
+
+def candidate_group(candidate):
+    """
+    Key used to batch candidates that
+    came from the same transform
+    """
+    return (candidate.category, candidate.field, candidate.transform)
+
+
+@timed('hash', len)
+def hash_clear_text(encryptor, clear_text):
+    """
+    Hash a batch of clear text with the
+    plugins bulk hash_many API, falling
+    back to hash for plugins without one
+    """
+    if getattr(type(encryptor), 'hash_many', None) is None:
+        return [encryptor.hash(p) for p in clear_text]
+    return list(encryptor.hash_many(clear_text))
+
+
+def encrypt_candidates(candidates, encryption_dict):
+    """
+    Lazily hash a stream of candidates.
+    Candidates are batched per transform,
+    as PasswordGenerator.gen_enc_list does,
+    so only one transform is held in memory
+    at a time
+    """
+    encryptors = {}
+    for e in encryption_dict:
+        encryptors[e] = encryption_dict[e]()
+
+    for _, group in groupby(candidates, key=candidate_group):
+        group = list(group)
+        clear_text = [c.clear_text for c in group]
+        encrypted = {}
+        for e in encryptors:
+            encrypted[e] = hash_clear_text(encryptors[e], clear_text)
+
+        for i, candidate in enumerate(group):
+            yield candidate._replace(
+                encrypted={e: encrypted[e][i] for e in encrypted})
+
+
+def crack_candidates(candidates, targets, encryption_dict):
+    """
+    Lazily hash candidates with only the
+    encryptions that have target hashes,
+    yielding just the candidates matching
+    a target. Their encrypted dict holds
+    the matched hashes only. Stops, and so
+    stops pulling candidates, once the
+    targets are done
+    """
+    if targets.done():
+        return
+    candidates = encrypt_candidates(
+        candidates, targets.encryption_dict(encryption_dict))
+    for candidate in candidates:
+        hits = targets.matches(candidate.encrypted)
+        if hits:
+            yield candidate._replace(encrypted=hits)
+        if targets.done():
+            return
+
+
+def unique_candidates(candidates, seen):
+    """
+    Drop candidates whose clear text
+    has already been seen, so each is
+    hashed and written out once
+    """
+    for candidate in candidates:
+        if seen.add(candidate.clear_text):
+            yield candidate
+
+
+def unique_records(records, seen):
+    """
+    Drop (key, candidate) records whose
+    clear text has already been seen
+    """
+    for indv_key, candidate in records:
+        if seen.add(candidate.clear_text):
+            yield indv_key, candidate
@@ -0,0 +1,65 @@
+try:
+    from importlib.metadata import entry_points
+except ImportError:
+    entry_points = None
+
+
+discovered = {}
+installed = None
+
+
+def plugin_processor(cat, plugins):
+    """
+    Return a list of plugins
+    to use
+    """
+    plugins_to_use = {}
+    plugins_to_use[cat] = plugins.split(',')
+    return plugins_to_use
+
+
+def iter_entry_points(group):
+    """
+    Return the entry points of a plugin
+    group. Installed plugins are only
+    looked up once per process, and no
+    plugin is imported until it is loaded
+    """
+    if group not in discovered:
+        discovered[group] = unique_entry_points(find_entry_points(group))
+    return discovered[group]
+
+
+def find_entry_points(group):
+    """
+    Look up the entry points of a group
+    with importlib.metadata, falling back
+    to pkg_resources where it is missing.
+    Installed distributions are scanned
+    once for every group
+    """
+    global installed
+    if entry_points is None:
+        import pkg_resources
+        return list(pkg_resources.iter_entry_points(group))
+
+    if installed is None:
+        installed = entry_points()
+    if hasattr(installed, 'select'):
+        return list(installed.select(group=group))
+    return list(installed.get(group, []))
+
+
+def unique_entry_points(found):
+    """
+    Drop repeats of a plugin name, as
+    seen when a distribution is found
+    more than once on the path
+    """
+    names = set()
+    unique = []
+    for entry_point in found:
+        if entry_point.name not in names:
+            names.add(entry_point.name)
+            unique.append(entry_point)
+    return unique
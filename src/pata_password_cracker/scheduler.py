@@ -0,0 +1,87 @@
+import heapq
+from collections import namedtuple
+from .stats import timed_iter
+
+
+Work = namedtuple('Work', ['transform', 'candidates'])
+
+
+class PriorityScheduler():
+    """
+    Orders lazy units of work, one transform
+    of one value each, cheapest and most
+    likely first. Priority is the estimated
+    cost of a transform over its hit rate,
+    which starts from a prior and is updated
+    with the hits seen during the run
+    """
+    costs = {
+        'original': 1,
+        'dates': 2,
+        'combined': 5,
+        'synonym': 20,
+        'antonyms': 20,
+        'clinamen': 30,
+        'anomalies': 40,
+        'syzygys': 100}
+    hit_rates = {
+        'original': 0.5,
+        'dates': 0.05,
+        'combined': 0.02,
+        'synonym': 0.05,
+        'antonyms': 0.02,
+        'clinamen': 0.05,
+        'anomalies': 0.01,
+        'syzygys': 0.01}
+    default_cost = 50
+    default_hit_rate = 0.01
+    prior_weight = 100
+
+    def __init__(self):
+        """
+        Start with no history
+        """
+        self.tried = {}
+        self.hits = {}
+
+    def hit_rate(self, transform):
+        """
+        Return the hit rate of a transform,
+        its prior weighted against the
+        candidates tried so far
+        """
+        prior = self.hit_rates.get(transform, self.default_hit_rate)
+        return (self.hits.get(transform, 0) + prior * self.prior_weight) / (
+            self.tried.get(transform, 0) + self.prior_weight)
+
+    def priority(self, transform):
+        """
+        Return the priority of a transform,
+        lower runs first
+        """
+        return self.costs.get(transform, self.default_cost) / max(
+            self.hit_rate(transform), 1e-9)
+
+    def hit(self, transform):
+        """
+        Record a cracked candidate
+        """
+        self.hits[transform] = self.hits.get(transform, 0) + 1
+
+    @timed_iter('generate')
+    def schedule(self, works):
+        """
+        Lazily yield the candidates of each
+        unit of work in priority order, in
+        input order among equal priorities.
+        Work is only run when it is reached
+        """
+        heap = []
+        for count, work in enumerate(works):
+            heapq.heappush(heap, (self.priority(work.transform), count, work))
+
+        while heap:
+            _, _, work = heapq.heappop(heap)
+            for candidate in work.candidates:
+                self.tried[work.transform] = self.tried.get(work.transform, 0) + 1
+                yield candidate
@@ -0,0 +1,369 @@
+import argparse
+import os
+import signal
+import socket
+import socketserver
+import stat
+import yaml
+from .input import ProcessInputWords, StreamingLoader
+from .categories import Categories
+from .cache import transform_cache, PersistentTransformStore
+from .substitutors.simple import MungSubstitutor
+from .substitutors.rules import RuleSubstitutor
+from .encryption.bcrypt import BcryptEncryption
+from .dedup import individual_filter
+from .plugins import plugin_processor
+from .output import output_writer
+
+
+class PasswordService():
+    """
+    Holds the word list, plugins and
+    transform caches of a long running
+    server, so each request only pays for
+    generating its own candidates
+    """
+    formats = ('wordlist', 'potfile')
+    request_options = ('encryption', 'substitutors', 'output_format')
+
+    def __init__(self, words_to_list, options):
+        """
+        Store the loaded word list
+        and the server options
+        """
+        self.words_to_list = words_to_list
+        self.options = options
+
+    def request(self, data):
+        """
+        Return the individuals and options
+        of a request, a YAML document in the
+        input format with an optional top
+        level options mapping
+        """
+        individuals = []
+        options = {}
+        for document in yaml.load_all(data, Loader=StreamingLoader):
+            if not document:
+                continue
+            if not isinstance(document, dict):
+                raise ValueError('Request documents must be mappings')
+            individuals.extend(
+                self.check_individuals(document.get('individuals') or []))
+            options.update(self.check_options(document.get('options') or {}))
+        return individuals, options
+
+    def check_individuals(self, individuals):
+        """
+        Return individuals, raising ValueError
+        unless each maps a name to its
+        categories
+        """
+        if not isinstance(individuals, list):
+            raise ValueError('individuals must be a list')
+        for individual in individuals:
+            if not isinstance(individual, dict):
+                raise ValueError(
+                    'Each individual must be a mapping of name to categories')
+            for name, categories in individual.items():
+                self.check_categories(name, categories)
+        return individuals
+
+    def check_categories(self, name, categories):
+        """
+        Raise ValueError unless categories is
+        a list of mappings of category name to
+        a mapping or list of mappings
+        """
+        if not isinstance(categories, list):
+            raise ValueError('Categories of %s must be a list' % name)
+        for category in categories:
+            if not isinstance(category, dict):
+                raise ValueError('Categories of %s must be mappings' % name)
+            for key, values in category.items():
+                if isinstance(values, list) and all(
+                        isinstance(v, dict) for v in values):
+                    continue
+                if not isinstance(values, dict):
+                    raise ValueError(
+                        'Category %s of %s must be a mapping or list of mappings'
+                        % (key, name))
+
+    def check_options(self, options):
+        """
+        Return the request options, raising
+        ValueError for anything but the
+        known options given as strings
+        """
+        if not isinstance(options, dict):
+            raise ValueError('options must be a mapping')
+        for key, value in options.items():
+            if key not in self.request_options:
+                raise ValueError('Unknown request option: ' + str(key))
+            if not isinstance(value, str):
+                raise ValueError('Request option %s must be a string' % key)
+        return options
+
+    def request_plugins(self, options):
+        """
+        Return the plugins to use, the
+        requests choice or the servers
+        """
+        plugins = plugin_processor(
+            'pata_password_cracker.encryption',
+            options.get('encryption', self.options['encryption']))
+        plugins.update(plugin_processor(
+            'pata_password_cracker.substitutors',
+            options.get('substitutors', self.options['substitutors'])))
+        return plugins
+
+    def records(self, individuals, plugins):
+        """
+        Lazily yield the (key, candidate)
+        records of every individual
+        """
+        for individual in individuals:
+            categories = Categories(individual, self.words_to_list, plugins)
+            for record in categories.stream_categories(
+                    individual_filter(self.options)):
+                yield record
+
+    def lines(self, data):
+        """
+        Lazily yield the output lines for
+        a request, raising ValueError for
+        an unknown output format
+        """
+        individuals, options = self.request(data)
+        output_format = options.get(
+            'output_format', self.options['output_format'])
+        if output_format not in self.formats:
+            raise ValueError('Unsupported output format: ' + str(output_format))
+        output = output_writer({'output_format': output_format})
+        return output.stream_lines(
+            self.records(individuals, self.request_plugins(options)))
+
+    def respond(self, data, wfile):
+        """
+        Write the lines for a request to
+        wfile as they are generated. A bad
+        request gets a single # error: line,
+        and one that fails part way through
+        ends with one
+        """
+        try:
+            lines = self.lines(data)
+            for line in lines:
+                wfile.write(line.encode('utf-8') + b'\n')
+        except (yaml.YAMLError, ValueError, LookupError,
+                TypeError, AttributeError) as e:
+            error = ' '.join(str(e).split())
+            print ("Bad request: %s" % error)
+            wfile.write(('# error: %s\n' % error).encode('utf-8'))
+
+
+class CandidateHandler(socketserver.StreamRequestHandler):
+    """
+    Reads one request per connection,
+    up to the clients end of file, and
+    streams the candidates back
+    """
+    wbufsize = 64 * 1024
+
+    def handle(self):
+        try:
+            self.server.service.respond(self.rfile.read(), self.wfile)
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            print ("Client disconnected")
+
+
+class CandidateServer(socketserver.UnixStreamServer):
+    """
+    Serves requests one at a time on
+    a Unix socket, as the substitutor,
+    scheduler and combinator settings
+    are shared by the whole process
+    """
+
+    def __init__(self, socket_path, service):
+        """
+        Listen on socket_path, replacing
+        a socket left by an earlier run.
+        Anything else at socket_path is
+        left alone and binding fails
+        """
+        if is_socket(socket_path):
+            os.unlink(socket_path)
+        self.service = service
+        socketserver.UnixStreamServer.__init__(
+            self, socket_path, CandidateHandler)
+
+    def server_close(self):
+        socketserver.UnixStreamServer.server_close(self)
+        if is_socket(self.server_address):
+            os.unlink(self.server_address)
+
+
+def is_socket(path):
+    """
+    Return True when path
+    is a Unix socket
+    """
+    try:
+        return stat.S_ISSOCK(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return False
+
+
+def request_candidates(socket_path, data):
+    """
+    Send a request to a running server
+    and lazily yield the lines it
+    streams back
+    """
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+        client.sendall(data.encode('utf-8') if isinstance(data, str) else data)
+        client.shutdown(socket.SHUT_WR)
+        with client.makefile('r', encoding='utf-8') as response:
+            for line in response:
+                yield line.rstrip('\n')
+    finally:
+        client.close()
+
+
+def warm_wordnet():
+    """
+    Load WordNet up front so the
+    first request does not pay for it
+    """
+    try:
+        from nltk.corpus import wordnet
+        wordnet.ensure_loaded()
+    except LookupError:
+        print ("WordNet data not found, it is needed by the synonym, "
+               "antonym and syzygy transforms")
+
+
+def configure(options):
+    """
+    Apply the server options to the
+    transform cache and substitutors
+    """
+    transform_cache.resize(options.get('cache_size', 4096))
+    MungSubstitutor.max_variants = options.get('max_variants', 32)
+    RuleSubstitutor.rules_file = options.get('rules')
+    if options.get('cache_dir'):
+        transform_cache.store = PersistentTransformStore(
+            options['cache_dir'],
+            options.get('cache_max_mb', 64) * 1024 * 1024)
+
+
+def load_words(words_file, options):
+    """
+    Read, or memory map, the word list
+    once for the life of the server
+    """
+    words_to_list = ProcessInputWords()
+    if options.get('mmap_words'):
+        return words_to_list.mapped_words_processor(
+            words_file, options.get('cache_dir'))
+    return words_to_list.words_processor(words_file)
+
+
+def stop(signum, frame):
+    """
+    Stop serving on SIGTERM as
+    on an interrupt
+    """
+    raise KeyboardInterrupt
+
+
+def serve(socket_path, words_file, options):
+    """
+    Load everything requests share and
+    serve them until interrupted
+    """
+    configure(options)
+    warm_wordnet()
+    service = PasswordService(load_words(words_file, options), options)
+    server = CandidateServer(socket_path, service)
+    print ("Serving candidates on %s" % socket_path, flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        transform_cache.close()
+        BcryptEncryption.close()
+
+
+def main():
+    """
+    Run a server holding the word list,
+    WordNet and caches in memory, taking
+    individual YAML requests on a socket
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "words",
+        help="an input text document containing a word list e.g. Linux/Unix words ")
+    parser.add_argument(
+        "--socket",
+        default="pata_password_cracker.sock",
+        help="path of the Unix socket to listen on")
+    parser.add_argument(
+        "--encryption",
+        default="md5",
+        help="list of encryption used unless a request chooses its own")
+    parser.add_argument(
+        "--substitutors",
+        default="simple,simplerandom,common",
+        help="list of substitutors used unless a request chooses its own")
+    parser.add_argument(
+        "--output-format",
+        choices=PasswordService.formats,
+        default="wordlist",
+        help="stream a plain wordlist or hash:plain potfile lines")
+    parser.add_argument(
+        "--max-variants",
+        type=int,
+        default=32,
+        help="maximum variants per word from combinatorial substitutors such as leet, "
+             "0 for no cap")
+    parser.add_argument(
+        "--rules",
+        help="hashcat or John the Ripper rule file for the rules substitutor")
+    parser.add_argument(
+        "--dedup",
+        choices=["none", "individual"],
+        default="none",
+        help="drop repeated candidates of an individual")
+    parser.add_argument(
+        "--mmap-words",
+        action="store_true",
+        help="memory map the word list instead of loading it into memory")
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=4096,
+        help="number of WordNet transform results to keep in memory, 0 disables")
+    parser.add_argument(
+        "--cache-dir",
+        help="directory for a persistent WordNet transform cache reused across runs")
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=64,
+        help="size in MB above which the persistent cache evicts old results")
+
+    args = parser.parse_args()
+    signal.signal(signal.SIGTERM, stop)
+    serve(args.socket, args.words, vars(args))
+
+
+if __name__ == "__main__":
+    main()
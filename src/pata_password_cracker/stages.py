@@ -0,0 +1,140 @@
+import queue
+import threading
+from collections import deque
+from itertools import groupby, islice
+from .pipeline import candidate_group
+
+
+finished = object()
+poll_seconds = 0.1
+
+
+def put(items, item, stop):
+    """
+    Put item on a bounded queue, waiting
+    while it is full. Gives up and returns
+    False once stop is set
+    """
+    while True:
+        try:
+            items.put(item, timeout=poll_seconds)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                return False
+
+
+def queue_items(items):
+    """
+    Yield the items of a queue
+    until it is finished
+    """
+    while True:
+        item = items.get()
+        if item is finished:
+            return
+        yield item
+
+
+def threaded(iterable, size=64):
+    """
+    Run iterable in a producer thread,
+    yielding its items from a bounded queue.
+    The producer waits while the queue is
+    full, so a slow consumer throttles it
+    rather than items piling up. Errors are
+    raised in the consumer, and closing the
+    generator stops the producer
+    """
+    items = queue.Queue(size)
+    stop = threading.Event()
+    failure = []
+
+    def produce():
+        try:
+            for item in iterable:
+                if not put(items, item, stop):
+                    return
+        except BaseException as e:
+            failure.append(e)
+        put(items, finished, stop)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        for item in queue_items(items):
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+    if failure:
+        raise failure[0]
+
+
+def ordered_map(func, iterable, executor, window=64):
+    """
+    Lazily yield func of each item, run on
+    executor, in input order. At most window
+    items are in flight, so the pool is kept
+    busy without running ahead of the consumer
+    """
+    pending = deque()
+    try:
+        for item in iterable:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def threaded_writer(write, records, size=64):
+    """
+    Call write with a stream of records in a
+    dedicated I/O thread, feeding it records
+    through a bounded queue so writing overlaps
+    with producing them. A slow writer
+    throttles the producer. Errors in the
+    writer, or in producing the records,
+    are raised here once the writer stops
+    """
+    items = queue.Queue(size)
+    stop = threading.Event()
+    failure = []
+
+    def consume():
+        try:
+            write(queue_items(items))
+        except BaseException as e:
+            failure.append(e)
+        stop.set()
+
+    thread = threading.Thread(target=consume, daemon=True)
+    thread.start()
+    try:
+        for record in records:
+            if not put(items, record, stop):
+                break
+    finally:
+        put(items, finished, stop)
+        thread.join()
+    if failure:
+        raise failure[0]
+
+
+def candidate_batches(targets, batch_size=256):
+    """
+    Yield (key, batch) pairs of up to batch_size
+    unhashed candidates from the same transform,
+    from (key, candidates) pairs
+    """
+    for indv_key, candidates in targets:
+        for _, group in groupby(candidates, key=candidate_group):
+            while True:
+                batch = list(islice(group, batch_size))
+                if not batch:
+                    break
+                yield indv_key, batch
@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from functools import wraps
+
+
+class Stats():
+    """
+    Wall time, call counts and items
+    produced per stage of a run. Times
+    are exclusive, time spent in a nested
+    stage is only counted against it.
+    Disabled stats cost one flag check
+    per instrumented call. Each thread
+    keeps its own stack of stages
+    """
+    enabled = False
+
+    def __init__(self):
+        """
+        Start with no stages
+        """
+        self.reset()
+
+    def reset(self):
+        """
+        Clear the recorded stages
+        """
+        self.stages = {}
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+
+    @property
+    def stack(self):
+        """
+        The stages the current
+        thread is inside
+        """
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    def start(self, stage):
+        """
+        Enter a stage
+        """
+        self.stack.append([stage, time.perf_counter(), 0.0])
+
+    def stop(self, items=0, calls=1):
+        """
+        Leave the current stage, recording
+        its time less that of nested stages
+        """
+        stack = self.stack
+        stage, started, nested = stack.pop()
+        elapsed = time.perf_counter() - started
+        if stack:
+            stack[-1][2] += elapsed
+        with self.lock:
+            record = self.stages.setdefault(stage, [0, 0, 0.0])
+            record[0] += calls
+            record[1] += items
+            record[2] += elapsed - nested
+
+    def count(self, stage, calls=1):
+        """
+        Record calls of a stage that is
+        counted but not timed, such as
+        cache hits
+        """
+        with self.lock:
+            record = self.stages.setdefault(stage, [0, 0, 0.0])
+            record[0] += calls
+
+    def iterate(self, stage, iterable):
+        """
+        Yield from iterable, timing each
+        item against stage as it is made
+        """
+        iterator = iter(iterable)
+        calls = 1
+        while True:
+            self.start(stage)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.stop(0, calls)
+                return
+            except BaseException:
+                self.stop(0, calls)
+                raise
+            self.stop(1, calls)
+            calls = 0
+            yield item
+
+    def merge(self, stages):
+        """
+        Add the stages recorded
+        by another process
+        """
+        for stage, (calls, items, seconds) in stages.items():
+            record = self.stages.setdefault(stage, [0, 0, 0.0])
+            record[0] += calls
+            record[1] += items
+            record[2] += seconds
+
+    def as_dict(self):
+        """
+        Return the stages as a
+        JSON serialisable dict
+        """
+        return {
+            'total_seconds': time.perf_counter() - self.started,
+            'stages': {
+                stage: {'calls': calls, 'items': items, 'seconds': seconds}
+                for stage, (calls, items, seconds) in sorted(self.stages.items())}}
+
+    def table(self):
+        """
+        Return the stages as a human
+        readable table, slowest first
+        """
+        total = time.perf_counter() - self.started
+        lines = ['%-24s %10s %12s %10s %7s' % (
+            'stage', 'calls', 'items', 'seconds', 'share')]
+        for stage, (calls, items, seconds) in sorted(
+                self.stages.items(), key=lambda s: -s[1][2]):
+            lines.append('%-24s %10d %12d %10.3f %6.1f%%' % (
+                stage, calls, items, seconds,
+                100.0 * seconds / total if total else 0.0))
+        lines.append('%-24s %10s %12s %10.3f' % ('total', '', '', total))
+        return '\n'.join(lines)
+
+    def write_json(self, path):
+        """
+        Write the stages to
+        a JSON file
+        """
+        with open(path, 'w') as stats_file:
+            json.dump(self.as_dict(), stats_file, indent=2)
+
+
+stats = Stats()
+
+
+def timed(stage, count=None):
+    """
+    Decorate a function to record its
+    time against stage, counting items
+    as count(result) when given
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not stats.enabled:
+                return func(*args, **kwargs)
+            stats.start(stage)
+            items = 0
+            try:
+                result = func(*args, **kwargs)
+                if count is not None:
+                    items = count(result)
+                return result
+            finally:
+                stats.stop(items)
+        return wrapper
+    return decorate
+
+
+def timed_iter(stage):
+    """
+    Decorate a function returning an
+    iterator to record the time taken
+    to produce each item against stage
+    """
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not stats.enabled:
+                return func(*args, **kwargs)
+            return stats.iterate(stage, func(*args, **kwargs))
+        return wrapper
+    return decorate
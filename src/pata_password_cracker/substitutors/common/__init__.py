@@ -1,4 +1,4 @@
-from ..simple import MungSubstitutor
+from ..simple import MungSubstitutor, compile_table
 
 
 class MungSubstitutorCommon(MungSubstitutor):
@@ -23,6 +23,8 @@ class MungSubstitutorCommon(MungSubstitutor):
         'O': '0',
         'S': '2'
     }
+    translation_common = compile_table(
+        tuple(substitution_table_common.items()))
 
     def substitute(self, pwd):
-        return self.munger(pwd, self.substitution_table_common.items())
+        return pwd.translate(self.translation_common)
@@ -0,0 +1,64 @@
+from itertools import combinations, islice, product
+from ..simple import MungSubstitutor
+
+
+class MungSubstitutorLeet(MungSubstitutor):
+    """
+    Enumerates partial leetspeak
+    substitutions of a password rather
+    than one fully munged variant
+    """
+
+    substitution_table_leet = {
+        'a': ['@', '4'],
+        'b': ['8'],
+        'e': ['3'],
+        'g': ['9'],
+        'i': ['1', '!'],
+        'l': ['1'],
+        'o': ['0'],
+        's': ['$', '5'],
+        't': ['7', '+'],
+        'z': ['2'],
+        'A': ['@', '4'],
+        'B': ['8'],
+        'E': ['3'],
+        'G': ['6'],
+        'I': ['1', '!'],
+        'L': ['1'],
+        'O': ['0'],
+        'S': ['$', '5'],
+        'T': ['7'],
+        'Z': ['2']
+    }
+
+    def substitute(self, pwd):
+        """
+        Return up to max_variants
+        partial substitutions, or all
+        of them when it is 0 or None
+        """
+        return list(islice(self.variants(pwd), self.max_variants or None))
+
+    def variants(self, pwd):
+        """
+        Lazily yield every partial substitution
+        of pwd. Variants with fewer substituted
+        characters come first, then by position
+        and replacement order, so the order is
+        deterministic and a cap keeps the
+        closest variants
+        """
+        positions = [
+            i for i, c in enumerate(pwd)
+            if c in self.substitution_table_leet]
+
+        for count in range(1, len(positions) + 1):
+            for chosen in combinations(positions, count):
+                replacements = [
+                    self.substitution_table_leet[pwd[i]] for i in chosen]
+                for replaced in product(*replacements):
+                    variant = list(pwd)
+                    for i, r in zip(chosen, replaced):
+                        variant[i] = r
+                    yield ''.join(variant)
@@ -0,0 +1,283 @@
+positions = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+default_rules = [
+    ':', 'l', 'u', 'c', 'C', 't', 'r', 'd', 'f', '{', '}', '[', ']',
+    '$1', '$!', '$1 $2 $3', '$1 $9 $8 $0', '$2 $0 $0 $0',
+    '^1', '^!', 'c $1', 'c $!', 'c $1 $2 $3',
+    'sa@', 'se3', 'si1', 'so0', 'ss$', 'sa@ se3 si1 so0 ss$',
+    'T0', 'T1', 'k', 'K', 'q', 'p1', 'z1', 'Z1', 'r c', 'd c']
+
+# Number of parameters taken by each function
+arity = {
+    ':': '', 'l': '', 'u': '', 'c': '', 'C': '', 't': '', 'E': '',
+    'r': '', 'd': '', 'f': '', '{': '', '}': '', '[': '', ']': '',
+    'q': '', 'k': '', 'K': '',
+    'T': 'N', 'p': 'N', 'D': 'N', "'": 'N', 'z': 'N', 'Z': 'N',
+    'y': 'N', 'Y': 'N', '<': 'N', '>': 'N', '_': 'N',
+    '$': 'X', '^': 'X', '@': 'X', '!': 'X', '/': 'X', '(': 'X', ')': 'X',
+    'x': 'NN', 'O': 'NN', '*': 'NN', 'i': 'NX', 'o': 'NX', 's': 'XX'}
+
+
+def position(char):
+    """
+    Return the position a hashcat
+    rule parameter stands for,
+    0-9 then A-Z for 10-35
+    """
+    index = positions.find(char)
+    if index < 0:
+        raise ValueError('Invalid rule position: ' + char)
+    return index
+
+
+def parse_rule(rule):
+    """
+    Split a rule into a list of (function,
+    parameters) steps. Spaces between
+    functions are ignored
+    """
+    steps = []
+    i = 0
+    while i < len(rule):
+        name = rule[i]
+        i += 1
+        if name == ' ':
+            continue
+        if name not in arity:
+            raise ValueError('Unsupported rule function: ' + name)
+        kinds = arity[name]
+        params = rule[i:i + len(kinds)]
+        if len(params) < len(kinds):
+            raise ValueError('Missing rule parameter: ' + rule)
+        i += len(kinds)
+        steps.append((name, tuple(
+            position(p) if kind == 'N' else p
+            for kind, p in zip(kinds, params))))
+    return steps
+
+
+def toggle_at(word, n):
+    if n >= len(word):
+        return word
+    return word[:n] + word[n].swapcase() + word[n + 1:]
+
+
+def delete_at(word, n):
+    if n >= len(word):
+        return word
+    return word[:n] + word[n + 1:]
+
+
+def extract(word, n, m):
+    if n + m > len(word):
+        return word
+    return word[n:n + m]
+
+
+def omit(word, n, m):
+    if n + m > len(word):
+        return word
+    return word[:n] + word[n + m:]
+
+
+def insert_at(word, n, char):
+    if n > len(word):
+        return word
+    return word[:n] + char + word[n:]
+
+
+def overwrite_at(word, n, char):
+    if n >= len(word):
+        return word
+    return word[:n] + char + word[n + 1:]
+
+
+def swap(word, n, m):
+    if n >= len(word) or m >= len(word):
+        return word
+    chars = list(word)
+    chars[n], chars[m] = chars[m], chars[n]
+    return ''.join(chars)
+
+
+def title(word):
+    return ' '.join(w[:1].upper() + w[1:] for w in word.lower().split(' '))
+
+
+def step_function(name, params):
+    """
+    Return the callable for one step. Each
+    takes a word and returns the new word,
+    or None for a rejected word
+    """
+    simple = {
+        ':': lambda w: w,
+        'l': str.lower,
+        'u': str.upper,
+        'c': str.capitalize,
+        'C': lambda w: w[:1].lower() + w[1:].upper(),
+        't': str.swapcase,
+        'E': title,
+        'r': lambda w: w[::-1],
+        'd': lambda w: w + w,
+        'f': lambda w: w + w[::-1],
+        '{': lambda w: w[1:] + w[:1],
+        '}': lambda w: w[-1:] + w[:-1],
+        '[': lambda w: w[1:],
+        ']': lambda w: w[:-1],
+        'q': lambda w: ''.join(c + c for c in w),
+        'k': lambda w: w[1:2] + w[:1] + w[2:] if len(w) > 1 else w,
+        'K': lambda w: w[:-2] + w[-1] + w[-2] if len(w) > 1 else w}
+    if name in simple:
+        return simple[name]
+
+    a = params[0]
+    b = params[1] if len(params) > 1 else None
+    functions = {
+        'T': lambda w: toggle_at(w, a),
+        'p': lambda w: w * (a + 1),
+        'D': lambda w: delete_at(w, a),
+        "'": lambda w: w[:a],
+        'z': lambda w: w[:1] * a + w,
+        'Z': lambda w: w + w[-1:] * a,
+        'y': lambda w: w[:a] + w if a <= len(w) else w,
+        'Y': lambda w: w + w[-a:] if 0 < a <= len(w) else w,
+        '$': lambda w: w + a,
+        '^': lambda w: a + w,
+        '@': lambda w: w.replace(a, ''),
+        's': lambda w: w.replace(a, b),
+        'x': lambda w: extract(w, a, b),
+        'O': lambda w: omit(w, a, b),
+        '*': lambda w: swap(w, a, b),
+        'i': lambda w: insert_at(w, a, b),
+        'o': lambda w: overwrite_at(w, a, b),
+        '<': lambda w: w if len(w) < a else None,
+        '>': lambda w: w if len(w) > a else None,
+        '_': lambda w: w if len(w) == a else None,
+        '!': lambda w: None if a in w else w,
+        '/': lambda w: w if a in w else None,
+        '(': lambda w: w if w[:1] == a else None,
+        ')': lambda w: w if w[-1:] == a else None}
+    return functions[name]
+
+
+def merge_steps(steps):
+    """
+    Merge runs of appends and of
+    prepends into one step each and
+    drop no-ops, so $1 $2 $3 is a
+    single concatenation
+    """
+    merged = []
+    for name, params in steps:
+        if name == ':':
+            continue
+        if merged and name in '$^' and merged[-1][0] == name:
+            previous = merged[-1][1][0]
+            merged[-1] = (name, (
+                previous + params[0] if name == '$' else params[0] + previous,))
+            continue
+        merged.append((name, params))
+    return merged
+
+
+def compile_rule(rule):
+    """
+    Compile a rule into one callable
+    taking a word and returning the
+    mutated word, or None when the
+    rule rejects it
+    """
+    functions = [
+        step_function(name, params)
+        for name, params in merge_steps(parse_rule(rule))]
+    if not functions:
+        return lambda w: w
+    if len(functions) == 1:
+        return functions[0]
+
+    def apply(word):
+        for function in functions:
+            word = function(word)
+            if word is None:
+                return None
+        return word
+    return apply
+
+
+def compile_rules(lines):
+    """
+    Compile each rule of a rule file,
+    skipping blank lines and comments.
+    Return the compiled rules and the
+    number of unsupported rules skipped
+    """
+    compiled = []
+    skipped = 0
+    for line in lines:
+        rule = line.rstrip('\r\n')
+        if not rule.strip() or rule.startswith('#'):
+            continue
+        try:
+            compiled.append(compile_rule(rule))
+        except ValueError:
+            skipped += 1
+    return compiled, skipped
+
+
+loaded_rules = (None, None)
+
+
+def load_rules(path):
+    """
+    Return the compiled rules of a rule
+    file, or the default rules given
+    None. The last file loaded is
+    remembered so rules compile once
+    """
+    global loaded_rules
+    if loaded_rules[0] != path or loaded_rules[1] is None:
+        if path is None:
+            compiled, skipped = compile_rules(default_rules)
+        else:
+            with open(path, encoding='utf-8', errors='replace') as rule_file:
+                compiled, skipped = compile_rules(rule_file)
+            if skipped:
+                print ("Skipped %d unsupported rules in %s" % (skipped, path))
+        loaded_rules = (path, compiled)
+    return loaded_rules[1]
+
+
+class RuleSubstitutor():
+    """
+    Applies hashcat and John the Ripper
+    style rules. Each rule is compiled once
+    into a callable, and a batch of words is
+    run through every rule in turn
+    """
+    rules_file = None
+
+    def substitute(self, pwd):
+        """
+        Return the distinct variants
+        of pwd made by the rules
+        """
+        return self.substitute_many([pwd])
+
+    def substitute_many(self, pwds):
+        """
+        Return the distinct variants made
+        by running every rule over a batch
+        of words, leaving out the words
+        themselves and rejected words
+        """
+        pwds = list(pwds)
+        variants = {}
+        for rule in load_rules(self.rules_file):
+            for pwd in pwds:
+                variant = rule(pwd)
+                if variant:
+                    variants[variant] = None
+        for pwd in pwds:
+            variants.pop(pwd, None)
+        return list(variants)
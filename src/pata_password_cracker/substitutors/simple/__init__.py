@@ -1,7 +1,43 @@
+from functools import lru_cache
+
+
+def chain_replace(pwd, table):
+    """
+    Apply each substitution in turn,
+    so later rules see the output
+    of earlier ones
+    """
+    munged_pwd = pwd
+    for letter, replacement in table:
+        munged_pwd = munged_pwd.replace(letter, replacement)
+
+    return munged_pwd
+
+
+@lru_cache(maxsize=1024)
+def compile_table(table):
+    """
+    Compile a tuple of (letter, replacement)
+    pairs into a str.translate table giving
+    the same result as chain_replace in a
+    single pass. With single character keys
+    every character is munged independently,
+    so each maps to the result of running it
+    through the whole chain. Tables with
+    other keys can't be compiled and give None
+    """
+    translation = {}
+    for letter, _ in table:
+        if len(letter) != 1:
+            return None
+        translation[ord(letter)] = chain_replace(letter, table)
+
+    return translation
 
 
 class MungSubstitutor():
 
+    max_variants = 32
     substitution_table_simple = {
         'a': '@',
         'b': '8',
@@ -35,17 +71,37 @@ class MungSubstitutor():
         'O': '0',
         'S': '2'
     }
+    translation_simple = compile_table(
+        tuple(substitution_table_simple.items()))
 
     def substitute(self, pwd):
-        return self.munger(pwd, self.substitution_table_simple.items())
+        return pwd.translate(self.translation_simple)
+
+    def substitute_many(self, pwds):
+        """
+        Substitute a batch of password
+        strings, returning a flat list as
+        subclasses may give several
+        variants of each
+        """
+        new_pwds = []
+        for pwd in pwds:
+            substituted = self.substitute(pwd)
+            if isinstance(substituted, str):
+                new_pwds.append(substituted)
+            else:
+                new_pwds.extend(substituted)
+        return new_pwds
 
     def munger(self, pwd, table):
         """
         Function for munging a
-        password string
+        password string. Tables are
+        compiled once and reused
         """
-        munged_pwd = pwd
-        for letter, replacement in table:
-            munged_pwd = munged_pwd.replace(letter, replacement)
+        table = tuple(table)
+        translation = compile_table(table)
+        if translation is None:
+            return chain_replace(pwd, table)
 
-        return munged_pwd
+        return pwd.translate(translation)
@@ -0,0 +1,206 @@
+import re
+from functools import partial
+from .encryption.bcrypt import parse_salt, salt_format
+
+
+class TargetHashes():
+    """
+    Captured hashes to crack. Hashes are held
+    in a set per encryption, and bcrypt hashes
+    per salt, so each candidate hash is checked
+    in constant time. Cracked hashes are removed,
+    and once none are left, or cancel is set by
+    another process, the run is done
+    """
+    hex_lengths = {
+        32: 'md5',
+        40: 'sha1',
+        56: 'sha224',
+        64: 'sha256',
+        96: 'sha384',
+        128: 'sha512'}
+    hex_format = re.compile(r'^[0-9a-fA-F]+$')
+
+    def __init__(self):
+        """
+        Start with no hashes
+        """
+        self.hashes = {}
+        self.algorithms = {}
+        self.unknown = 0
+        self.outstanding = 0
+        self.reported = set()
+        self.cancel = None
+
+    def load(self, path):
+        """
+        Add the hashes in a file, one per line,
+        optionally prefixed by the encryption
+        name and a colon e.g. sha1:...
+        """
+        with open(path) as hash_file:
+            for line in hash_file:
+                self.add(line.strip())
+        return self
+
+    def add(self, line):
+        """
+        Add a single hash
+        """
+        if not line or line.startswith('#'):
+            return
+
+        algorithm, _, digest = line.rpartition(':')
+        if not algorithm:
+            algorithm = self.identify(digest)
+        if algorithm is None:
+            self.unknown += 1
+            return
+
+        if algorithm == 'bcrypt':
+            digest = digest.encode('ascii')
+        else:
+            digest = digest.lower()
+
+        key = self.key(algorithm, digest)
+        self.algorithms[key] = algorithm
+        hashes = self.hashes.setdefault(key, set())
+        if digest not in hashes:
+            hashes.add(digest)
+            self.outstanding += 1
+
+    def key(self, algorithm, digest):
+        """
+        Return the key a hash is held
+        under, bcrypt hashes by salt
+        """
+        if algorithm == 'bcrypt':
+            return 'bcrypt' + parse_salt(digest).decode('ascii')
+        return algorithm
+
+    def identify(self, digest):
+        """
+        Return the encryption a hash is
+        from, or None if unrecognised
+        """
+        if salt_format.match(digest):
+            return 'bcrypt'
+        if self.hex_format.match(digest):
+            return self.hex_lengths.get(len(digest))
+        return None
+
+    def __len__(self):
+        return self.outstanding
+
+    def missing(self, encryption_dict):
+        """
+        Return the encryptions with target
+        hashes that are not selected
+        """
+        return sorted(set(
+            a for a in self.algorithms.values()
+            if a not in encryption_dict))
+
+    def select(self, encryption_dict):
+        """
+        Drop the target hashes of encryptions
+        that are not selected, as they can
+        never be cracked
+        """
+        for key, algorithm in list(self.algorithms.items()):
+            if algorithm not in encryption_dict:
+                self.outstanding -= len(self.hashes.pop(key))
+                del self.algorithms[key]
+        return self
+
+    def encryption_dict(self, encryption_dict):
+        """
+        Return the encryptions to hash with,
+        only those of the selected encryptions
+        that have targets. bcrypt hashes once
+        per target salt
+        """
+        encryption = {}
+        for key, algorithm in self.algorithms.items():
+            if algorithm not in encryption_dict:
+                continue
+            if algorithm == 'bcrypt':
+                encryption[key] = partial(
+                    encryption_dict[algorithm], key[len('bcrypt'):])
+            else:
+                encryption[key] = encryption_dict[algorithm]
+        return encryption
+
+    def matches(self, encrypted):
+        """
+        Return the {encryption: hash} of
+        a candidates hashes that are targets
+        """
+        hits = {}
+        for key, digest in encrypted.items():
+            if digest in self.hashes[key]:
+                hits[self.algorithms[key]] = digest
+        if hits:
+            self.discard(hits)
+        return hits
+
+    def discard(self, encrypted):
+        """
+        Remove cracked {encryption: hash}
+        targets, setting cancel when
+        none are left
+        """
+        for algorithm, digest in encrypted.items():
+            hashes = self.hashes.get(self.key(algorithm, digest), ())
+            if digest in hashes:
+                hashes.remove(digest)
+                self.outstanding -= 1
+        if not self.outstanding and self.cancel is not None:
+            self.cancel.set()
+
+    def report(self, encrypted):
+        """
+        Return the {encryption: hash} of a
+        crack that have not been reported
+        before, discarding them from the
+        targets. A hash cracked in more than
+        one process is only reported once
+        """
+        self.discard(encrypted)
+        fresh = {
+            algorithm: digest for algorithm, digest in encrypted.items()
+            if (algorithm, digest) not in self.reported}
+        self.reported.update(fresh.items())
+        return fresh
+
+    def cracked(self):
+        """
+        Return True once every target is
+        cracked here, whether or not another
+        process has cancelled the run
+        """
+        return not self.outstanding
+
+    def done(self):
+        """
+        Return True once every target is
+        cracked or the run is cancelled
+        """
+        if not self.outstanding:
+            return True
+        return self.cancel is not None and self.cancel.is_set()
+
+
+loaded_targets = (None, None)
+
+
+def target_hashes(path):
+    """
+    Return the target hashes in a file.
+    The last file loaded is remembered
+    so a run only loads it once
+    """
+    global loaded_targets
+    if loaded_targets[0] != path:
+        loaded_targets = (path, TargetHashes().load(path))
+    return loaded_targets[1]
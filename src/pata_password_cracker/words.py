@@ -0,0 +1,270 @@
+import hashlib
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+from itertools import accumulate, chain
+
+
+class MappedWords(Sequence):
+    """
+    Read only word list backed by a memory
+    mapped file. Words are decoded on access
+    using an array of line offsets, so the
+    list costs 8 bytes per word and its pages
+    are shared between processes. Given an
+    index directory the offsets are saved to
+    an index file there and reused while the
+    word list is unchanged
+    """
+    index_magic = b'PATAWIDX'
+    index_header = struct.Struct('<8sQQ')
+
+    def __init__(self, path, index_dir=None):
+        """
+        Map the word list, loading or
+        building its offset index
+        """
+        self.path = os.path.abspath(path)
+        self.index_dir = index_dir
+        self.lengths = None
+        self.open()
+
+    def open(self):
+        """
+        Map the word list and its index
+        """
+        stat = os.stat(self.path)
+        self.file_size = stat.st_size
+        self.file_mtime = stat.st_mtime_ns
+        self.fingerprint = hashlib.sha1(self.index_header.pack(
+            self.index_magic, self.file_size, self.file_mtime)
+            + self.path.encode('utf-8')).hexdigest()
+
+        self.data = b''
+        if self.file_size:
+            with open(self.path, 'rb') as word_file:
+                self.data = mmap.mmap(
+                    word_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.offsets = self.load_index()
+        if self.offsets is None:
+            self.offsets = self.build_index()
+            self.save_index()
+
+    def index_path(self):
+        """
+        Return where the offset index is
+        kept for this word list, or None
+        when it is only kept in memory
+        """
+        if not self.index_dir:
+            return None
+        name = self.fingerprint[:16] + '-' + os.path.basename(self.path) + '.idx'
+        return os.path.join(self.index_dir, name)
+
+    def build_index(self):
+        """
+        Return the offset of the start of
+        every line, and the end of the file
+        """
+        offsets = array('Q')
+        with open(self.path, 'rb') as word_file:
+            offsets.extend(accumulate(chain([0], map(len, word_file))))
+        return offsets
+
+    def load_index(self):
+        """
+        Map a saved index, or return None
+        when there is none or it is stale
+        """
+        if self.index_path() is None:
+            return None
+        try:
+            with open(self.index_path(), 'rb') as index_file:
+                header = index_file.read(self.index_header.size)
+                if header != self.index_header.pack(
+                        self.index_magic, self.file_size, self.file_mtime):
+                    return None
+                self.index_data = mmap.mmap(
+                    index_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        return memoryview(self.index_data)[self.index_header.size:].cast('Q')
+
+    def save_index(self):
+        """
+        Save the index for next time, when there
+        is an index directory. An unwritable
+        directory means the word list is simply
+        indexed again on each run
+        """
+        path = self.index_path()
+        if path is None:
+            return
+        try:
+            os.makedirs(self.index_dir, exist_ok=True)
+            with open(path + '.tmp', 'wb') as index_file:
+                index_file.write(self.index_header.pack(
+                    self.index_magic, self.file_size, self.file_mtime))
+                self.offsets.tofile(index_file)
+            os.replace(path + '.tmp', path)
+        except OSError:
+            pass
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('word index out of range')
+        return self.data[
+            self.offsets[index]:self.offsets[index + 1]].decode('utf-8').strip()
+
+    def __iter__(self):
+        data = self.data
+        offsets = self.offsets
+        for i in range(len(self)):
+            yield data[offsets[i]:offsets[i + 1]].decode('utf-8').strip()
+
+    def __getstate__(self):
+        return {'path': self.path, 'index_dir': self.index_dir}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'], state['index_dir'])
+
+    def length_index(self):
+        """
+        Return a dict of word length to the
+        indexes of the words of that length,
+        built on first use
+        """
+        if self.lengths is None:
+            lengths = {}
+            for i, word in enumerate(self):
+                lengths.setdefault(len(word), array('L')).append(i)
+            self.lengths = lengths
+        return self.lengths
+
+
+class WordSubset(Sequence):
+    """
+    View of selected words
+    of a word list
+    """
+
+    def __init__(self, words, indexes):
+        self.words = words
+        self.indexes = indexes
+
+    def __len__(self):
+        return len(self.indexes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.words[i] for i in self.indexes[index]]
+        return self.words[self.indexes[index]]
+
+
+class NeighbourIndex():
+    """
+    Deletion neighbourhood index, as used by
+    SymSpell, over a word list. Every word and
+    each of its single character deletions
+    are mapped to the words index, so the
+    words within one edit of a value are found
+    by looking up the values own deletions
+    rather than scanning the list. Buckets are
+    built per word length the first time a
+    value needs them
+    """
+
+    def __init__(self, words):
+        """
+        Create an empty index
+        over a word list
+        """
+        self.words = words
+        self.lengths = None
+        self.buckets = {}
+
+    def length_index(self):
+        """
+        Return a dict of word length to
+        the indexes of words that long
+        """
+        if hasattr(self.words, 'length_index'):
+            return self.words.length_index()
+
+        if self.lengths is None:
+            lengths = {}
+            for i, word in enumerate(self.words):
+                lengths.setdefault(len(word), array('L')).append(i)
+            self.lengths = lengths
+        return self.lengths
+
+    def bucket(self, length):
+        """
+        Return the index of the words
+        of one length, built on first use
+        """
+        if length not in self.buckets:
+            bucket = {}
+            for i in self.length_index().get(length, ()):
+                word = self.words[i]
+                for key in set([word] + deletions(word)):
+                    bucket.setdefault(key, array('L')).append(i)
+            self.buckets[length] = bucket
+        return self.buckets[length]
+
+    def neighbours(self, value, shortest, longest):
+        """
+        Return the words between shortest and
+        longest characters long that may be
+        within one insertion, deletion,
+        substitution or transposition of value,
+        in word list order. Candidates still
+        need their edit distance checked
+        """
+        length = len(value)
+        value_deletions = deletions(value)
+        lookups = [
+            (length - 1, value_deletions),
+            (length, value_deletions + [value]),
+            (length + 1, [value])]
+
+        indexes = set()
+        for word_length, keys in lookups:
+            if shortest <= word_length <= longest:
+                bucket = self.bucket(word_length)
+                for key in keys:
+                    indexes.update(bucket.get(key, ()))
+        return WordSubset(self.words, array('L', sorted(indexes)))
+
+
+def deletions(word):
+    """
+    Return every string made by
+    deleting one character of word
+    """
+    return [word[:i] + word[i + 1:] for i in range(len(word))]
+
+
+last_index = (None, None)
+
+
+def neighbour_index(words):
+    """
+    Return the NeighbourIndex for a word
+    list. The last list seen is remembered
+    so a run builds its index once
+    """
+    global last_index
+    if last_index[0] is not words:
+        last_index = (words, NeighbourIndex(words))
+    return last_index[1]
@@ -6,6 +6,32 @@ import tempfile
 import os
 import yaml
 from unittest.mock import Mock
+from pata_password_cracker.cache import transform_cache
+from pata_password_cracker.substitutors.simple import MungSubstitutor
+from pata_password_cracker.substitutors.rules import RuleSubstitutor
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption
+from pata_password_cracker.categories import Categories
+from pata_password_cracker.stats import stats
+
+
+@pytest.fixture(autouse=True)
+def clear_transform_cache():
+    """Start every test with an empty transform cache."""
+    transform_cache.clear()
+    transform_cache.resize(4096)
+    yield
+    transform_cache.clear()
+    MungSubstitutor.max_variants = 32
+    RuleSubstitutor.rules_file = None
+    BcryptEncryption.close()
+    BcryptEncryption.salt = None
+    BcryptEncryption.rounds = 12
+    BcryptEncryption.workers = 1
+    BcryptEncryption.progress = False
+    BcryptEncryption.hashed = 0
+    Categories.scheduler = None
+    Categories.combinator = None
+    stats.enabled = False
 
 
 @pytest.fixture
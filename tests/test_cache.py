@@ -0,0 +1,209 @@
+"""
+Unit tests for the transform cache module.
+"""
+import pytest
+from unittest.mock import Mock
+from pata_password_cracker import cache
+from pata_password_cracker.cache import (
+    TransformCache,
+    PersistentTransformStore,
+    words_fingerprint,
+    patalib_version
+)
+
+
+class TestTransformCache:
+    """Tests for TransformCache class."""
+    
+    def test_get_miss_then_hit(self):
+        """Test results are generated once and then served from the cache."""
+        transform_cache = TransformCache()
+        generate = Mock(return_value=['syn1', 'syn2'])
+        
+        first = transform_cache.get('synonym', 'cat', None, generate)
+        second = transform_cache.get('synonym', 'cat', None, generate)
+        
+        assert first == second == ('syn1', 'syn2')
+        generate.assert_called_once()
+        assert transform_cache.hits == 1
+        assert transform_cache.misses == 1
+    
+    def test_key_includes_transform_and_fingerprint(self):
+        """Test different transforms and word lists are cached apart."""
+        transform_cache = TransformCache()
+        generate = Mock(return_value=['result'])
+        
+        transform_cache.get('synonym', 'cat', None, generate)
+        transform_cache.get('antonym', 'cat', None, generate)
+        transform_cache.get('clinamen', 'cat', 'words-a', generate)
+        transform_cache.get('clinamen', 'cat', 'words-b', generate)
+        
+        assert generate.call_count == 4
+        assert transform_cache.misses == 4
+    
+    def test_bounded_lru_eviction(self):
+        """Test the least recently used result is evicted."""
+        transform_cache = TransformCache(maxsize=2)
+        
+        transform_cache.get('synonym', 'a', None, lambda: ['a'])
+        transform_cache.get('synonym', 'b', None, lambda: ['b'])
+        transform_cache.get('synonym', 'a', None, lambda: ['a'])
+        transform_cache.get('synonym', 'c', None, lambda: ['c'])
+        
+        keys = list(transform_cache.results.keys())
+        assert keys == [('synonym', 'a', None), ('synonym', 'c', None)]
+    
+    def test_zero_size_disables_caching(self):
+        """Test a maxsize of 0 always regenerates."""
+        transform_cache = TransformCache(maxsize=0)
+        generate = Mock(return_value=['result'])
+        
+        transform_cache.get('synonym', 'cat', None, generate)
+        transform_cache.get('synonym', 'cat', None, generate)
+        
+        assert generate.call_count == 2
+        assert transform_cache.results == {}
+    
+    def test_resize_evicts(self):
+        """Test shrinking the cache drops the oldest results."""
+        transform_cache = TransformCache()
+        for value in ['a', 'b', 'c']:
+            transform_cache.get('synonym', value, None, lambda: [value])
+        
+        transform_cache.resize(1)
+        
+        assert list(transform_cache.results.keys()) == [('synonym', 'c', None)]
+    
+    def test_clear_and_stats(self):
+        """Test clear resets results and counters."""
+        transform_cache = TransformCache(maxsize=10)
+        transform_cache.get('synonym', 'cat', None, lambda: ['cat'])
+        transform_cache.get('synonym', 'cat', None, lambda: ['cat'])
+        
+        assert transform_cache.stats() == {'hits': 1, 'misses': 1, 'store_hits': 0, 'size': 1, 'maxsize': 10}
+        
+        transform_cache.clear()
+        
+        assert transform_cache.stats() == {'hits': 0, 'misses': 0, 'store_hits': 0, 'size': 0, 'maxsize': 10}
+    
+    def test_run_stats(self):
+        """Test hits and misses are counted in the run stats when enabled."""
+        from pata_password_cracker.stats import stats
+        
+        transform_cache = TransformCache(maxsize=10)
+        stats.reset()
+        transform_cache.get('synonym', 'cat', None, lambda: ['cat'])
+        assert stats.stages == {}
+        
+        stats.enabled = True
+        transform_cache.get('synonym', 'cat', None, lambda: ['cat'])
+        transform_cache.get('synonym', 'dog', None, lambda: ['dog'])
+        transform_cache.get('synonym', 'dog', None, lambda: ['dog'])
+        
+        assert stats.stages['cache.hits'][0] == 2
+        assert stats.stages['cache.misses'][0] == 1
+
+
+class TestWordsFingerprint:
+    """Tests for words_fingerprint function."""
+    
+    def test_same_contents_same_fingerprint(self):
+        """Test equal word lists share a fingerprint."""
+        assert words_fingerprint(['a', 'b']) == words_fingerprint(['a', 'b'])
+    
+    def test_different_contents_different_fingerprint(self):
+        """Test different word lists do not collide."""
+        assert words_fingerprint(['ab']) != words_fingerprint(['a', 'b'])
+    
+    def test_last_list_is_remembered(self):
+        """Test the same list object is only fingerprinted once."""
+        words = ['a', 'b']
+        fingerprint = words_fingerprint(words)
+        assert cache.last_fingerprint == (words, fingerprint)
+        assert words_fingerprint(words) == fingerprint
+    
+    def test_uses_fingerprint_attribute(self):
+        """Test word lists that carry their own fingerprint are trusted."""
+        words = Mock()
+        words.fingerprint = 'abc123'
+        assert words_fingerprint(words) == 'abc123'
+
+
+class TestPersistentTransformStore:
+    """Tests for PersistentTransformStore class."""
+    
+    def test_put_and_get(self, tmp_path):
+        """Test results survive being stored."""
+        store = PersistentTransformStore(str(tmp_path))
+        store.put('synonym', 'football', None, ('football', 'soccer'))
+        
+        assert store.get('synonym', 'football', None) == ('football', 'soccer')
+        assert store.get('synonym', 'London', None) is None
+        store.close()
+    
+    def test_reused_across_runs(self, tmp_path):
+        """Test a new store over the same directory sees earlier results."""
+        store = PersistentTransformStore(str(tmp_path))
+        store.put('clinamen', 'London', 'words-a', ('Londen',))
+        store.close()
+        
+        store = PersistentTransformStore(str(tmp_path))
+        assert store.get('clinamen', 'London', 'words-a') == ('Londen',)
+        assert store.get('clinamen', 'London', 'words-b') is None
+        store.close()
+    
+    def test_keyed_on_patalib_version(self, tmp_path):
+        """Test results from another patalib version are not reused."""
+        store = PersistentTransformStore(str(tmp_path))
+        store.put('synonym', 'football', None, ('soccer',))
+        store.version = 'other'
+        
+        assert store.get('synonym', 'football', None) is None
+        store.close()
+    
+    def test_size_based_eviction(self, tmp_path):
+        """Test the least recently used results are evicted first."""
+        store = PersistentTransformStore(str(tmp_path), max_bytes=40)
+        store.put('synonym', 'a', None, ('x' * 10,))
+        store.put('synonym', 'b', None, ('y' * 10,))
+        store.get('synonym', 'a', None)
+        store.put('synonym', 'c', None, ('z' * 10,))
+        
+        store.evict()
+        
+        assert store.size() <= 40
+        assert store.get('synonym', 'b', None) is None
+        assert store.get('synonym', 'a', None) == ('x' * 10,)
+        assert store.get('synonym', 'c', None) == ('z' * 10,)
+        store.close()
+    
+    def test_cache_falls_back_to_store(self, tmp_path):
+        """Test an LRU miss is served from the store without regenerating."""
+        store = PersistentTransformStore(str(tmp_path))
+        store.put('synonym', 'football', None, ('soccer',))
+        
+        transform_cache = TransformCache()
+        transform_cache.store = store
+        generate = Mock(return_value=['generated'])
+        
+        result = transform_cache.get('synonym', 'football', None, generate)
+        
+        assert result == ('soccer',)
+        generate.assert_not_called()
+        assert transform_cache.store_hits == 1
+        transform_cache.close()
+        assert transform_cache.store is None
+    
+    def test_cache_writes_through_to_store(self, tmp_path):
+        """Test generated results are written to the store."""
+        transform_cache = TransformCache()
+        transform_cache.store = PersistentTransformStore(str(tmp_path))
+        
+        transform_cache.get('antonym', 'good', None, lambda: ['bad'])
+        
+        assert transform_cache.store.get('antonym', 'good', None) == ('bad',)
+        transform_cache.close()
+    
+    def test_patalib_version(self):
+        """Test the installed patalib version is found."""
+        assert patalib_version() != ''
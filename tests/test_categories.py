@@ -9,7 +9,7 @@ from pata_password_cracker.categories import Categories
 class TestCategories:
     """Tests for Categories class."""
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_init_basic(self, mock_iter_entry_points):
         """Test basic Categories initialization."""
         # Mock entry points
@@ -31,7 +31,7 @@ class TestCategories:
         # Should call iter_entry_points for each plugin type
         assert mock_iter_entry_points.call_count == 3  # category, encryption, substitutors
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_load_plugins(self, mock_iter_entry_points):
         """Test load_plugins method."""
         # Mock entry points
@@ -58,7 +58,22 @@ class TestCategories:
         assert 'plugin2' in result
         assert len(result) == 2
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_load_plugins_requested_only(self, mock_iter_entry_points):
+        """Test only the requested plugins are imported."""
+        mock_md5 = Mock()
+        mock_md5.name = 'md5'
+        mock_sha1 = Mock()
+        mock_sha1.name = 'sha1'
+        mock_iter_entry_points.side_effect = lambda group: (
+            [mock_md5, mock_sha1] if group == 'pata_password_cracker.encryption' else [])
+        
+        categories = Categories({}, [], {'pata_password_cracker.encryption': ['md5']})
+        
+        assert list(categories.loaded_encryption_plugin_dict) == ['md5']
+        mock_sha1.load.assert_not_called()
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_exclude_encrypt(self, mock_iter_entry_points):
         """Test exclude_encrypt method."""
         mock_iter_entry_points.return_value = []
@@ -86,7 +101,43 @@ class TestCategories:
         assert 'sha256' not in categories.loaded_encryption_plugin_dict
         assert 'bcrypt' not in categories.loaded_encryption_plugin_dict
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_exclude_substitutors(self, mock_iter_entry_points):
+        """Test exclude_substitutors method."""
+        mock_iter_entry_points.return_value = []
+        
+        plugins = {
+            'pata_password_cracker.encryption': ['md5'],
+            'pata_password_cracker.substitutors': ['simple', 'leet']
+        }
+        
+        categories = Categories({}, [], plugins)
+        categories.loaded_substitutors_plugin_dict = {
+            'simple': Mock,
+            'simplerandom': Mock,
+            'common': Mock,
+            'leet': Mock
+        }
+        
+        categories.exclude_substitutors()
+        
+        assert list(categories.loaded_substitutors_plugin_dict) == ['simple', 'leet']
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_exclude_substitutors_not_selected(self, mock_iter_entry_points):
+        """Test all substitutors are kept when none were chosen."""
+        mock_iter_entry_points.return_value = []
+        
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        
+        categories = Categories({}, [], plugins)
+        categories.loaded_substitutors_plugin_dict = {'simple': Mock, 'leet': Mock}
+        
+        categories.exclude_substitutors()
+        
+        assert list(categories.loaded_substitutors_plugin_dict) == ['simple', 'leet']
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_process_categories_basic(self, mock_iter_entry_points):
         """Test basic process_categories functionality."""
         mock_iter_entry_points.return_value = []
@@ -131,7 +182,7 @@ class TestCategories:
         mock_core_bio_plugin.assert_called()
         mock_family_plugin.assert_called()
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_process_categories_no_matching_plugins(self, mock_iter_entry_points):
         """Test process_categories with no matching plugins."""
         mock_iter_entry_points.return_value = []
@@ -159,7 +210,7 @@ class TestCategories:
         assert key.startswith('0:')
         assert result[key] == []  # No processing occurred
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_process_categories_multiple_individuals(self, mock_iter_entry_points):
         """Test process_categories with multiple individuals."""
         mock_iter_entry_points.return_value = []
@@ -195,7 +246,7 @@ class TestCategories:
         # Plugin should be called twice
         assert mock_plugin.call_count == 2
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_process_categories_empty_bio_data(self, mock_iter_entry_points):
         """Test process_categories with empty bio data."""
         mock_iter_entry_points.return_value = []
@@ -211,7 +262,7 @@ class TestCategories:
         # Should return empty dictionary
         assert result == {}
     
-    @patch('pata_password_cracker.categories.pkg_resources.iter_entry_points')
+    @patch('pata_password_cracker.categories.iter_entry_points')
     def test_process_categories_plugin_exception(self, mock_iter_entry_points):
         """Test process_categories when plugin raises exception."""
         mock_iter_entry_points.return_value = []
@@ -235,4 +286,223 @@ class TestCategories:
         
         # Should raise the exception
         with pytest.raises(Exception, match="Plugin error"):
-            categories.process_categories()
\ No newline at end of file
+            categories.process_categories()    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_stream_categories(self, mock_iter_entry_points):
+        """Test stream_categories yields hashed candidates per individual."""
+        from pata_password_cracker.pipeline import Candidate
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {
+            'John Doe': [
+                {'free_data': {'pet': 'cat'}},
+                {'unknown_category': {'data': 'value'}}
+            ]
+        }
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        
+        categories = Categories(bio_data, ['test'], plugins)
+        
+        mock_plugin = Mock()
+        mock_plugin.return_value.stream_data.return_value = iter([
+            Candidate('free_data', 'pet', 'original', 'cat', None)
+        ])
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.return_value = 'hash'
+        
+        categories.loaded_cat_plugin_dict = {'free_data': mock_plugin}
+        categories.loaded_encryption_plugin_dict = {'md5': mock_md5}
+        categories.loaded_substitutors_plugin_dict = {'simple': Mock}
+        
+        result = list(categories.stream_categories())
+        
+        assert len(result) == 1
+        key, candidate = result[0]
+        assert key == '0:JohnDoe'
+        assert candidate.clear_text == 'cat'
+        assert candidate.encrypted == {'md5': 'hash'}
+        
+        mock_plugin.return_value.stream_data.assert_called_once_with(
+            'free_data', ['test'], {'pet': 'cat'}, {'simple': Mock})
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_stream_categories_dedup(self, mock_iter_entry_points):
+        """Test repeated clear text is dropped before hashing."""
+        from pata_password_cracker.pipeline import Candidate
+        from pata_password_cracker.dedup import SeenSet
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat'}}]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': ['md5']})
+        
+        mock_plugin = Mock()
+        mock_plugin.return_value.stream_data.return_value = iter([
+            Candidate('free_data', 'pet', 'original', 'cat', None),
+            Candidate('free_data', 'pet', 'synonym', 'cat', None),
+            Candidate('free_data', 'pet', 'synonym', 'kitty', None)
+        ])
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.side_effect = lambda x: f'md5_{x}'
+        
+        categories.loaded_cat_plugin_dict = {'free_data': mock_plugin}
+        categories.loaded_encryption_plugin_dict = {'md5': mock_md5}
+        
+        result = list(categories.stream_categories(SeenSet()))
+        
+        assert [(c.transform, c.clear_text) for _, c in result] == [
+            ('original', 'cat'), ('synonym', 'kitty')]
+        assert mock_md5.return_value.hash.call_count == 2
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_staged_categories(self, mock_iter_entry_points):
+        """Test staged_categories yields what stream_categories does, in order."""
+        from pata_password_cracker.pipeline import Candidate
+        from pata_password_cracker.encryption.md5 import MD5Encryption
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat'}}], 'Jane Doe': [{'free_data': {'pet': 'dog'}}]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': ['md5']})
+        
+        mock_plugin = Mock()
+        mock_plugin.return_value.stream_data.side_effect = lambda k, words, v, subs: iter([
+            Candidate('free_data', 'pet', 'original', v['pet'], None)] + [
+            Candidate('free_data', 'pet', 'synonym', v['pet'] + str(i), None) for i in range(600)])
+        categories.loaded_cat_plugin_dict = {'free_data': mock_plugin}
+        categories.loaded_encryption_plugin_dict = {'md5': MD5Encryption}
+        
+        streamed = list(categories.stream_categories())
+        staged = list(categories.staged_categories(None, 2, 3))
+        
+        assert staged == streamed
+        assert len(staged) == 1202
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_staged_categories_starts_encryption(self, mock_iter_entry_points):
+        """Test encryption is started when called, before any stage thread runs."""
+        mock_iter_entry_points.return_value = []
+        
+        categories = Categories({'John Doe': []}, [], {'pata_password_cracker.encryption': ['bcrypt']})
+        mock_bcrypt = Mock()
+        categories.loaded_encryption_plugin_dict = {'bcrypt': mock_bcrypt}
+        
+        records = categories.staged_categories()
+        
+        mock_bcrypt.start.assert_called_once_with()
+        assert list(records) == []
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_crack_categories(self, mock_iter_entry_points):
+        """Test only candidates matching a target hash are yielded."""
+        from pata_password_cracker.pipeline import Candidate
+        from pata_password_cracker.targets import TargetHashes
+        from pata_password_cracker.encryption.md5 import MD5Encryption
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat'}}]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': ['md5']})
+        
+        mock_plugin = Mock()
+        mock_plugin.return_value.stream_data.return_value = iter([
+            Candidate('free_data', 'pet', 'original', 'cat', None),
+            Candidate('free_data', 'pet', 'synonym', 'kitty', None)
+        ])
+        categories.loaded_cat_plugin_dict = {'free_data': mock_plugin}
+        categories.loaded_encryption_plugin_dict = {'md5': MD5Encryption}
+        
+        targets = TargetHashes()
+        targets.add(MD5Encryption().hash('kitty'))
+        result = list(categories.crack_categories(targets))
+        
+        assert [(k, c.clear_text) for k, c in result] == [('0:JohnDoe', 'kitty')]
+        assert result[0][1].encrypted == {'md5': MD5Encryption().hash('kitty')}
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_stream_categories_scheduled(self, mock_iter_entry_points):
+        """Test a scheduler orders work across all a targets categories."""
+        from pata_password_cracker.pipeline import Candidate
+        from pata_password_cracker.scheduler import PriorityScheduler, Work
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [
+            {'core_bio': {'city': 'york'}},
+            {'free_data': {'pet': 'cat'}}
+        ]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': []})
+        
+        mock_core = Mock()
+        mock_core.return_value.stream_work.return_value = iter([
+            Work('original', iter([Candidate('core_bio', 'city', 'original', 'york', None)])),
+            Work('syzygys', iter([Candidate('core_bio', 'city', 'syzygys', 'port', None)]))
+        ])
+        mock_free = Mock(spec=['stream_data'])
+        mock_free.return_value = Mock(spec=['stream_data'])
+        mock_free.return_value.stream_data.return_value = iter([
+            Candidate('free_data', 'pet', 'original', 'cat', None)
+        ])
+        categories.loaded_cat_plugin_dict = {'core_bio': mock_core, 'free_data': mock_free}
+        categories.loaded_encryption_plugin_dict = {}
+        Categories.scheduler = PriorityScheduler()
+        
+        result = list(categories.stream_categories())
+        
+        # Plugins without stream_work run as one unit at the default priority
+        assert [c.clear_text for _, c in result] == ['york', 'cat', 'port']
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_stream_categories_combined(self, mock_iter_entry_points):
+        """Test combined field values follow a targets categories."""
+        from pata_password_cracker.combinator import Combinator
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat', 'club': 'mason'}}]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': []})
+        categories.loaded_cat_plugin_dict = {}
+        categories.loaded_encryption_plugin_dict = {}
+        Categories.combinator = Combinator(2, [''], 10)
+        
+        result = list(categories.stream_categories())
+        
+        assert [(c.field, c.clear_text) for _, c in result] == [
+            ('club+pet', 'masoncat'), ('pet+club', 'catmason')]
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_process_categories_combined(self, mock_iter_entry_points):
+        """Test combined field values are hashed into the nested output."""
+        from pata_password_cracker.combinator import Combinator
+        
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat', 'club': 'mason'}}]}
+        categories = Categories(bio_data, [], {'pata_password_cracker.encryption': []})
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.side_effect = lambda x: f'md5_{x}'
+        categories.loaded_cat_plugin_dict = {}
+        categories.loaded_encryption_plugin_dict = {'md5': mock_md5}
+        Categories.combinator = Combinator(2, ['_'], 1)
+        
+        result = categories.process_categories()
+        
+        assert result['0:JohnDoe'] == [{'combined': {
+            'clear_text': ['mason_cat'], 'encrypted': {'md5': ['md5_mason_cat']}}}]
+    
+    @patch('pata_password_cracker.categories.iter_entry_points')
+    def test_stream_categories_is_lazy(self, mock_iter_entry_points):
+        """Test stream_categories does no work until consumed."""
+        mock_iter_entry_points.return_value = []
+        
+        bio_data = {'John Doe': [{'free_data': {'pet': 'cat'}}]}
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        
+        categories = Categories(bio_data, ['test'], plugins)
+        mock_plugin = Mock()
+        categories.loaded_cat_plugin_dict = {'free_data': mock_plugin}
+        
+        categories.stream_categories()
+        
+        mock_plugin.assert_not_called()
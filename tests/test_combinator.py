@@ -0,0 +1,103 @@
+"""
+Unit tests for the field combinator module.
+"""
+import pytest
+from datetime import date
+from pata_password_cracker.combinator import (
+    Combinator, ordered_product, option_combinator)
+
+
+class TestOrderedProduct:
+    """Tests for ordered_product function."""
+    
+    def test_shortest_first(self):
+        """Test joins are yielded in order of total length."""
+        result = list(ordered_product([['a', 'bbb'], ['cc', 'dddd']], ''))
+        
+        assert result == ['acc', 'adddd', 'bbbcc', 'bbbdddd']
+        assert [len(r) for r in result] == sorted(len(r) for r in result)
+    
+    def test_separator(self):
+        """Test parts are joined with the separator."""
+        assert list(ordered_product([['a'], ['b'], ['c']], '_')) == ['a_b_c']
+    
+    def test_lazy(self):
+        """Test a large product is not built up front."""
+        parts = [[str(i) for i in range(1000)]] * 3
+        product = ordered_product(parts, '')
+        
+        assert next(product) == '000'
+
+
+class TestCombinator:
+    """Tests for Combinator class."""
+    
+    def test_fields(self):
+        """Test fields are flattened, dates give years and spaces are dropped."""
+        categories = [
+            {'core_bio': {'first_name': 'James', 'dob': date(1982, 5, 6)}},
+            {'family': [{'individual_1': {'first_name': 'Tim'}}]},
+            {'free_data': {'pet2_name': 'Tin Tin', 'pets': ['cat', 'dog']}}
+        ]
+        
+        fields = Combinator().fields(categories)
+        
+        assert fields == {
+            'first_name': ['James'],
+            'dob': ['82', '1982'],
+            'individual_1.first_name': ['Tim'],
+            'pet2_name': ['TinTin'],
+            'pets': ['cat', 'dog']}
+    
+    def test_pairs_shortest_first(self):
+        """Test both orders of each pair are merged shortest first."""
+        categories = [{'free_data': {'pet': 'ginger', 'dob': '1982-05-06'}}]
+        
+        result = list(Combinator(2, [''], 100).combine(categories))
+        
+        assert [c.clear_text for c in result] == [
+            '82ginger', 'ginger82', '1982ginger', 'ginger1982']
+        assert result[0].field == 'dob+pet'
+        assert result[1].field == 'pet+dob'
+        assert all(c.transform == 'combined' for c in result)
+    
+    def test_triples_and_separators(self):
+        """Test triples and every separator are combined."""
+        categories = [{'free_data': {'a': 'x', 'b': 'y', 'c': 'z'}}]
+        
+        result = [c.clear_text for c in Combinator(3, ['', '.'], 1000).combine(categories)]
+        
+        assert 'xy' in result
+        assert 'x.y' in result
+        assert 'zyx' in result
+        assert 'x.z.y' in result
+        assert len(result) == (6 + 6) * 2
+    
+    def test_budget(self):
+        """Test at most budget candidates are yielded."""
+        categories = [{'free_data': {str(i): 'value%d' % i for i in range(30)}}]
+        
+        result = list(Combinator(3, [''], 25).combine(categories))
+        
+        assert len(result) == 25
+    
+    def test_single_field(self):
+        """Test a single field has nothing to combine with."""
+        assert list(Combinator().combine([{'free_data': {'pet': 'cat'}}])) == []
+
+
+class TestOptionCombinator:
+    """Tests for option_combinator function."""
+    
+    def test_disabled(self):
+        """Test fields are not combined by default."""
+        assert option_combinator({}) is None
+        assert option_combinator({'combine_fields': 1}) is None
+    
+    def test_options(self):
+        """Test the combinator is built from the run options."""
+        combinator = option_combinator({'combine_fields': 2, 'combine_separators': '_,-'})
+        
+        assert combinator.size == 2
+        assert combinator.separators == ['_', '-']
+        assert combinator.budget == 10000
@@ -0,0 +1,93 @@
+"""
+Unit tests for the date expansion module.
+"""
+import pytest
+from datetime import date, datetime
+from pata_password_cracker.generators.dates import (
+    parse_date, date_patterns, date_candidates, name_date_product, date_formats)
+
+
+class TestParseDate:
+    """Tests for parse_date function."""
+    
+    def test_dates_and_datetimes(self):
+        """Test dates are returned and datetimes truncated."""
+        assert parse_date(date(1982, 5, 6)) == date(1982, 5, 6)
+        assert parse_date(datetime(1982, 5, 6, 12, 30)) == date(1982, 5, 6)
+    
+    def test_date_strings(self):
+        """Test the accepted date string formats."""
+        assert parse_date('1982-05-06') == date(1982, 5, 6)
+        assert parse_date('1982/05/06') == date(1982, 5, 6)
+        assert parse_date('19820506') == date(1982, 5, 6)
+        assert parse_date('06/05/1982') == date(1982, 5, 6)
+        assert parse_date('06.05.1982') == date(1982, 5, 6)
+    
+    def test_month_first_fallback(self):
+        """Test month first dates are read when day first is impossible."""
+        assert parse_date('12/21/1945') == date(1945, 12, 21)
+    
+    def test_not_dates(self):
+        """Test values that are not date-like give None."""
+        assert parse_date('ginger') is None
+        assert parse_date('01234') is None
+        assert parse_date('1982-13-45') is None
+        assert parse_date(1982) is None
+        assert parse_date(None) is None
+    
+    def test_numbers_not_dates(self):
+        """Test PINs, postcodes and other numbers are not read as dates."""
+        assert parse_date('123456') is None
+        assert parse_date('654321') is None
+        assert parse_date('1234567') is None
+        assert parse_date('90210123') is None
+        assert parse_date('12345678') is None
+        assert parse_date('1/2/34') is None
+        assert parse_date('20240101') == date(2024, 1, 1)
+
+
+class TestDatePatterns:
+    """Tests for date pattern expansion."""
+    
+    def test_formats_built_once(self):
+        """Test the format table has no repeats."""
+        assert len(date_formats) == len(set(date_formats))
+        assert '%(dd)s%(mm)s%(yy)s' in date_formats
+        assert '%(yyyy)s' in date_formats
+    
+    def test_patterns(self):
+        """Test the common shapes of a date are produced."""
+        patterns = date_patterns(date(1982, 5, 6))
+        for expected in [
+                '060582', '05061982', '0605', '1982', '82', '6582',
+                '06-05-1982', '05/06/1982', '1982.05.06', '820506',
+                '19820605', '06_05_82', '051982']:
+            assert expected in patterns
+        assert len(patterns) == len(set(patterns))
+    
+    def test_patterns_cached(self):
+        """Test each date is formatted once."""
+        assert date_patterns(date(1982, 5, 6)) is date_patterns(date(1982, 5, 6))
+    
+    def test_unpadded_parts_deduplicated(self):
+        """Test dates with two digit days and months give no repeats."""
+        patterns = date_patterns(date(1945, 12, 21))
+        assert '21121945' in patterns
+        assert len(patterns) < len(date_formats)
+    
+    def test_name_date_product(self):
+        """Test names are joined before and after each pattern lazily."""
+        product = name_date_product(['Tim', 'Smith'], ('45', '1945'))
+        assert next(product) == 'Tim45'
+        assert list(product) == [
+            '45Tim', 'Tim1945', '1945Tim', 'Smith45', '45Smith', 'Smith1945', '1945Smith']
+    
+    def test_date_candidates(self):
+        """Test patterns come first, then their name combinations."""
+        day = date(1982, 5, 6)
+        candidates = list(date_candidates(day, ['James']))
+        patterns = date_patterns(day)
+        assert candidates[:len(patterns)] == list(patterns)
+        assert 'James060582' in candidates
+        assert '1982James' in candidates
+        assert len(candidates) == 3 * len(patterns)
@@ -0,0 +1,108 @@
+"""
+Unit tests for the dedup module.
+"""
+import pytest
+from pata_password_cracker.dedup import (
+    SeenSet,
+    BloomFilter,
+    seen_filter,
+    individual_filter
+)
+
+
+class TestSeenSet:
+    """Tests for SeenSet class."""
+    
+    def test_add_new_and_repeated(self):
+        """Test add reports whether a value is new."""
+        seen = SeenSet()
+        assert seen.add('password') is True
+        assert seen.add('password') is False
+        assert seen.add('p@ssword') is True
+        assert len(seen) == 2
+        assert 'password' in seen
+        assert 'pa$$word' not in seen
+    
+    def test_stores_hashes(self):
+        """Test only hashes of the values are kept."""
+        seen = SeenSet()
+        seen.add('password')
+        assert seen.hashes == {hash('password')}
+
+
+class TestBloomFilter:
+    """Tests for BloomFilter class."""
+    
+    def test_sizing(self):
+        """Test the filter is sized from capacity and error rate."""
+        bloom = BloomFilter(1000, 0.01)
+        assert bloom.size == 9586
+        assert bloom.hash_count == 7
+        assert len(bloom.bits) == 1199
+    
+    def test_add_new_and_repeated(self):
+        """Test add reports whether a value is new."""
+        bloom = BloomFilter(1000, 0.01)
+        assert bloom.add('password') is True
+        assert bloom.add('password') is False
+        assert bloom.add('p@ssword') is True
+        assert len(bloom) == 2
+        assert 'password' in bloom
+    
+    def test_no_false_negatives(self):
+        """Test every value added is reported as seen."""
+        bloom = BloomFilter(1000, 0.01)
+        values = [f'word{i}' for i in range(1000)]
+        for v in values:
+            bloom.add(v)
+        assert not any(bloom.add(v) for v in values)
+    
+    def test_false_positive_rate(self):
+        """Test the false positive rate is close to the target."""
+        bloom = BloomFilter(2000, 0.01)
+        for i in range(2000):
+            bloom.add(f'word{i}')
+        false_positives = sum(
+            f'other{i}' in bloom for i in range(2000))
+        assert false_positives < 2000 * 0.03
+    
+    def test_positions_deterministic(self):
+        """Test a value always maps to the same bits."""
+        bloom = BloomFilter(100, 0.01)
+        assert bloom.positions('cat') == bloom.positions('cat')
+        assert len(bloom.positions('cat')) == bloom.hash_count
+        assert all(0 <= p < bloom.size for p in bloom.positions('cat'))
+
+
+class TestSeenFilter:
+    """Tests for seen_filter and individual_filter functions."""
+    
+    def test_seen_filter_exact_by_default(self):
+        """Test an exact set is used without an error rate."""
+        assert isinstance(seen_filter({}), SeenSet)
+        assert isinstance(seen_filter({'dedup_error_rate': 0.0}), SeenSet)
+    
+    def test_seen_filter_bloom(self):
+        """Test a Bloom filter is used with an error rate."""
+        result = seen_filter({'dedup_error_rate': 0.01, 'dedup_capacity': 500})
+        assert isinstance(result, BloomFilter)
+        assert result.capacity == 500
+        assert result.error_rate == 0.01
+    
+    def test_individual_filter_off(self):
+        """Test no filter is used when dedup is off."""
+        assert individual_filter({}) is None
+        assert individual_filter({'dedup': 'none'}, SeenSet()) is None
+    
+    def test_individual_filter_per_individual(self):
+        """Test a new filter is made for each individual."""
+        shared = SeenSet()
+        result = individual_filter({'dedup': 'individual'}, shared)
+        assert isinstance(result, SeenSet)
+        assert result is not shared
+    
+    def test_individual_filter_global(self):
+        """Test the shared filter is used for global dedup."""
+        shared = SeenSet()
+        assert individual_filter({'dedup': 'global'}, shared) is shared
+        assert isinstance(individual_filter({'dedup': 'global'}), SeenSet)
@@ -3,6 +3,7 @@ Unit tests for encryption modules.
 """
 import pytest
 import hashlib
+import bcrypt
 from unittest.mock import patch, Mock
 from pata_password_cracker.encryption.md5 import MD5Encryption
 from pata_password_cracker.encryption.sha1 import SHA1Encryption
@@ -10,7 +11,7 @@ from pata_password_cracker.encryption.sha256 import SHA256Encryption
 from pata_password_cracker.encryption.sha512 import SHA512Encryption
 from pata_password_cracker.encryption.sha224 import SHA224Encryption
 from pata_password_cracker.encryption.sha384 import SHA384Encryption
-from pata_password_cracker.encryption.bcrypt import BcryptEncryption
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption, parse_salt
 
 
 class TestMD5Encryption:
@@ -216,6 +217,80 @@ class TestBcryptEncryption:
         assert bcrypt.checkpw(password.encode('utf-8'), result)
         assert bcrypt.checkpw(password.encode('utf-8'), result2)
 
+    
+    def test_hash_rounds(self):
+        """Test the bcrypt cost can be configured."""
+        encryptor = BcryptEncryption()
+        encryptor.rounds = 5
+        
+        assert encryptor.hash("hello").startswith(b'$2b$05$')
+    
+    def test_hash_target_salt(self):
+        """Test a target salt makes hashes comparable with a capture."""
+        captured = bcrypt.hashpw(b'hunter2', bcrypt.gensalt(4))
+        encryptor = BcryptEncryption()
+        encryptor.salt = captured
+        
+        assert encryptor.hash("hunter2") == captured
+        assert encryptor.hash("hunter3") != captured
+        assert encryptor.hash_many(["hunter3", "hunter2"])[1] == captured
+    
+    def test_parse_salt(self):
+        """Test salts are taken from salts or full hashes."""
+        salt = '$2b$04$abcdefghijklmnopqrstuu'
+        
+        assert parse_salt(salt) == salt.encode('ascii')
+        assert parse_salt(salt + 'restofthehashvalue12345678') == salt.encode('ascii')
+        assert parse_salt(salt.encode('ascii')) == salt.encode('ascii')
+    
+    def test_parse_salt_invalid(self):
+        """Test malformed salts are rejected."""
+        for salt in ['', 'md5hash', '$2b$04$short', '$2b$99$abcdefghijklmnopqrstuu']:
+            with pytest.raises(ValueError):
+                parse_salt(salt)
+    
+    def test_hash_many_process_pool(self):
+        """Test hash_many across a process pool keeps input order."""
+        captured = bcrypt.hashpw(b'pw3', bcrypt.gensalt(4))
+        encryptor = BcryptEncryption()
+        encryptor.salt = captured
+        encryptor.workers = 2
+        encryptor.chunk_size = 2
+        passwords = ["pw" + str(i) for i in range(6)]
+        
+        try:
+            result = encryptor.hash_many(passwords)
+        finally:
+            BcryptEncryption.close()
+        
+        assert result == [encryptor.hash(p) for p in passwords]
+        assert result[3] == captured
+    
+    def test_start(self):
+        """Test start only creates a process pool when workers are used."""
+        from pata_password_cracker.encryption import bcrypt as bcrypt_module
+        
+        BcryptEncryption.start()
+        assert bcrypt_module.pool is None
+        
+        BcryptEncryption.workers = 2
+        BcryptEncryption.start()
+        assert bcrypt_module.pool is not None
+        BcryptEncryption.close()
+        assert bcrypt_module.pool is None
+    
+    def test_hash_many_progress(self, capsys):
+        """Test a running count of hashed passwords is reported."""
+        encryptor = BcryptEncryption()
+        encryptor.rounds = 4
+        encryptor.progress = True
+        
+        encryptor.hash_many(["a", "b"])
+        encryptor.hash_many(["c"])
+        
+        assert BcryptEncryption.hashed == 3
+        assert capsys.readouterr().err.endswith('\rbcrypt: 3 hashed')
+
 
 class TestEncryptionModulesComparison:
     """Tests comparing different encryption modules."""
@@ -252,4 +327,58 @@ class TestEncryptionModulesComparison:
         assert len(sha224_result) == 56   # SHA224 is 224 bits = 56 hex chars
         assert len(sha256_result) == 64   # SHA256 is 256 bits = 64 hex chars
         assert len(sha384_result) == 96   # SHA384 is 384 bits = 96 hex chars
-        assert len(sha512_result) == 128  # SHA512 is 512 bits = 128 hex chars
\ No newline at end of file
+        assert len(sha512_result) == 128  # SHA512 is 512 bits = 128 hex chars
+
+class TestHashMany:
+    """Tests for the bulk hash_many API of the hashlib plugins."""
+    
+    @pytest.mark.parametrize('encryptor_class,algorithm', [
+        (MD5Encryption, 'md5'),
+        (SHA1Encryption, 'sha1'),
+        (SHA224Encryption, 'sha224'),
+        (SHA256Encryption, 'sha256'),
+        (SHA384Encryption, 'sha384'),
+        (SHA512Encryption, 'sha512')
+    ])
+    def test_hash_many_matches_hash(self, encryptor_class, algorithm):
+        """Test hash_many gives the same digests, in order, as hash."""
+        encryptor = encryptor_class()
+        passwords = ["hello", "", "héllo", "hello"]
+        
+        result = encryptor.hash_many(passwords)
+        
+        assert result == [encryptor.hash(p) for p in passwords]
+        assert result[0] == hashlib.new(algorithm, b"hello").hexdigest()
+    
+    def test_hash_many_accepts_generator(self):
+        """Test hash_many consumes any iterable."""
+        encryptor = SHA256Encryption()
+        result = encryptor.hash_many(p for p in ["a", "b"])
+        assert result == [encryptor.hash("a"), encryptor.hash("b")]
+    
+    def test_hash_many_empty(self):
+        """Test hash_many with no passwords."""
+        assert MD5Encryption().hash_many([]) == []
+    
+    def test_hash_many_thread_pool(self):
+        """Test hash_many across a thread pool keeps input order."""
+        encryptor = SHA1Encryption()
+        encryptor.chunk_size = 3
+        passwords = ["password" + str(i) for i in range(10)]
+        
+        result = encryptor.hash_many(passwords, workers=4)
+        
+        assert result == [encryptor.hash(p) for p in passwords]
+    
+    def test_bcrypt_hash_many(self):
+        """Test bcrypt hash_many returns a valid hash per password."""
+        encryptor = BcryptEncryption()
+        encryptor.rounds = 4
+        passwords = ["password1", "password2", "password3"]
+        
+        result = encryptor.hash_many(passwords)
+        
+        assert len(result) == 3
+        for pwd, hash_val in zip(passwords, result):
+            assert bcrypt.checkpw(pwd.encode('utf-8'), hash_val)
+            assert hash_val.startswith(b'$2b$04$')
@@ -3,7 +3,9 @@ Unit tests for password generator module.
 """
 import pytest
 from unittest.mock import patch, Mock, MagicMock
+from datetime import date
 from pata_password_cracker.generators.gen_password import PasswordGenerator
+from pata_password_cracker.words import neighbour_index
 
 
 class TestPasswordGenerator:
@@ -110,6 +112,24 @@ class TestPasswordGenerator:
         mock_anomaly.assert_called_once_with('test_value')
         mock_clinamen.assert_called_once_with('test_value')
     
+    @patch.object(PasswordGenerator, 'dates')
+    @patch.object(PasswordGenerator, 'synonyms', return_value={})
+    @patch.object(PasswordGenerator, 'antonym', return_value={})
+    @patch.object(PasswordGenerator, 'syzygy', return_value={})
+    @patch.object(PasswordGenerator, 'anomaly', return_value={})
+    @patch.object(PasswordGenerator, 'clinamen', return_value={})
+    def test_gen_pata_data_date(self, *mocks):
+        """Test date-like values are also expanded into date patterns."""
+        mock_dates = mocks[-1]
+        mock_dates.return_value = {'dates': 'test'}
+        generator = PasswordGenerator('key', ['word'], {}, {}, {})
+        
+        result = generator.gen_pata_data('1982-05-06')
+        
+        assert len(result) == 7
+        assert result[-1] == {'dates': 'test'}
+        mock_dates.assert_called_once_with(date(1982, 5, 6))
+    
     def test_gen_enc_list_basic(self):
         """Test gen_enc_list method."""
         mock_md5 = Mock()
@@ -155,6 +175,20 @@ class TestPasswordGenerator:
         # Should return dictionary with empty lists
         assert result == {'md5': []}
     
+    def test_gen_enc_list_bulk_api(self):
+        """Test gen_enc_list uses one plugin instance and the bulk API."""
+        from pata_password_cracker.encryption.md5 import MD5Encryption
+        
+        generator = PasswordGenerator('key', ['word'], {}, {'md5': MD5Encryption}, {})
+        
+        with patch.object(MD5Encryption, 'hash_many', autospec=True) as mock_hash_many:
+            mock_hash_many.return_value = ['h1', 'h2']
+            result = generator.gen_enc_list(['password1', 'password2'])
+        
+        assert result == {'md5': ['h1', 'h2']}
+        assert mock_hash_many.call_count == 1
+        assert mock_hash_many.call_args[0][1] == ['password1', 'password2']
+    
     def test_subsitutor_basic(self):
         """Test subsitutor method."""
         mock_simple = Mock()
@@ -185,6 +219,26 @@ class TestPasswordGenerator:
         mock_simple.return_value.substitute.assert_called_once_with('password')
         mock_common.return_value.substitute.assert_called_once_with('password')
     
+    def test_subsitutor_multiple_variants(self):
+        """Test subsitutor extends with substitutors returning lists."""
+        mock_simple = Mock()
+        mock_simple.return_value.substitute.return_value = 'substituted'
+        
+        mock_leet = Mock()
+        mock_leet.return_value.substitute.return_value = ['p@ssword', 'pa$sword']
+        
+        generator = PasswordGenerator(
+            'key',
+            ['word'],
+            {},
+            {},
+            {'simple': mock_simple, 'leet': mock_leet}
+        )
+        
+        result = generator.subsitutor('password')
+        
+        assert result == ['substituted', 'p@ssword', 'pa$sword']
+    
     def test_subsitutor_empty_dict(self):
         """Test subsitutor with empty substitutors_dict."""
         generator = PasswordGenerator('key', ['word'], {}, {}, {})
@@ -319,12 +373,15 @@ class TestPasswordGenerator:
         mock_subsitutor.side_effect = [['sub1'], ['sub2']]
         mock_gen_enc_list.return_value = {'md5': ['hash1']}
         
-        generator = PasswordGenerator('key', ['word1', 'word2'], {}, {}, {})
+        generator = PasswordGenerator('key', ['word1', 'test_wort', 'tset_word', 'word2'], {}, {}, {})
         
         result = generator.clinamen('test_word')
         
-        # Should call Clinamen.generate_clinamen with words list
-        mock_clinamen_instance.generate_clinamen.assert_called_once_with('test_word', ['word1', 'word2'], 1)
+        # Should call Clinamen.generate_clinamen with the words near test_word
+        args = mock_clinamen_instance.generate_clinamen.call_args[0]
+        assert args[0] == 'test_word'
+        assert list(args[1]) == ['test_wort', 'tset_word']
+        assert args[2] == 1
         
         # Should return correct structure
         assert 'clinamen' in result
@@ -373,4 +430,193 @@ class TestPasswordGenerator:
             # Should process string and list values differently
             assert isinstance(result['name'], list)  # gen_pata_data returns list
             assert isinstance(result['pets'], list)
-            assert len(result['pets']) == 2  # Two pets processed
\ No newline at end of file
+            assert len(result['pets']) == 2  # Two pets processed
+    
+    @patch.object(PasswordGenerator, 'stream_pata_data')
+    def test_stream_individual(self, mock_stream_pata_data):
+        """Test stream_individual walks string and list values."""
+        mock_stream_pata_data.side_effect = lambda field, val: iter([(field, val)])
+        
+        generator = PasswordGenerator(
+            'test_key',
+            ['word1'],
+            {'name': 'John', 'pets': ['cat', 'dog']},
+            {},
+            {}
+        )
+        
+        result = list(generator.stream_individual())
+        
+        assert result == [('name', 'John'), ('pets', 'cat'), ('pets', 'dog')]
+    
+    def test_stream_pata_data(self):
+        """Test stream_pata_data yields unhashed candidates per transform."""
+        generator = PasswordGenerator('core_bio', ['word'], {}, {}, {})
+        
+        with patch.object(generator, 'pata_transforms') as mock_transforms:
+            mock_transforms.return_value = [
+                ('synonym', lambda val: ['syn1', 'syn2']),
+                ('clinamen', lambda val: [])
+            ]
+            result = list(generator.stream_pata_data('city', 'york'))
+        
+        assert [(c.transform, c.clear_text) for c in result] == [
+            ('original', 'york'),
+            ('synonym', 'syn1'),
+            ('synonym', 'syn2')
+        ]
+        assert all(c.category == 'core_bio' for c in result)
+        assert all(c.field == 'city' for c in result)
+        assert all(c.encrypted is None for c in result)
+    
+    def test_stream_work(self):
+        """Test stream_work yields lazy work per transform of each value."""
+        generator = PasswordGenerator('core_bio', ['word'], {'city': 'york', 'pets': ['cat']}, {}, {})
+        transform = Mock(return_value=['syn1'])
+        
+        with patch.object(generator, 'pata_transforms') as mock_transforms:
+            mock_transforms.return_value = [('synonym', transform)]
+            works = list(generator.stream_work())
+            
+            assert [w.transform for w in works] == ['original', 'synonym', 'original', 'synonym']
+            transform.assert_not_called()
+            
+            result = [c.clear_text for w in works for c in w.candidates]
+        
+        assert result == ['york', 'syn1', 'cat', 'syn1']
+        assert [c[0][0] for c in transform.call_args_list] == ['york', 'cat']
+    
+    def test_stream_work_dates(self):
+        """Test date-like values get a lazy dates unit of work."""
+        generator = PasswordGenerator(
+            'core_bio', ['word'], {'first_name': 'James', 'dob': '1982-05-06'}, {}, {})
+        
+        with patch.object(generator, 'pata_transforms', return_value=[]):
+            works = list(generator.stream_work())
+        
+        assert [w.transform for w in works] == ['original', 'original', 'dates']
+        dates = list(works[2].candidates)
+        assert '060582' in [c.clear_text for c in dates]
+        assert 'James1982' in [c.clear_text for c in dates]
+        assert all(c.field == 'dob' for c in dates)
+    
+    @patch.object(PasswordGenerator, 'gen_enc_list')
+    def test_dates(self, mock_gen_enc_list):
+        """Test the dates of a value are combined with the names and hashed."""
+        mock_gen_enc_list.return_value = {'md5': ['hash']}
+        generator = PasswordGenerator(
+            'free_data', ['word'], {'pet1_name': 'ginger', 'pets': ['cat']}, {}, {})
+        
+        result = generator.dates(date(2010, 6, 12))
+        
+        clear_text = result['dates']['clear_text']
+        assert 'ginger120610' in clear_text
+        assert '2010ginger' in clear_text
+        assert result['dates']['encrypted'] == {'md5': ['hash']}
+        mock_gen_enc_list.assert_called_once_with(clear_text)
+    
+    def test_name_values(self):
+        """Test name fields are found by their key."""
+        generator = PasswordGenerator(
+            'core_bio', ['word'], {'first_name': 'James', 'last_name': 'Smith', 'city': 'York'}, {}, {})
+        
+        assert generator.name_values() == ['James', 'Smith']
+    
+    def test_pata_transforms_match_output_keys(self):
+        """Test streamed transform names match the nested dict keys."""
+        generator = PasswordGenerator('key', ['word'], {}, {}, {})
+        
+        names = [name for name, _ in generator.pata_transforms()]
+        
+        assert names == ['synonym', 'antonyms', 'syzygys', 'anomalies', 'clinamen']
+    
+    def test_expand_clear_text(self):
+        """Test expand_clear_text de-duplicates and adds substitutions."""
+        mock_simple = Mock()
+        mock_simple.return_value.substitute.side_effect = lambda x: x.upper()
+        
+        generator = PasswordGenerator('key', ['word'], {}, {}, {'simple': mock_simple})
+        
+        result = generator.expand_clear_text(['cat', 'cat', 'dog'])
+        
+        assert sorted(result) == ['CAT', 'DOG', 'cat', 'dog']
+    
+    def test_expand_clear_text_batch(self):
+        """Test substitutors with substitute_many get the whole batch once."""
+        class BatchSubstitutor():
+            batches = []
+            
+            def substitute_many(self, pwds):
+                self.batches.append(sorted(pwds))
+                return [p + '1' for p in pwds]
+        
+        generator = PasswordGenerator('key', ['word'], {}, {}, {'rules': BatchSubstitutor})
+        
+        result = generator.expand_clear_text(['cat', 'cat', 'dog'])
+        
+        assert sorted(result) == ['cat', 'cat1', 'dog', 'dog1']
+        assert BatchSubstitutor.batches == [['cat', 'dog']]
+    
+    @patch('pata_password_cracker.generators.gen_password.Synonym')
+    def test_synonyms_cached_across_generators(self, mock_synonym_class):
+        """Test repeated values across generators only hit WordNet once."""
+        mock_synonym_class.return_value.generate_synonym.return_value = {'results': ['Smith', 'metalworker']}
+        
+        first = PasswordGenerator('core_bio', ['word'], {}, {}, {}).synonym_clear_text('Smith')
+        second = PasswordGenerator('family', ['word'], {}, {}, {}).synonym_clear_text('Smith')
+        
+        assert sorted(first) == sorted(second) == ['Smith', 'metalworker']
+        mock_synonym_class.return_value.generate_synonym.assert_called_once_with('Smith')
+    
+    @patch('pata_password_cracker.generators.gen_password.Clinamen')
+    def test_clinamen_cache_keyed_on_word_list(self, mock_clinamen_class):
+        """Test clinamen results are not shared between word lists."""
+        mock_clinamen_class.return_value.generate_clinamen.return_value = {'results': ['cot']}
+        
+        PasswordGenerator('key', ['cot'], {}, {}, {}).clinamen_clear_text('cat')
+        PasswordGenerator('key', ['cot'], {}, {}, {}).clinamen_clear_text('cat')
+        PasswordGenerator('key', ['cut'], {}, {}, {}).clinamen_clear_text('cat')
+        
+        assert mock_clinamen_class.return_value.generate_clinamen.call_count == 2
+    
+    def test_clinamen_words(self):
+        """Test only words within one edit of the value are considered."""
+        words = ['cat', 'cot', 'act', 'at', 'cart', 'dog', 'c']
+        
+        result = PasswordGenerator('key', words, {}, {}, {}).clinamen_words('cat')
+        
+        # cart is longer than cat so Clinamen would skip it anyway
+        assert list(result) == ['cat', 'cot', 'act', 'at']
+    
+    def test_clinamen_words_index_reused(self):
+        """Test the word list index is built once per word list."""
+        words = ['cat', 'cot']
+        
+        first = PasswordGenerator('key', words, {}, {}, {})
+        second = PasswordGenerator('key', words, {}, {}, {})
+        first.clinamen_words('cat')
+        second.clinamen_words('cot')
+        
+        assert neighbour_index(words).buckets.keys() == {2, 3}
+    
+    def test_clinamen_matches_full_scan(self):
+        """Test clinamen results match Clinamen over the whole word list."""
+        from patalib import Clinamen
+        
+        words = ['smith', 'smiht', 'simth', 'smit', 'smyth', 'snith', 'smiths', 'sm_th', 'smith', 'jones']
+        
+        result = Clinamen().generate_clinamen(
+            'smith', PasswordGenerator('key', words, {}, {}, {}).clinamen_words('smith'), 1)
+        
+        assert result == Clinamen().generate_clinamen('smith', words, 1)
+    
+    @patch('pata_password_cracker.generators.gen_password.Anomaly')
+    def test_anomaly_not_cached(self, mock_anomaly_class):
+        """Test anomalies are drawn afresh every time."""
+        mock_anomaly_class.return_value.generate_anomaly.return_value = {'results': ['fox']}
+        
+        generator = PasswordGenerator('key', ['fox'], {}, {}, {})
+        generator.anomaly_clear_text('cat')
+        generator.anomaly_clear_text('cat')
+        
+        assert mock_anomaly_class.return_value.generate_anomaly.call_count == 2
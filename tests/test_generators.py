@@ -78,6 +78,47 @@ class TestCoreRooBioGenerator:
         assert generator.encryption_dict == {'enc': 'dict'}
         assert generator.substitutors_dict == {'sub': 'dict'}
     
+    @patch('pata_password_cracker.generators.core_bio.PasswordGenerator')
+    def test_stream_data(self, mock_password_generator):
+        """Test stream_data chains name/dob and field candidates."""
+        mock_password_generator.return_value.stream_individual.return_value = iter(['city'])
+        
+        generator = CoreBioGenerator()
+        generator.stream_name_dob = Mock(return_value=iter(['name_dob']))
+        
+        core_bio_data = {'city': 'New York'}
+        substitutors_dict = {'simple': Mock}
+        
+        result = list(generator.stream_data(
+            'core_bio',
+            ['word'],
+            core_bio_data,
+            substitutors_dict
+        ))
+        
+        assert result == ['name_dob', 'city']
+        generator.stream_name_dob.assert_called_once_with(core_bio_data)
+        mock_password_generator.assert_called_once_with(
+            'core_bio',
+            ['word'],
+            core_bio_data,
+            {},
+            substitutors_dict
+        )
+    
+    @patch('pata_password_cracker.generators.core_bio.PasswordGenerator')
+    def test_stream_work(self, mock_password_generator):
+        """Test stream_work chains name/dob and field work."""
+        mock_password_generator.return_value.stream_work.return_value = iter(['city'])
+        
+        generator = CoreBioGenerator()
+        generator.stream_name_dob_work = Mock(return_value=iter(['name_dob']))
+        
+        result = list(generator.stream_work('core_bio', ['word'], {'city': 'York'}, {}))
+        
+        assert result == ['name_dob', 'city']
+        generator.stream_name_dob_work.assert_called_once_with({'city': 'York'})
+    
     def test_inherits_from_date_name_mixin(self):
         """Test that CoreBioGenerator inherits from DateNameMixin."""
         generator = CoreBioGenerator()
@@ -161,6 +202,49 @@ class TestFamilyGenerator:
         # Should process each individual separately
         assert mock_pg.call_count == 2  # Two individuals
     
+    @patch('pata_password_cracker.generators.family.PasswordGenerator')
+    def test_stream_data_prefixes_fields(self, mock_password_generator):
+        """Test stream_data prefixes each field with the family member."""
+        from pata_password_cracker.pipeline import Candidate
+        
+        mock_password_generator.return_value.stream_individual.side_effect = lambda: iter([
+            Candidate('family', 'first_name', 'original', 'Tim', None)
+        ])
+        
+        generator = FamilyGenerator()
+        generator.stream_name_dob = Mock(side_effect=lambda values: iter([]))
+        
+        family_data = [
+            {'individual_1': {'first_name': 'Tim'}},
+            {'individual_2': {'first_name': 'Tim'}}
+        ]
+        
+        result = list(generator.stream_data('family', ['word'], family_data, {}))
+        
+        assert [c.field for c in result] == [
+            'individual_1.first_name',
+            'individual_2.first_name'
+        ]
+    
+    @patch('pata_password_cracker.generators.family.PasswordGenerator')
+    def test_stream_work_prefixes_fields(self, mock_password_generator):
+        """Test stream_work prefixes each field with the family member."""
+        from pata_password_cracker.pipeline import Candidate
+        from pata_password_cracker.scheduler import Work
+        
+        mock_password_generator.return_value.stream_work.side_effect = lambda: iter([
+            Work('original', iter([Candidate('family', 'first_name', 'original', 'Tim', None)]))
+        ])
+        
+        generator = FamilyGenerator()
+        generator.stream_name_dob_work = Mock(side_effect=lambda values: iter([]))
+        
+        family_data = [{'individual_1': {'first_name': 'Tim'}}]
+        works = list(generator.stream_work('family', ['word'], family_data, {}))
+        
+        assert [w.transform for w in works] == ['original']
+        assert [c.field for c in works[0].candidates] == ['individual_1.first_name']
+    
     def test_inherits_from_date_name_mixin(self):
         """Test that FamilyGenerator inherits from DateNameMixin."""
         generator = FamilyGenerator()
@@ -253,6 +337,30 @@ class TestFreeDataGenerator:
             assert result == 'result'
 
 
+    def test_stream_data(self):
+        """Test stream_data passes through to the password generator stream."""
+        generator = FreeDataGenerator()
+        
+        with patch('pata_password_cracker.generators.free_data.PasswordGenerator') as mock_pg:
+            mock_pg.return_value.stream_individual.return_value = iter(['candidate'])
+            
+            result = list(generator.stream_data('free_data', ['word'], {'pet': 'cat'}, {}))
+            
+            assert result == ['candidate']
+            mock_pg.assert_called_once_with('free_data', ['word'], {'pet': 'cat'}, {}, {})
+    
+    def test_stream_work(self):
+        """Test stream_work passes through to the password generator work."""
+        generator = FreeDataGenerator()
+        
+        with patch('pata_password_cracker.generators.free_data.PasswordGenerator') as mock_pg:
+            mock_pg.return_value.stream_work.return_value = iter(['work'])
+            
+            result = list(generator.stream_work('free_data', ['word'], {'pet': 'cat'}, {}))
+            
+            assert result == ['work']
+
+
 class TestDateNameMixin:
     """Tests for DateNameMixin class."""
     
@@ -406,4 +514,37 @@ class TestDateNameMixin:
         
         # Should only have first_name_dob
         assert 'first_name_dob' in name_dob_combo
-        assert 'last_name_dob' not in name_dob_combo
\ No newline at end of file
+        assert 'last_name_dob' not in name_dob_combo
+    
+    @patch('pata_password_cracker.generators.date_name_mixin.PasswordGenerator')
+    def test_name_dob_date_string(self, mock_password_generator):
+        """Test name_dob accepts a dob given as a date string."""
+        mixin = DateNameMixin()
+        mixin.cat = 'test_cat'
+        mixin.words = ['word1']
+        mixin.encryption_dict = {}
+        mixin.substitutors_dict = {}
+        
+        mixin.name_dob({'first_name': 'John', 'dob': '06/05/1982'})
+        
+        name_dob_combo = mock_password_generator.call_args[0][2]
+        assert name_dob_combo['first_name_dob'][0] == 'John1982-05-06'
+    
+    @patch('pata_password_cracker.generators.date_name_mixin.PasswordGenerator')
+    def test_stream_name_dob(self, mock_password_generator):
+        """Test stream_name_dob streams the name/dob combos unhashed."""
+        mock_password_generator.return_value.stream_individual.return_value = iter(['candidate'])
+        
+        mixin = DateNameMixin()
+        mixin.cat = 'test_cat'
+        mixin.words = ['word1']
+        mixin.substitutors_dict = {'simple': Mock}
+        
+        values = {'first_name': 'John', 'dob': date(1982, 5, 6)}
+        
+        result = list(mixin.stream_name_dob(values))
+        
+        assert result == ['candidate']
+        call_args = mock_password_generator.call_args[0]
+        assert 'John1982' in call_args[2]['first_name_dob']
+        assert call_args[3] == {}
@@ -4,8 +4,13 @@ Unit tests for input processing modules.
 import pytest
 import tempfile
 import os
+import datetime
 import yaml
-from pata_password_cracker.input import ProcessInputYaml, ProcessInputWords
+from pata_password_cracker.input import (
+    ProcessInputYaml,
+    ProcessInputJsonLines,
+    ProcessInputWords
+)
 
 
 class TestProcessInputYaml:
@@ -69,6 +74,122 @@ class TestProcessInputYaml:
         
         os.unlink(f.name)
 
+    
+    def test_individuals_processor(self, temp_yaml_file):
+        """Test individuals are yielded one at a time."""
+        result = list(ProcessInputYaml().individuals_processor(temp_yaml_file))
+        
+        assert len(result) == 1
+        james_data = result[0]['James Smith']
+        assert james_data[0]['core_bio']['dob'] == datetime.date(1982, 5, 6)
+        assert james_data[2]['free_data']['pet2_name'] == 'Tin Tin'
+    
+    def test_individuals_processor_matches_yaml_processor(self, temp_yaml_file):
+        """Test streamed individuals match fully loaded documents."""
+        processor = ProcessInputYaml()
+        loaded = [x for doc in processor.yaml_processor(temp_yaml_file) for x in doc['individuals']]
+        assert list(processor.individuals_processor(temp_yaml_file)) == loaded
+    
+    def test_individuals_processor_documents(self):
+        """Test individuals across documents, skipping other keys."""
+        content = """
+source: osint
+individuals:
+- Person1:
+    - free_data:
+        pet: cat
+- Person2:
+    - free_data: &pets
+        pet: dog
+other:
+  - ignored
+---
+individuals:
+- Person3:
+    - free_data: {pet: fish}
+---
+just a string
+---
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(content)
+        
+        try:
+            result = list(ProcessInputYaml().individuals_processor(f.name))
+        finally:
+            os.unlink(f.name)
+        
+        assert [list(x)[0] for x in result] == ['Person1', 'Person2', 'Person3']
+        assert result[2]['Person3'][0]['free_data'] == {'pet': 'fish'}
+    
+    def test_individuals_processor_is_lazy(self):
+        """Test earlier individuals are yielded before later ones are parsed."""
+        content = """
+individuals:
+- Person1:
+    - free_data:
+        pet: cat
+- Person2: [unclosed
+"""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write(content)
+        
+        try:
+            individuals = ProcessInputYaml().individuals_processor(f.name)
+            assert next(individuals) == {'Person1': [{'free_data': {'pet': 'cat'}}]}
+            with pytest.raises(yaml.YAMLError):
+                next(individuals)
+        finally:
+            os.unlink(f.name)
+    
+    def test_individuals_processor_empty_file(self):
+        """Test an empty file yields no individuals."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("")
+        
+        try:
+            assert list(ProcessInputYaml().individuals_processor(f.name)) == []
+        finally:
+            os.unlink(f.name)
+
+
+class TestProcessInputJsonLines:
+    """Tests for ProcessInputJsonLines class."""
+    
+    def test_individuals_processor(self):
+        """Test one individual is read per line."""
+        content = (
+            '{"James Smith": [{"core_bio": {"first_name": "James", "dob": "1982-05-06"}}]}\n'
+            '\n'
+            '{"Jane Doe": [{"free_data": {"pet": "cat", "code": "2020-13-45"}}]}\n'
+        )
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write(content)
+        
+        try:
+            result = list(ProcessInputJsonLines().individuals_processor(f.name))
+        finally:
+            os.unlink(f.name)
+        
+        assert len(result) == 2
+        core_bio = result[0]['James Smith'][0]['core_bio']
+        assert core_bio['dob'] == datetime.date(1982, 5, 6)
+        assert core_bio['first_name'] == 'James'
+        
+        # Strings that only look like dates are left alone
+        assert result[1]['Jane Doe'][0]['free_data']['code'] == '2020-13-45'
+    
+    def test_individuals_processor_invalid_line(self):
+        """Test a malformed line raises an error."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+            f.write('{"James Smith": [\n')
+        
+        try:
+            with pytest.raises(ValueError):
+                list(ProcessInputJsonLines().individuals_processor(f.name))
+        finally:
+            os.unlink(f.name)
+
 
 class TestProcessInputWords:
     """Tests for ProcessInputWords class."""
@@ -128,4 +249,12 @@ class TestProcessInputWords:
             
             assert result == ["singleword"]
         
-        os.unlink(f.name)
\ No newline at end of file
+        os.unlink(f.name)
+    
+    def test_mapped_words_processor(self, temp_words_file):
+        """Test the memory mapped word list matches the list."""
+        processor = ProcessInputWords()
+        result = processor.mapped_words_processor(temp_words_file)
+        
+        assert list(result) == processor.words_processor(temp_words_file)
+        assert not os.path.exists(temp_words_file + '.idx')
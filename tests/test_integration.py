@@ -49,7 +49,7 @@ individuals:
             os.unlink(words_file)
     
     @patch('pata_password_cracker.__main__.Categories')
-    @patch('pata_password_cracker.__main__.ProcessOutputYaml')
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
     def test_generate_password_list_integration(self, mock_output_class, mock_categories_class):
         """Test generate_password_list integration."""
         # Mock Categories
@@ -132,6 +132,48 @@ individuals:
             os.unlink(yaml_file)
             os.unlink(words_file)
     
+    def test_workers_crack_targets(self, tmp_path, monkeypatch, capsys):
+        """Test cracking with workers reports and writes every crack once."""
+        import hashlib
+        from pata_password_cracker.generators import gen_password
+        
+        class NoWordNet():
+            def generate_synonym(self, word):
+                return {'results': []}
+            generate_antonym = generate_synonym
+            generate_syzygy = generate_synonym
+        
+        for transform in ('Synonym', 'Antonym', 'Syzygy'):
+            monkeypatch.setattr(gen_password, transform, NoWordNet)
+        monkeypatch.chdir(tmp_path)
+        
+        yaml_file = tmp_path / 'people.yaml'
+        yaml_file.write_text(
+            "individuals:\n" + "".join(
+                "- %s:\n    - free_data:\n        pet: %s\n" % (name, pet)
+                for name, pet in [('Ann', 'cat'), ('Bob', 'dog'), ('Cid', 'zebra'), ('Dee', 'owl')]))
+        words_file = tmp_path / 'words.txt'
+        words_file.write_text("apple\nzebra\nowl\n")
+        target = hashlib.md5(b'zebra').hexdigest()
+        plugins = {
+            'pata_password_cracker.encryption': ['md5'],
+            'pata_password_cracker.substitutors': ['simple']}
+        
+        for run in range(3):
+            hash_file = tmp_path / ('hashes%d.txt' % run)
+            hash_file.write_text(
+                target + '\nsha1:' + hashlib.sha1(b'unselected').hexdigest() + '\n')
+            process_input(str(yaml_file), str(words_file), plugins, {
+                'target_hashes': str(hash_file),
+                'schedule': 'priority',
+                'workers': 2,
+                'output_format': 'potfile'})
+            
+            out = capsys.readouterr().out
+            assert out.count('Cracked md5 %s:zebra' % target) == 1
+            assert 'All target hashes cracked' in out
+            assert (tmp_path / 'passwords.pot').read_text() == target + ':zebra\n'
+    
     def test_plugin_system_integration(self):
         """Test that the plugin system works correctly."""
         from pata_password_cracker.categories import Categories
@@ -4,11 +4,25 @@ Unit tests for main module functions.
 import pytest
 from unittest.mock import patch, Mock, MagicMock
 import argparse
+import json
+import os
+import tempfile
+import yaml
 from pata_password_cracker.__main__ import (
     plugin_processor, 
+    option_processor,
+    individual_processor,
     process_input,
-    generate_password_list
+    generate_password_list,
+    output_writer
 )
+from pata_password_cracker.dedup import SeenSet
+from pata_password_cracker.output import (
+    ProcessOutputYaml, ProcessOutputWordlist, ProcessOutputPotfile)
+from pata_password_cracker.pipeline import Candidate
+from pata_password_cracker.substitutors.rules import RuleSubstitutor
+from pata_password_cracker.categories import Categories
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption
 
 
 class TestPluginProcessor:
@@ -39,6 +53,101 @@ class TestPluginProcessor:
         assert result == expected
 
 
+def make_args(**overrides):
+    """Build parsed arguments with the CLI defaults."""
+    args = {
+        'stream': False,
+        'target_hashes': None,
+        'schedule': None,
+        'output_format': 'yaml',
+        'output_dir': None,
+        'workers': 1,
+        'mmap_words': False,
+        'cache_size': 4096,
+        'cache_dir': None,
+        'cache_max_mb': 64,
+        'max_variants': 32,
+        'rules': None,
+        'combine_fields': 0,
+        'combine_separators': '',
+        'combine_budget': 10000,
+        'bcrypt_salt': None,
+        'bcrypt_rounds': 12,
+        'bcrypt_workers': 1,
+        'progress': False,
+        'pipeline': False,
+        'hash_threads': 2,
+        'queue_size': 64,
+        'dedup': 'none',
+        'dedup_error_rate': 0.0,
+        'dedup_capacity': 1000000,
+        'stats': False,
+        'stats_json': None,
+    }
+    args.update(overrides)
+    return argparse.Namespace(**args)
+
+
+class TestOptionProcessor:
+    """Tests for option_processor function."""
+    
+    def test_option_processor_stream(self):
+        """Test stream flag is carried into the options."""
+        args = make_args(stream=True)
+        result = option_processor(args)
+        assert result['stream'] is True
+    
+    def test_option_processor_defaults(self):
+        """Test default options."""
+        result = option_processor(make_args())
+        assert result == {
+            'stream': False,
+            'target_hashes': None,
+            'schedule': 'fixed',
+            'output_format': 'yaml',
+            'output_dir': None,
+            'workers': 1,
+            'mmap_words': False,
+            'cache_size': 4096,
+            'cache_dir': None,
+            'cache_max_mb': 64,
+            'max_variants': 32,
+            'rules': None,
+            'combine_fields': 0,
+            'combine_separators': '',
+            'combine_budget': 10000,
+            'bcrypt_salt': None,
+            'bcrypt_rounds': 12,
+            'bcrypt_workers': 1,
+            'progress': False,
+            'pipeline': False,
+            'hash_threads': 2,
+            'queue_size': 64,
+            'dedup': 'none',
+            'dedup_error_rate': 0.0,
+            'dedup_capacity': 1000000,
+            'stats': False,
+            'stats_json': None,
+        }
+    
+    def test_option_processor_workers(self):
+        """Test worker count is carried into the options."""
+        args = make_args(workers=4)
+        result = option_processor(args)
+        assert result['workers'] == 4
+    
+    def test_option_processor_max_variants(self):
+        """Test the substitution variant cap is carried into the options."""
+        result = option_processor(make_args(max_variants=8))
+        assert result['max_variants'] == 8
+    
+    def test_option_processor_schedule(self):
+        """Test cracking defaults to the priority schedule."""
+        assert option_processor(make_args(target_hashes='hashes.txt'))['schedule'] == 'priority'
+        assert option_processor(make_args(
+            target_hashes='hashes.txt', schedule='fixed'))['schedule'] == 'fixed'
+
+
 class TestProcessInput:
     """Tests for process_input function."""
     
@@ -50,14 +159,10 @@ class TestProcessInput:
         """Test basic process_input functionality."""
         # Mock the YAML processor
         mock_yaml_instance = Mock()
-        mock_yaml_instance.yaml_processor.return_value = [
-            {
-                'individuals': [
-                    {'John Doe': 'john_data'},
-                    {'Jane Smith': 'jane_data'}
-                ]
-            }
-        ]
+        mock_yaml_instance.individuals_processor.return_value = iter([
+            {'John Doe': 'john_data'},
+            {'Jane Smith': 'jane_data'}
+        ])
         mock_yaml_class.return_value = mock_yaml_instance
         
         # Mock the words processor
@@ -71,13 +176,13 @@ class TestProcessInput:
         
         # Verify calls
         mock_print.assert_called_with("Processing input YAML")
-        mock_yaml_instance.yaml_processor.assert_called_once_with('test.yaml')
+        mock_yaml_instance.individuals_processor.assert_called_once_with('test.yaml')
         mock_words_instance.words_processor.assert_called_once_with('words.txt')
         
         # Should call generate_password_list for each individual
         assert mock_generate.call_count == 2
-        mock_generate.assert_any_call({'John Doe': 'john_data'}, ['word1', 'word2'], plugins)
-        mock_generate.assert_any_call({'Jane Smith': 'jane_data'}, ['word1', 'word2'], plugins)
+        mock_generate.assert_any_call({'John Doe': 'john_data'}, ['word1', 'word2'], plugins, {}, None, 0)
+        mock_generate.assert_any_call({'Jane Smith': 'jane_data'}, ['word1', 'word2'], plugins, {}, None, 1)
     
     @patch('pata_password_cracker.__main__.generate_password_list')
     @patch('pata_password_cracker.__main__.ProcessInputWords')
@@ -87,9 +192,7 @@ class TestProcessInput:
         """Test process_input with empty individuals list."""
         # Mock empty individuals
         mock_yaml_instance = Mock()
-        mock_yaml_instance.yaml_processor.return_value = [
-            {'individuals': []}
-        ]
+        mock_yaml_instance.individuals_processor.return_value = iter([])
         mock_yaml_class.return_value = mock_yaml_instance
         
         mock_words_instance = Mock()
@@ -108,12 +211,12 @@ class TestProcessInput:
     @patch('builtins.print')
     def test_process_input_multiple_document_sections(self, mock_print, mock_yaml_class, mock_words_class, mock_generate):
         """Test process_input with multiple document sections."""
-        # Mock multiple document sections
+        # Individuals from every document section are streamed in turn
         mock_yaml_instance = Mock()
-        mock_yaml_instance.yaml_processor.return_value = [
-            {'individuals': [{'Person1': 'data1'}]},
-            {'individuals': [{'Person2': 'data2'}]}
-        ]
+        mock_yaml_instance.individuals_processor.return_value = iter([
+            {'Person1': 'data1'},
+            {'Person2': 'data2'}
+        ])
         mock_yaml_class.return_value = mock_yaml_instance
         
         mock_words_instance = Mock()
@@ -127,10 +230,292 @@ class TestProcessInput:
         assert mock_generate.call_count == 2
 
 
+    @patch('pata_password_cracker.__main__.generate_password_list')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_stops_when_cracked(self, mock_print, mock_yaml_class, mock_words_class, mock_generate, tmp_path):
+        """Test no more individuals are generated once every target is cracked."""
+        from pata_password_cracker.targets import target_hashes
+        
+        hash_file = tmp_path / 'hashes.txt'
+        hash_file.write_text('a' * 32 + '\n')
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([
+            {'Person1': 'data1'}, {'Person2': 'data2'}
+        ])
+        mock_words_class.return_value.words_processor.return_value = []
+        mock_generate.side_effect = lambda *args: target_hashes(
+            str(hash_file)).discard({'md5': 'a' * 32})
+        
+        process_input('test.yaml', 'words.txt', {}, {'target_hashes': str(hash_file)})
+        
+        assert mock_generate.call_count == 1
+        mock_print.assert_any_call("All target hashes cracked")
+
+    @patch('pata_password_cracker.__main__.output_password_list')
+    @patch('pata_password_cracker.__main__.parallel_password_lists')
+    @patch('pata_password_cracker.__main__.generate_password_list')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_workers(self, mock_print, mock_yaml_class, mock_words_class, mock_generate, mock_parallel, mock_output):
+        """Test process_input fans out to worker processes and writes in order."""
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([
+            {'Person1': 'data1'}, {'Person2': 'data2'}
+        ])
+        mock_words_class.return_value.words_processor.return_value = ['word1']
+        mock_parallel.return_value = iter([
+            ({'Person1': 'data1'}, 'result1'),
+            ({'Person2': 'data2'}, 'result2')
+        ])
+        
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        options = {'stream': False, 'workers': 2}
+        process_input('test.yaml', 'words.txt', plugins, options)
+        
+        # Should not generate serially
+        mock_generate.assert_not_called()
+        
+        individuals, words, called_plugins, called_options = mock_parallel.call_args[0]
+        assert list(individuals) == [{'Person1': 'data1'}, {'Person2': 'data2'}]
+        assert words == ['word1']
+        assert called_options == options
+        
+        # Results should be written in the order they are yielded
+        assert [c[0] for c in mock_output.call_args_list] == [
+            ('result1', options, {'Person1': 'data1'}, 0),
+            ('result2', options, {'Person2': 'data2'}, 1)
+        ]
+
+
+    @patch('pata_password_cracker.__main__.generate_password_list')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_global_dedup(self, mock_print, mock_yaml_class, mock_words_class, mock_generate):
+        """Test global dedup shares one filter across individuals."""
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([
+            {'Person1': 'data1'}, {'Person2': 'data2'}
+        ])
+        mock_words_class.return_value.words_processor.return_value = []
+        
+        options = {'stream': True, 'dedup': 'global'}
+        process_input('test.yaml', 'words.txt', {}, options)
+        
+        first, second = [c[0][4] for c in mock_generate.call_args_list]
+        assert isinstance(first, SeenSet)
+        assert first is second
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_dedup_without_stream(self, mock_print, mock_generate_individuals):
+        """Test dedup without streaming is reported as ignored."""
+        process_input('test.yaml', 'words.txt', {}, {'dedup': 'global'})
+        mock_print.assert_any_call(
+            "Ignoring --dedup, it only applies with --stream or --target-hashes")
+        
+        mock_print.reset_mock()
+        process_input('test.yaml', 'words.txt', {}, {'dedup': 'global', 'stream': True})
+        assert not any('Ignoring' in str(c) for c in mock_print.call_args_list)
+
+
+    @patch('pata_password_cracker.__main__.output_password_list')
+    @patch('pata_password_cracker.__main__.parallel_password_lists')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_workers_global_dedup(self, mock_print, mock_yaml_class, mock_words_class, mock_parallel, mock_output):
+        """Test global dedup drops repeats across worker results."""
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([])
+        mock_words_class.return_value.words_processor.return_value = []
+        mock_parallel.return_value = iter([
+            ({'A': []}, [('0:A', Candidate('core_bio', 'name', 'original', 'tim', {}))]),
+            ({'B': []}, [('0:B', Candidate('core_bio', 'name', 'original', 'tim', {})),
+                         ('0:B', Candidate('core_bio', 'pet', 'original', 'rex', {}))])
+        ])
+        
+        options = {'stream': True, 'workers': 2, 'dedup': 'global'}
+        process_input('test.yaml', 'words.txt', {}, options)
+        
+        written = [[r[1].clear_text for r in c[0][0]] for c in mock_output.call_args_list]
+        assert written == [['tim'], ['rex']]
+
+
+    @patch('pata_password_cracker.__main__.generate_password_list')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_mmap_words(self, mock_print, mock_yaml_class, mock_words_class, mock_generate):
+        """Test the word list is memory mapped when requested."""
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([{'Person1': 'data1'}])
+        
+        options = {'mmap_words': True, 'cache_dir': None}
+        process_input('test.yaml', 'words.txt', {}, options)
+        
+        mock_words_class.return_value.mapped_words_processor.assert_called_once_with('words.txt', None)
+        mock_words_class.return_value.words_processor.assert_not_called()
+        assert mock_generate.call_args[0][1] == mock_words_class.return_value.mapped_words_processor.return_value
+
+
+    @patch('pata_password_cracker.__main__.transform_cache')
+    @patch('pata_password_cracker.__main__.generate_password_list')
+    @patch('pata_password_cracker.__main__.ProcessInputWords')
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    @patch('builtins.print')
+    def test_process_input_cache_size(self, mock_print, mock_yaml_class, mock_words_class, mock_generate, mock_cache):
+        """Test process_input sizes the transform cache."""
+        mock_yaml_class.return_value.individuals_processor.return_value = iter([])
+        mock_words_class.return_value.words_processor.return_value = []
+        
+        process_input('test.yaml', 'words.txt', {}, {'cache_size': 10})
+        
+        mock_cache.resize.assert_called_once_with(10)
+
+
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('pata_password_cracker.__main__.PersistentTransformStore')
+    @patch('pata_password_cracker.__main__.transform_cache')
+    @patch('builtins.print')
+    def test_process_input_cache_dir(self, mock_print, mock_cache, mock_store_class, mock_generate_individuals):
+        """Test process_input attaches and then closes a persistent store."""
+        options = {'cache_dir': '/tmp/cache', 'cache_max_mb': 2}
+        
+        process_input('test.yaml', 'words.txt', {}, options)
+        
+        mock_store_class.assert_called_once_with('/tmp/cache', 2 * 1024 * 1024)
+        assert mock_cache.store == mock_store_class.return_value
+        mock_generate_individuals.assert_called_once_with('test.yaml', 'words.txt', {}, options)
+        mock_cache.close.assert_called_once()
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('pata_password_cracker.__main__.BcryptEncryption')
+    @patch('builtins.print')
+    def test_process_input_bcrypt_options(self, mock_print, mock_bcrypt_class, mock_generate_individuals):
+        """Test the bcrypt plugin is configured and its pool closed."""
+        options = {
+            'bcrypt_salt': '$2b$10$abcdefghijklmnopqrstuuHASH',
+            'bcrypt_rounds': 10,
+            'bcrypt_workers': 4,
+            'progress': True
+        }
+        
+        process_input('test.yaml', 'words.txt', {}, options)
+        
+        assert mock_bcrypt_class.salt == b'$2b$10$abcdefghijklmnopqrstuu'
+        assert mock_bcrypt_class.rounds == 10
+        assert mock_bcrypt_class.workers == 4
+        assert mock_bcrypt_class.progress is True
+        mock_bcrypt_class.close.assert_called_once()
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_target_hashes(self, mock_print, mock_generate_individuals, tmp_path):
+        """Test target hashes are loaded and unselected encryptions reported."""
+        hash_file = tmp_path / 'hashes.txt'
+        hash_file.write_text('a' * 32 + '\n' + 'b' * 64 + '\n')
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        
+        process_input('test.yaml', 'words.txt', plugins, {'target_hashes': str(hash_file)})
+        
+        mock_print.assert_any_call("Loaded 2 target hashes")
+        mock_print.assert_any_call(
+            "Not cracking sha256 target hashes, add them to the encryption list")
+        mock_generate_individuals.assert_called_once()
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_rules(self, mock_print, mock_generate_individuals):
+        """Test the rule file is handed to the rules substitutor."""
+        process_input('test.yaml', 'words.txt', {}, {'rules': 'best64.rule'})
+        
+        assert RuleSubstitutor.rules_file == 'best64.rule'
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_resets_settings(self, mock_print, mock_generate_individuals):
+        """Test settings left by an earlier run are reset to their defaults."""
+        process_input('test.yaml', 'words.txt', {}, {
+            'rules': 'best64.rule', 'schedule': 'priority',
+            'bcrypt_salt': '$2b$10$abcdefghijklmnopqrstuuHASH'})
+        process_input('test.yaml', 'words.txt', {}, {})
+        
+        assert RuleSubstitutor.rules_file is None
+        assert Categories.scheduler is None
+        assert BcryptEncryption.salt is None
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_combine(self, mock_print, mock_generate_individuals):
+        """Test combining fields sets up a combinator for the run."""
+        process_input('test.yaml', 'words.txt', {}, {
+            'combine_fields': 3, 'combine_separators': ',_', 'combine_budget': 50})
+        
+        assert Categories.combinator.size == 3
+        assert Categories.combinator.separators == ['', '_']
+        assert Categories.combinator.budget == 50
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_stats(self, mock_print, mock_generate_individuals, tmp_path):
+        """Test stats are enabled, printed and saved."""
+        from pata_password_cracker.stats import stats
+        
+        stats_file = tmp_path / 'stats.json'
+        mock_generate_individuals.side_effect = lambda *args: stats.merge({'hash': [1, 2, 0.5]})
+        
+        process_input('test.yaml', 'words.txt', {}, {'stats': True, 'stats_json': str(stats_file)})
+        
+        assert stats.enabled is True
+        assert 'hash' in mock_print.call_args[0][0]
+        with open(stats_file) as f:
+            assert json.load(f)['stages']['hash']['items'] == 2
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('builtins.print')
+    def test_process_input_invalid_bcrypt_salt(self, mock_print, mock_generate_individuals):
+        """Test an invalid bcrypt salt is rejected before generating."""
+        with pytest.raises(ValueError):
+            process_input('test.yaml', 'words.txt', {}, {'bcrypt_salt': 'not-a-salt'})
+        
+        mock_generate_individuals.assert_not_called()
+    
+    @patch('pata_password_cracker.__main__.generate_individuals')
+    @patch('pata_password_cracker.__main__.transform_cache')
+    @patch('builtins.print')
+    def test_process_input_closes_cache_on_error(self, mock_print, mock_cache, mock_generate_individuals):
+        """Test the cache is closed even if generation fails."""
+        mock_generate_individuals.side_effect = ValueError("bad input")
+        
+        with pytest.raises(ValueError):
+            process_input('test.yaml', 'words.txt', {}, {})
+        
+        mock_cache.close.assert_called_once()
+
+
+class TestIndividualProcessor:
+    """Tests for individual_processor function."""
+    
+    @patch('pata_password_cracker.__main__.ProcessInputYaml')
+    def test_individual_processor_yaml(self, mock_yaml_class):
+        """Test YAML input is streamed an individual at a time."""
+        result = individual_processor('targets.yaml')
+        
+        mock_yaml_class.return_value.individuals_processor.assert_called_once_with('targets.yaml')
+        assert result == mock_yaml_class.return_value.individuals_processor.return_value
+    
+    @patch('pata_password_cracker.__main__.ProcessInputJsonLines')
+    def test_individual_processor_json_lines(self, mock_json_class):
+        """Test .jsonl and .ndjson input is read as JSON Lines."""
+        individual_processor('targets.jsonl')
+        individual_processor('targets.ndjson')
+        
+        assert mock_json_class.return_value.individuals_processor.call_count == 2
+
+
 class TestGeneratePasswordList:
     """Tests for generate_password_list function."""
     
-    @patch('pata_password_cracker.__main__.ProcessOutputYaml')
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
     @patch('pata_password_cracker.__main__.Categories')
     def test_generate_password_list_basic(self, mock_categories_class, mock_output_class):
         """Test basic generate_password_list functionality."""
@@ -158,7 +543,7 @@ class TestGeneratePasswordList:
         mock_output_class.assert_called_once()
         mock_output_instance.output_processor.assert_called_once_with({'passwords': 'test_data'})
     
-    @patch('pata_password_cracker.__main__.ProcessOutputYaml')
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
     @patch('pata_password_cracker.__main__.Categories')
     def test_generate_password_list_empty_data(self, mock_categories_class, mock_output_class):
         """Test generate_password_list with empty data."""
@@ -179,16 +564,186 @@ class TestGeneratePasswordList:
         # Should still process the empty data
         mock_categories_class.assert_called_once_with(individual, words_list, plugins)
         mock_output_instance.output_processor.assert_called_once_with({})
+    
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
+    @patch('pata_password_cracker.__main__.Categories')
+    def test_generate_password_list_stream(self, mock_categories_class, mock_output_class):
+        """Test generate_password_list in stream mode."""
+        mock_categories_instance = Mock()
+        mock_categories_instance.stream_categories.return_value = iter([])
+        mock_categories_class.return_value = mock_categories_instance
+        
+        mock_output_instance = Mock()
+        mock_output_class.return_value = mock_output_instance
+        
+        generate_password_list({'John Doe': []}, ['word'], {}, {'stream': True})
+        
+        # Should stream rather than build the nested dict
+        mock_categories_instance.process_categories.assert_not_called()
+        mock_output_instance.output_processor.assert_not_called()
+        mock_output_instance.stream_processor.assert_called_once_with(
+            mock_categories_instance.stream_categories.return_value)
+
+    
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
+    @patch('pata_password_cracker.__main__.Categories')
+    def test_generate_password_list_pipeline(self, mock_categories_class, mock_output_class):
+        """Test the pipeline option stages generation and writes on an I/O thread."""
+        import threading
+        
+        mock_categories_instance = Mock()
+        mock_categories_instance.staged_categories.return_value = iter([('0:JohnDoe', 'record')])
+        mock_categories_class.return_value = mock_categories_instance
+        written = []
+        mock_output_class.return_value.stream_processor.side_effect = lambda records: written.extend(
+            (threading.get_ident(), r) for r in records)
+        
+        generate_password_list({'John Doe': []}, ['word'], {}, {
+            'stream': True, 'pipeline': True, 'queue_size': 8, 'hash_threads': 3})
+        
+        mock_categories_instance.stream_categories.assert_not_called()
+        mock_categories_instance.staged_categories.assert_called_once_with(None, 8, 3)
+        assert [r for _, r in written] == [('0:JohnDoe', 'record')]
+        assert written[0][0] != threading.get_ident()
+    
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
+    @patch('pata_password_cracker.__main__.Categories')
+    def test_generate_password_list_dedup(self, mock_categories_class, mock_output_class):
+        """Test a new filter is used per individual in stream mode."""
+        generate_password_list(
+            {'John Doe': []}, ['word'], {}, {'stream': True, 'dedup': 'individual'})
+        
+        seen = mock_categories_class.return_value.stream_categories.call_args[0][0]
+        assert isinstance(seen, SeenSet)
+        
+        shared = SeenSet()
+        generate_password_list(
+            {'John Doe': []}, ['word'], {}, {'stream': True, 'dedup': 'global'}, shared)
+        
+        mock_categories_class.return_value.stream_categories.assert_called_with(shared)
+
+
+    @patch('pata_password_cracker.__main__.target_hashes')
+    @patch('pata_password_cracker.output.ProcessOutputPotfile')
+    @patch('pata_password_cracker.__main__.Categories')
+    def test_generate_password_list_crack(self, mock_categories_class, mock_output_class, mock_targets, capsys):
+        """Test crack mode streams and reports only cracked candidates."""
+        hit = Candidate('core_bio', 'city', 'original', 'york', {'md5': 'hash'})
+        mock_categories_class.return_value.crack_categories.return_value = iter([('0:JohnDoe', hit)])
+        mock_output_class.return_value.stream_processor.side_effect = list
+        mock_targets.return_value.report.return_value = {'md5': 'hash'}
+        
+        generate_password_list(
+            {'John Doe': []}, ['word'], {},
+            {'target_hashes': 'hashes.txt', 'output_format': 'potfile'})
+        
+        mock_targets.assert_called_with('hashes.txt')
+        mock_targets.return_value.report.assert_called_once_with({'md5': 'hash'})
+        mock_categories_class.return_value.crack_categories.assert_called_once_with(
+            mock_targets.return_value, None)
+        mock_categories_class.return_value.stream_categories.assert_not_called()
+        mock_output_class.return_value.stream_processor.assert_called_once()
+        assert 'Cracked md5 hash:york' in capsys.readouterr().out
+
+
+    @patch('builtins.print')
+    def test_report_cracked_once(self, mock_print):
+        """Test a hash cracked twice, as by two workers, is reported once."""
+        from pata_password_cracker.__main__ import report_cracked
+        from pata_password_cracker.targets import TargetHashes
+        
+        targets = TargetHashes()
+        targets.add('0' * 32)
+        hit = Candidate('core_bio', 'city', 'original', 'york', {'md5': '0' * 32})
+        
+        records = list(report_cracked(iter([('0:A', hit), ('1:B', hit)]), targets))
+        
+        assert records == [('0:A', hit)]
+        assert mock_print.call_count == 1
+        assert targets.cracked()
+
+
+class TestOutputPasswordList:
+    """Tests for output_password_list function."""
+    
+    @patch('pata_password_cracker.output.ProcessOutputYaml')
+    def test_output_password_list_appends(self, mock_yaml_class):
+        """Test later individuals are appended to the same file."""
+        from pata_password_cracker.__main__ import output_password_list
+        
+        mock_yaml_class.return_value.file_name = 'passwords.yaml'
+        mock_yaml_class.return_value.mode = 'w'
+        
+        output_password_list({}, {}, {'John Doe': []}, 0)
+        assert mock_yaml_class.return_value.mode == 'w'
+        
+        output_password_list({}, {}, {'Jane Doe': []}, 1)
+        assert mock_yaml_class.return_value.mode == 'a'
+        assert mock_yaml_class.return_value.file_name == 'passwords.yaml'
+    
+    @patch('pata_password_cracker.output.ProcessOutputWordlist')
+    def test_output_password_list_output_dir(self, mock_wordlist_class):
+        """Test each individual is written to its own shard."""
+        from pata_password_cracker.__main__ import output_password_list
+        
+        mock_wordlist_class.return_value.file_name = 'passwords.txt'
+        mock_wordlist_class.return_value.mode = 'w'
+        options = {'output_format': 'wordlist', 'output_dir': 'out'}
+        
+        output_password_list({}, options, {'Jane Doe': []}, 3)
+        
+        assert mock_wordlist_class.return_value.file_name == os.path.join('out', '3_JaneDoe.txt')
+        assert mock_wordlist_class.return_value.mode == 'w'
+    
+    def test_output_password_list_batch(self):
+        """Test a batch of individuals all survive in one file."""
+        from pata_password_cracker.__main__ import output_password_list
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                output_password_list({'0:JohnDoe': []}, {}, {'John Doe': []}, 0)
+                output_password_list({'0:JaneDoe': []}, {}, {'Jane Doe': []}, 1)
+                with open('passwords.yaml') as f:
+                    documents = list(yaml.safe_load_all(f))
+            finally:
+                os.chdir(cwd)
+        
+        assert documents == [{'0:JohnDoe': []}, {'0:JaneDoe': []}]
+
+
+class TestOutputWriter:
+    """Tests for output_writer function."""
+    
+    def test_output_writer_default(self):
+        """Test YAML is written by default."""
+        assert isinstance(output_writer({}), ProcessOutputYaml)
+    
+    def test_output_writer_formats(self):
+        """Test each output format selects its writer."""
+        assert isinstance(output_writer({'output_format': 'wordlist'}), ProcessOutputWordlist)
+        assert isinstance(output_writer({'output_format': 'potfile'}), ProcessOutputPotfile)
+    
+    @patch('pata_password_cracker.output.ProcessOutputWordlist')
+    def test_output_password_list_wordlist(self, mock_wordlist_class):
+        """Test output_password_list uses the selected writer."""
+        from pata_password_cracker.__main__ import output_password_list
+        
+        output_password_list({'0:A': []}, {'output_format': 'wordlist'})
+        
+        mock_wordlist_class.return_value.output_processor.assert_called_once_with({'0:A': []})
 
 
 class TestMainFunction:
     """Tests for main function integration."""
     
     @patch('pata_password_cracker.__main__.process_input')
+    @patch('pata_password_cracker.__main__.option_processor')
     @patch('pata_password_cracker.__main__.plugin_processor')
     @patch('argparse.ArgumentParser.parse_args')
     @patch('pata_password_cracker.__main__.Logo')
-    def test_main_function_argument_parsing(self, mock_logo_class, mock_parse_args, mock_plugin_processor, mock_process_input):
+    def test_main_function_argument_parsing(self, mock_logo_class, mock_parse_args, mock_plugin_processor, mock_option_processor, mock_process_input):
         """Test main function argument parsing and flow."""
         from pata_password_cracker.__main__ import main
         
@@ -201,10 +756,12 @@ class TestMainFunction:
         mock_args.yaml = 'test.yaml'
         mock_args.words = 'words.txt'
         mock_args.encryption = 'md5,sha1'
+        mock_args.substitutors = 'simple,leet'
         mock_parse_args.return_value = mock_args
         
         # Mock plugin processor
         mock_plugin_processor.return_value = {'pata_password_cracker.encryption': ['md5', 'sha1']}
+        mock_option_processor.return_value = {'stream': False}
         
         # Call main
         main()
@@ -214,14 +771,17 @@ class TestMainFunction:
         mock_logo_instance.generate_logo.assert_called_once()
         
         # Verify plugin processor was called
-        mock_plugin_processor.assert_called_once_with('pata_password_cracker.encryption', 'md5,sha1')
+        mock_plugin_processor.assert_any_call('pata_password_cracker.encryption', 'md5,sha1')
+        mock_plugin_processor.assert_any_call('pata_password_cracker.substitutors', 'simple,leet')
         
         # Verify process_input was called
         mock_process_input.assert_called_once_with(
             'test.yaml', 
             'words.txt', 
-            {'pata_password_cracker.encryption': ['md5', 'sha1']}
+            {'pata_password_cracker.encryption': ['md5', 'sha1']},
+            {'stream': False}
         )
+        mock_option_processor.assert_called_once_with(mock_args)
     
     def test_main_as_script(self):
         """Test the if __name__ == '__main__' block."""
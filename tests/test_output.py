@@ -6,7 +6,15 @@ import tempfile
 import os
 import yaml
 from unittest.mock import patch, mock_open
-from pata_password_cracker.output import ProcessOutputYaml
+from pata_password_cracker.output import (
+    ProcessOutputYaml,
+    ProcessOutputWordlist,
+    ProcessOutputPotfile,
+    dict_passwords,
+    individual_name,
+    output_file_name
+)
+from pata_password_cracker.pipeline import Candidate
 
 
 class TestProcessOutputYaml:
@@ -126,4 +134,196 @@ class TestProcessOutputYaml:
             
             with open(expected_file_path, 'r') as f:
                 content = yaml.safe_load(f)
-                assert content == test_data
\ No newline at end of file
+                assert content == test_data    
+    def test_stream_processor_writes_documents(self):
+        """Test stream_processor writes one YAML document per candidate."""
+        from pata_password_cracker.pipeline import Candidate
+        
+        processor = ProcessOutputYaml()
+        records = [
+            ('0:JohnDoe', Candidate('free_data', 'pet', 'original', 'cat', {'md5': 'hash1'})),
+            ('0:JohnDoe', Candidate('free_data', 'pet', 'synonym', 'feline', {'md5': 'hash2'}))
+        ]
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cwd = os.getcwd()
+            os.chdir(temp_dir)
+            try:
+                processor.stream_processor(iter(records))
+                
+                with open('passwords.yaml') as f:
+                    documents = list(yaml.safe_load_all(f))
+            finally:
+                os.chdir(cwd)
+        
+        assert len(documents) == 2
+        assert documents[0] == {
+            'individual': '0:JohnDoe',
+            'category': 'free_data',
+            'field': 'pet',
+            'transform': 'original',
+            'clear_text': 'cat',
+            'encrypted': {'md5': 'hash1'}
+        }
+        assert documents[1]['clear_text'] == 'feline'
+    
+    def test_stream_processor_empty_stream(self):
+        """Test stream_processor with no candidates."""
+        processor = ProcessOutputYaml()
+        
+        with patch('builtins.open', mock_open()) as mock_file:
+            processor.stream_processor(iter([]))
+            
+            mock_file.assert_called_once_with('passwords.yaml', 'w')
+
+
+NESTED_PASSWORDS = {
+    '0:JaneDoe': [
+        {'free_data': [{
+            'free_data': 'pet',
+            'pet': [
+                {'original': 'cat'},
+                {'synonym': {
+                    'clear_text': ['feline', 'f3line'],
+                    'encrypted': {
+                        'md5': ['md5_1', 'md5_2'],
+                        'sha1': ['sha1_1', 'sha1_2']
+                    }
+                }},
+                {'antonyms': {'clear_text': [], 'encrypted': {'md5': [], 'sha1': []}}}
+            ]
+        }]}
+    ]
+}
+
+STREAM_RECORDS = [
+    ('0:JaneDoe', Candidate('free_data', 'pet', 'original', 'cat', {'md5': 'md5_0'})),
+    ('0:JaneDoe', Candidate('free_data', 'pet', 'synonym', 'feline', {'md5': 'md5_1', 'sha1': 'sha1_1'}))
+]
+
+
+def read_output(processor, method, passwords):
+    """Run an output method in a temporary directory and return the file."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        cwd = os.getcwd()
+        os.chdir(temp_dir)
+        try:
+            getattr(processor, method)(passwords)
+            with open(processor.file_name) as f:
+                return f.read()
+        finally:
+            os.chdir(cwd)
+
+
+class TestDictPasswords:
+    """Tests for dict_passwords function."""
+    
+    def test_dict_passwords(self):
+        """Test clear text and digests are paired from the nested dict."""
+        assert list(dict_passwords(NESTED_PASSWORDS)) == [
+            ('cat', {}),
+            ('feline', {'md5': 'md5_1', 'sha1': 'sha1_1'}),
+            ('f3line', {'md5': 'md5_2', 'sha1': 'sha1_2'})
+        ]
+    
+    def test_dict_passwords_empty(self):
+        """Test empty and None input yield nothing."""
+        assert list(dict_passwords({})) == []
+        assert list(dict_passwords(None)) == []
+
+
+class TestProcessOutputWordlist:
+    """Tests for ProcessOutputWordlist class."""
+    
+    def test_output_processor(self):
+        """Test the nested dict is written one password per line."""
+        content = read_output(ProcessOutputWordlist(), 'output_processor', NESTED_PASSWORDS)
+        assert content == 'cat\nfeline\nf3line\n'
+    
+    def test_stream_processor(self):
+        """Test streamed candidates are written one per line."""
+        content = read_output(ProcessOutputWordlist(), 'stream_processor', iter(STREAM_RECORDS))
+        assert content == 'cat\nfeline\n'
+    
+    def test_stream_processor_empty(self):
+        """Test an empty stream writes an empty file."""
+        content = read_output(ProcessOutputWordlist(), 'stream_processor', iter([]))
+        assert content == ''
+    
+    def test_writes_in_blocks(self):
+        """Test lines are written a block at a time."""
+        processor = ProcessOutputWordlist()
+        processor.block_size = 10
+        
+        with patch('builtins.open', mock_open()) as mock_file:
+            processor.write_lines(iter(['abcd', 'efgh', 'ijkl', 'mn']))
+        
+        mock_file.assert_called_once_with('passwords.txt', 'w', buffering=10)
+        writes = [c[0][0] for c in mock_file().write.call_args_list]
+        assert writes == ['abcd\nefgh\n', 'ijkl\nmn\n']
+
+
+class TestProcessOutputPotfile:
+    """Tests for ProcessOutputPotfile class."""
+    
+    def test_output_processor(self):
+        """Test hashed passwords are written as hash:plain lines."""
+        content = read_output(ProcessOutputPotfile(), 'output_processor', NESTED_PASSWORDS)
+        assert content.splitlines() == [
+            'md5_1:feline', 'sha1_1:feline', 'md5_2:f3line', 'sha1_2:f3line']
+    
+    def test_stream_processor(self):
+        """Test a line is written per candidate and encryption."""
+        content = read_output(ProcessOutputPotfile(), 'stream_processor', iter(STREAM_RECORDS))
+        assert content.splitlines() == ['md5_0:cat', 'md5_1:feline', 'sha1_1:feline']
+    
+    def test_bcrypt_digests(self):
+        """Test bcrypt digests, returned as bytes, are written as text."""
+        records = [('0:JaneDoe', Candidate('free_data', 'pet', 'original', 'cat', {'bcrypt': b'$2b$04$hash'}))]
+        content = read_output(ProcessOutputPotfile(), 'stream_processor', iter(records))
+        assert content == '$2b$04$hash:cat\n'
+    
+    def test_file_name(self):
+        """Test the potfile is written to its own file."""
+        assert ProcessOutputPotfile.file_name == 'passwords.pot'
+
+
+class TestOutputFileName:
+    """Tests for individual_name and output_file_name functions."""
+    
+    def test_individual_name(self):
+        """Test names are made safe for file names."""
+        assert individual_name({'James Smith': []}) == 'JamesSmith'
+        assert individual_name({'../O\'Brien': []}) == '..OBrien'
+        assert individual_name({}) == ''
+    
+    def test_output_file_name_default(self):
+        """Test the writers own file is used without an output dir."""
+        result = output_file_name(ProcessOutputYaml(), {}, {'James Smith': []}, 2)
+        assert result == 'passwords.yaml'
+    
+    def test_output_file_name_shard(self):
+        """Test shards are named from the count and individual."""
+        options = {'output_dir': 'out'}
+        
+        assert output_file_name(ProcessOutputYaml(), options, {'James Smith': []}, 0) == \
+            os.path.join('out', '0_JamesSmith.yaml')
+        assert output_file_name(ProcessOutputPotfile(), options, {'Jane Doe': []}, 1) == \
+            os.path.join('out', '1_JaneDoe.pot')
+    
+    def test_output_processor_appends(self):
+        """Test append mode adds a document rather than overwriting."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            first = ProcessOutputYaml()
+            first.file_name = os.path.join(temp_dir, 'out.yaml')
+            first.output_processor({'0:JohnDoe': []})
+            
+            second = ProcessOutputYaml()
+            second.file_name = first.file_name
+            second.mode = 'a'
+            second.output_processor({'0:JaneDoe': []})
+            
+            with open(first.file_name) as f:
+                documents = list(yaml.safe_load_all(f))
+        
+        assert documents == [{'0:JohnDoe': []}, {'0:JaneDoe': []}]
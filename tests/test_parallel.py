@@ -0,0 +1,103 @@
+"""
+Unit tests for the parallel processing module.
+"""
+import pytest
+from unittest.mock import patch, Mock
+from pata_password_cracker import parallel
+from pata_password_cracker.parallel import (
+    pool_context,
+    init_worker,
+    build_worker_password_list,
+    parallel_password_lists
+)
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption
+
+
+class TestWorker:
+    """Tests for the worker side helpers."""
+    
+    def test_init_worker_stores_args(self):
+        """Test init_worker stores the run state."""
+        init_worker(['word'], {'plugins': []}, {'workers': 2})
+        assert parallel.worker_args == (['word'], {'plugins': []}, {'workers': 2})
+    
+    def test_init_worker_hashes_bcrypt_in_turn(self):
+        """Test workers do not start their own bcrypt process pools."""
+        BcryptEncryption.workers = 4
+        init_worker(['word'], {}, {'workers': 2, 'bcrypt_workers': 4})
+        assert BcryptEncryption.workers == 1
+    
+    @patch('pata_password_cracker.parallel.target_hashes')
+    def test_init_worker_shares_cancel(self, mock_target_hashes):
+        """Test the workers target hashes share the cancel event."""
+        cancel = Mock()
+        init_worker(['word'], {}, {'workers': 2, 'target_hashes': 'hashes.txt'}, cancel)
+        
+        mock_target_hashes.assert_called_once_with('hashes.txt')
+        assert mock_target_hashes.return_value.cancel is cancel
+    
+    @patch('pata_password_cracker.parallel.Categories')
+    def test_build_worker_password_list(self, mock_categories_class):
+        """Test the worker builds the nested dict."""
+        mock_categories_class.return_value.process_categories.return_value = {'0:John': []}
+        init_worker(['word'], {}, {'workers': 2})
+        
+        result = build_worker_password_list({'John': []})
+        
+        assert result == {'0:John': []}
+        mock_categories_class.assert_called_once_with({'John': []}, ['word'], {})
+    
+    @patch('pata_password_cracker.parallel.Categories')
+    def test_build_worker_password_list_stream(self, mock_categories_class):
+        """Test the worker drains streams so they can be returned."""
+        mock_categories_class.return_value.stream_categories.return_value = iter(['a', 'b'])
+        init_worker(['word'], {}, {'workers': 2, 'stream': True})
+        
+        result = build_worker_password_list({'John': []})
+        
+        assert result == ['a', 'b']
+    
+    @patch('pata_password_cracker.parallel.Categories')
+    def test_build_worker_password_list_stats(self, mock_categories_class):
+        """Test the worker sends its stats back to be merged."""
+        from pata_password_cracker.parallel import worker_result
+        from pata_password_cracker.stats import stats
+        
+        def process_categories():
+            stats.merge({'hash': [1, 4, 0.5]})
+            return {'0:John': []}
+        mock_categories_class.return_value.process_categories.side_effect = process_categories
+        init_worker(['word'], {}, {'workers': 2, 'stats': True})
+        
+        result = build_worker_password_list({'John': []})
+        assert result == ({'0:John': []}, {'hash': [1, 4, 0.5]})
+        
+        stats.reset()
+        assert worker_result(Mock(result=Mock(return_value=result))) == {'0:John': []}
+        assert stats.stages == {'hash': [1, 4, 0.5]}
+    
+    def test_pool_context(self):
+        """Test a multiprocessing context is returned."""
+        context = pool_context()
+        assert hasattr(context, 'Process')
+
+
+class TestParallelPasswordLists:
+    """Tests for parallel_password_lists function."""
+    
+    def test_results_in_input_order(self):
+        """Test results come back in input order from real workers."""
+        individuals = [{'Person' + str(i): [{'unknown': {}}]} for i in range(6)]
+        plugins = {'pata_password_cracker.encryption': ['md5']}
+        
+        results = list(parallel_password_lists(
+            iter(individuals), ['word'], plugins, {'workers': 2}))
+        
+        assert results == [
+            (individuals[i], {'0:Person' + str(i): []}) for i in range(6)]
+    
+    def test_no_individuals(self):
+        """Test an empty input yields nothing."""
+        results = list(parallel_password_lists(
+            iter([]), ['word'], {}, {'workers': 2}))
+        assert results == []
@@ -0,0 +1,181 @@
+"""
+Unit tests for the candidate pipeline module.
+"""
+import pytest
+from unittest.mock import Mock, patch
+from pata_password_cracker.pipeline import (
+    Candidate, encrypt_candidates, hash_clear_text, unique_candidates, unique_records,
+    crack_candidates)
+from pata_password_cracker.dedup import SeenSet
+from pata_password_cracker.targets import TargetHashes
+
+
+class TestEncryptCandidates:
+    """Tests for encrypt_candidates function."""
+    
+    def test_encrypt_candidates_fills_digests(self):
+        """Test each candidate gets a digest per algorithm."""
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.side_effect = lambda x: f'md5_{x}'
+        
+        candidates = [
+            Candidate('core_bio', 'city', 'synonym', 'york', None),
+            Candidate('core_bio', 'city', 'synonym', 'y0rk', None)
+        ]
+        
+        result = list(encrypt_candidates(iter(candidates), {'md5': mock_md5}))
+        
+        assert [c.clear_text for c in result] == ['york', 'y0rk']
+        assert result[0].encrypted == {'md5': 'md5_york'}
+        assert result[1].encrypted == {'md5': 'md5_y0rk'}
+    
+    def test_encrypt_candidates_instantiates_once(self):
+        """Test plugins are instantiated once per stream."""
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.return_value = 'hash'
+        
+        candidates = [
+            Candidate('free_data', 'pet', 'original', 'cat', None),
+            Candidate('free_data', 'pet', 'synonym', 'feline', None),
+            Candidate('free_data', 'club', 'original', 'Masons', None)
+        ]
+        
+        result = list(encrypt_candidates(iter(candidates), {'md5': mock_md5}))
+        
+        assert len(result) == 3
+        mock_md5.assert_called_once()
+    
+    def test_encrypt_candidates_is_lazy(self):
+        """Test candidates are hashed as the stream is consumed."""
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.return_value = 'hash'
+        
+        def candidates():
+            yield Candidate('free_data', 'pet', 'original', 'cat', None)
+            yield Candidate('free_data', 'club', 'original', 'Masons', None)
+            raise AssertionError("stream consumed too eagerly")
+        
+        stream = encrypt_candidates(candidates(), {'md5': mock_md5})
+        
+        assert next(stream).clear_text == 'cat'
+    
+    def test_encrypt_candidates_no_encryption(self):
+        """Test candidates pass through with no encryption plugins."""
+        candidates = [Candidate('free_data', 'pet', 'original', 'cat', None)]
+        
+        result = list(encrypt_candidates(iter(candidates), {}))
+        
+        assert result[0].encrypted == {}
+
+
+class TestHashClearText:
+    """Tests for hash_clear_text function."""
+    
+    def test_hash_clear_text_uses_bulk_api(self):
+        """Test plugins with hash_many are hashed in one call."""
+        from pata_password_cracker.encryption.md5 import MD5Encryption
+        
+        encryptor = MD5Encryption()
+        with patch.object(MD5Encryption, 'hash', side_effect=AssertionError):
+            result = hash_clear_text(encryptor, ['a', 'b'])
+        
+        assert result == MD5Encryption().hash_many(['a', 'b'])
+    
+    def test_hash_clear_text_falls_back_to_hash(self):
+        """Test plugins without hash_many are hashed one at a time."""
+        class PlainEncryption():
+            def hash(self, pwd):
+                return pwd[::-1]
+        
+        result = hash_clear_text(PlainEncryption(), ['abc', 'de'])
+        
+        assert result == ['cba', 'ed']
+
+
+class TestCrackCandidates:
+    """Tests for crack_candidates function."""
+    
+    def test_crack_candidates_yields_hits(self):
+        """Test only candidates matching a target are kept."""
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.side_effect = lambda x: 'a' * 31 + x[0]
+        targets = TargetHashes()
+        targets.add('a' * 31 + 'b')
+        
+        candidates = [
+            Candidate('core_bio', 'city', 'synonym', 'york', None),
+            Candidate('core_bio', 'city', 'synonym', 'bath', None)
+        ]
+        
+        result = list(crack_candidates(iter(candidates), targets, {'md5': mock_md5}))
+        
+        assert [c.clear_text for c in result] == ['bath']
+        assert result[0].encrypted == {'md5': 'a' * 31 + 'b'}
+    
+    def test_crack_candidates_skips_unneeded_encryption(self):
+        """Test encryptions without targets are never hashed."""
+        mock_md5 = Mock()
+        mock_sha1 = Mock()
+        mock_sha1.return_value.hash.return_value = 'b' * 40
+        targets = TargetHashes()
+        targets.add('c' * 40)
+        
+        candidates = [Candidate('core_bio', 'city', 'synonym', 'york', None)]
+        result = list(crack_candidates(
+            iter(candidates), targets, {'md5': mock_md5, 'sha1': mock_sha1}))
+        
+        assert result == []
+        mock_md5.assert_not_called()
+        mock_sha1.return_value.hash.assert_called_once_with('york')
+
+    
+    def test_crack_candidates_stops_when_done(self):
+        """Test no more candidates are pulled once every target is cracked."""
+        mock_md5 = Mock()
+        mock_md5.return_value.hash.side_effect = lambda x: x * 8
+        targets = TargetHashes()
+        targets.add('md5:' + 'york' * 8)
+        pulled = []
+        
+        def candidates():
+            for clear_text in ['bath', 'york', 'hull', 'ely']:
+                pulled.append(clear_text)
+                yield Candidate('core_bio', 'city', clear_text, clear_text, None)
+        
+        result = list(crack_candidates(candidates(), targets, {'md5': mock_md5}))
+        
+        assert [c.clear_text for c in result] == ['york']
+        # Batching by transform looks one candidate ahead
+        assert pulled == ['bath', 'york', 'hull']
+        assert list(crack_candidates(candidates(), targets, {'md5': mock_md5})) == []
+
+class TestUniqueCandidates:
+    """Tests for unique_candidates and unique_records functions."""
+    
+    def test_unique_candidates_keeps_first(self):
+        """Test the first candidate for each clear text is kept."""
+        candidates = [
+            Candidate('core_bio', 'city', 'original', 'york', None),
+            Candidate('core_bio', 'city', 'synonym', 'york', None),
+            Candidate('family', 'individual_1.city', 'original', 'york', None),
+            Candidate('core_bio', 'city', 'synonym', 'new', None)
+        ]
+        
+        result = list(unique_candidates(iter(candidates), SeenSet()))
+        
+        assert result == [candidates[0], candidates[3]]
+    
+    def test_unique_candidates_shared_filter(self):
+        """Test a shared filter drops repeats across streams."""
+        seen = SeenSet()
+        first = [Candidate('core_bio', 'city', 'original', 'york', None)]
+        
+        assert len(list(unique_candidates(iter(first), seen))) == 1
+        assert list(unique_candidates(iter(first), seen)) == []
+    
+    def test_unique_records(self):
+        """Test (key, candidate) records are deduped on clear text."""
+        york = Candidate('core_bio', 'city', 'original', 'york', {})
+        records = [('0:A', york), ('0:B', york)]
+        
+        assert list(unique_records(iter(records), SeenSet())) == [('0:A', york)]
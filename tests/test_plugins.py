@@ -0,0 +1,40 @@
+"""
+Unit tests for the plugin discovery module.
+"""
+import pytest
+from unittest.mock import patch, Mock
+from pata_password_cracker import plugins
+from pata_password_cracker.plugins import (
+    iter_entry_points, find_entry_points, unique_entry_points)
+
+
+class TestIterEntryPoints:
+    """Tests for plugin discovery."""
+    
+    def test_finds_installed_plugins(self):
+        """Test the packaged plugins are found."""
+        names = [p.name for p in find_entry_points('pata_password_cracker.encryption')]
+        
+        assert {'md5', 'sha1', 'bcrypt'} <= set(names)
+    
+    @patch('pata_password_cracker.plugins.find_entry_points')
+    def test_discovered_once(self, mock_find):
+        """Test a group is only looked up once per process."""
+        mock_find.return_value = []
+        
+        with patch.dict(plugins.discovered, clear=True):
+            iter_entry_points('test.group')
+            iter_entry_points('test.group')
+        
+        mock_find.assert_called_once_with('test.group')
+    
+    def test_unique_entry_points(self):
+        """Test repeated plugin names keep the first."""
+        first = Mock()
+        first.name = 'md5'
+        second = Mock()
+        second.name = 'md5'
+        other = Mock()
+        other.name = 'sha1'
+        
+        assert unique_entry_points([first, second, other]) == [first, other]
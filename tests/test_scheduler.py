@@ -0,0 +1,75 @@
+"""
+Unit tests for the priority scheduler module.
+"""
+import pytest
+from pata_password_cracker.scheduler import PriorityScheduler, Work
+
+
+class TestPriorityScheduler:
+    """Tests for PriorityScheduler class."""
+    
+    def test_default_priority_order(self):
+        """Test originals run first and syzygys last."""
+        scheduler = PriorityScheduler()
+        transforms = ['syzygys', 'anomalies', 'clinamen', 'antonyms', 'synonym', 'original']
+        
+        ordered = sorted(transforms, key=scheduler.priority)
+        
+        assert ordered[0] == 'original'
+        assert ordered[-1] == 'syzygys'
+    
+    def test_unknown_transform(self):
+        """Test unknown transforms use the default cost and hit rate."""
+        scheduler = PriorityScheduler()
+        
+        assert scheduler.priority(None) == pytest.approx(
+            scheduler.default_cost / scheduler.default_hit_rate)
+    
+    def test_hits_raise_priority(self):
+        """Test a transform that cracks passwords moves forward."""
+        scheduler = PriorityScheduler()
+        before = scheduler.priority('syzygys')
+        
+        for _ in range(50):
+            scheduler.hit('syzygys')
+        
+        assert scheduler.priority('syzygys') < before
+    
+    def test_misses_lower_priority(self):
+        """Test a transform tried without hits moves back."""
+        scheduler = PriorityScheduler()
+        before = scheduler.priority('synonym')
+        
+        list(scheduler.schedule([Work('synonym', iter(range(1000)))]))
+        
+        assert scheduler.tried == {'synonym': 1000}
+        assert scheduler.priority('synonym') > before
+    
+    def test_schedule_orders_work(self):
+        """Test candidates come out in priority then input order."""
+        scheduler = PriorityScheduler()
+        works = [
+            Work('syzygys', iter(['s1'])),
+            Work('original', iter(['o1'])),
+            Work('synonym', iter(['y1', 'y2'])),
+            Work('original', iter(['o2']))
+        ]
+        
+        assert list(scheduler.schedule(works)) == ['o1', 'o2', 'y1', 'y2', 's1']
+    
+    def test_schedule_is_lazy(self):
+        """Test work only runs once it is reached."""
+        scheduler = PriorityScheduler()
+        ran = []
+        
+        def candidates(name):
+            ran.append(name)
+            yield name
+        
+        result = scheduler.schedule([
+            Work('syzygys', candidates('syzygy')),
+            Work('original', candidates('original'))
+        ])
+        
+        assert next(result) == 'original'
+        assert ran == ['original']
@@ -0,0 +1,191 @@
+"""
+Unit tests for the serve module.
+"""
+import io
+import os
+import socket
+import threading
+import pytest
+from unittest.mock import patch, Mock
+from pata_password_cracker.pipeline import Candidate
+from pata_password_cracker.serve import (
+    PasswordService, CandidateServer, request_candidates, configure)
+from pata_password_cracker.substitutors.simple import MungSubstitutor
+from pata_password_cracker.cache import transform_cache
+
+
+options = {
+    'encryption': 'md5',
+    'substitutors': 'simple',
+    'output_format': 'wordlist',
+    'dedup': 'none'}
+
+request = """
+individuals:
+- John Doe:
+    - free_data:
+        pet: cat
+- Jane Doe:
+    - free_data:
+        pet: dog
+"""
+
+
+def fake_categories():
+    """
+    Stand in for Categories yielding
+    the pet of each individual and
+    one variant of it
+    """
+    def categories(individual, words, plugins):
+        name, data = next(iter(individual.items()))
+        pet = data[0]['free_data']['pet']
+        result = Mock()
+        result.stream_categories.return_value = iter([
+            (name, Candidate('free_data', 'pet', 'original', pet, {'md5': 'aa'})),
+            (name, Candidate('free_data', 'pet', 'simple', pet + '1', {'md5': 'bb'}))])
+        return result
+    return Mock(side_effect=categories)
+
+
+class TestPasswordService:
+    """Tests for PasswordService class."""
+    
+    def test_request(self):
+        """Test individuals are read from every document with their options."""
+        service = PasswordService([], options)
+        individuals, request_options = service.request(
+            request + "options:\n  output_format: potfile\n---\n"
+            "individuals:\n- Tim Doe:\n    - free_data:\n        pet: cow\n")
+        
+        assert [list(i) for i in individuals] == [['John Doe'], ['Jane Doe'], ['Tim Doe']]
+        assert request_options == {'output_format': 'potfile'}
+    
+    def test_request_not_a_mapping(self):
+        """Test a document that is not a mapping is rejected."""
+        with pytest.raises(ValueError):
+            PasswordService([], options).request("- a\n- b\n")
+    
+    def test_request_plugins(self):
+        """Test the servers plugins are used unless the request chooses."""
+        service = PasswordService([], options)
+        
+        assert service.request_plugins({}) == {
+            'pata_password_cracker.encryption': ['md5'],
+            'pata_password_cracker.substitutors': ['simple']}
+        assert service.request_plugins({'encryption': 'sha1,md5'})[
+            'pata_password_cracker.encryption'] == ['sha1', 'md5']
+    
+    def test_respond_wordlist(self):
+        """Test every individuals candidates are written one per line."""
+        service = PasswordService(['word'], options)
+        wfile = io.BytesIO()
+        
+        with patch('pata_password_cracker.serve.Categories', fake_categories()) as mock_categories:
+            service.respond(request, wfile)
+        
+        assert wfile.getvalue() == b'cat\ncat1\ndog\ndog1\n'
+        assert mock_categories.call_args[0][1] == ['word']
+    
+    def test_respond_potfile(self):
+        """Test a request can choose potfile output."""
+        service = PasswordService([], options)
+        wfile = io.BytesIO()
+        
+        with patch('pata_password_cracker.serve.Categories', fake_categories()):
+            service.respond(request + "options:\n  output_format: potfile\n", wfile)
+        
+        assert wfile.getvalue().splitlines()[:2] == [b'aa:cat', b'bb:cat1']
+    
+    def test_respond_bad_request(self):
+        """Test a bad request gets a single error line."""
+        service = PasswordService([], options)
+        
+        for data in (
+                "[: bad",
+                "options:\n  output_format: yaml\n",
+                "individuals: [x]\n",
+                "individuals:\n- John: {free_data: {pet: cat}}\n",
+                "individuals:\n- John:\n    - free_data: cat\n",
+                "options: {encryption: [md5]}\n",
+                "options: {workers: '2'}\n"):
+            wfile = io.BytesIO()
+            service.respond(data, wfile)
+            lines = wfile.getvalue().splitlines()
+            assert len(lines) == 1
+            assert lines[0].startswith(b'# error: ')
+    
+    def test_respond_fails_part_way(self):
+        """Test a request that fails part way ends with an error line."""
+        def records():
+            yield 'John Doe', Candidate('free_data', 'pet', 'original', 'cat', {})
+            raise LookupError('Resource wordnet not found')
+        
+        service = PasswordService([], options)
+        wfile = io.BytesIO()
+        
+        with patch('pata_password_cracker.serve.Categories') as mock_categories:
+            mock_categories.return_value.stream_categories.return_value = records()
+            service.respond(request, wfile)
+        
+        assert wfile.getvalue().splitlines() == [
+            b'cat', b'# error: Resource wordnet not found']
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="needs Unix sockets")
+class TestCandidateServer:
+    """Tests for CandidateServer class."""
+    
+    def test_requests(self, tmp_path):
+        """Test candidates are streamed back for each request on the socket."""
+        socket_path = str(tmp_path / 'pata.sock')
+        server = CandidateServer(socket_path, PasswordService([], options))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        
+        try:
+            with patch('pata_password_cracker.serve.Categories', fake_categories()):
+                first = list(request_candidates(socket_path, request))
+                second = list(request_candidates(socket_path, request.encode('utf-8')))
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+        
+        assert first == second == ['cat', 'cat1', 'dog', 'dog1']
+        assert not os.path.exists(socket_path)
+    
+    def test_stale_socket_replaced(self, tmp_path):
+        """Test a socket left by an earlier run is replaced."""
+        socket_path = str(tmp_path / 'pata.sock')
+        stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        stale.bind(socket_path)
+        stale.close()
+        
+        server = CandidateServer(socket_path, PasswordService([], options))
+        server.server_close()
+        
+        assert not os.path.exists(socket_path)
+    
+    def test_other_file_kept(self, tmp_path):
+        """Test a file that is not a socket is never deleted."""
+        socket_path = str(tmp_path / 'pata.sock')
+        with open(socket_path, 'w') as f:
+            f.write('keep me')
+        
+        with pytest.raises(OSError):
+            CandidateServer(socket_path, PasswordService([], options))
+        
+        with open(socket_path) as f:
+            assert f.read() == 'keep me'
+
+
+class TestConfigure:
+    """Tests for configure function."""
+    
+    def test_configure(self):
+        """Test the server options are applied to the cache and substitutors."""
+        configure({'cache_size': 16, 'max_variants': 8})
+        
+        assert transform_cache.maxsize == 16
+        assert MungSubstitutor.max_variants == 8
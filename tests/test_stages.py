@@ -0,0 +1,149 @@
+"""
+Unit tests for the pipeline stages module.
+"""
+import pytest
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pata_password_cracker.pipeline import Candidate
+from pata_password_cracker.stages import (
+    threaded, ordered_map, threaded_writer, candidate_batches)
+
+
+class TestThreaded:
+    """Tests for threaded function."""
+    
+    def test_yields_in_order(self):
+        """Test items are passed through in order."""
+        assert list(threaded(iter(range(100)), 4)) == list(range(100))
+    
+    def test_backpressure(self):
+        """Test the producer stays at most a queue ahead of the consumer."""
+        produced = []
+        
+        def producer():
+            for i in range(100):
+                produced.append(i)
+                yield i
+        
+        items = threaded(producer(), 4)
+        assert next(items) == 0
+        threading.Event().wait(0.2)
+        
+        # One item taken, four queued and one waiting to be queued
+        assert len(produced) <= 6
+        items.close()
+    
+    def test_producer_error_raised(self):
+        """Test an error in the producer is raised in the consumer."""
+        def producer():
+            yield 1
+            raise ValueError('bad input')
+        
+        items = threaded(producer(), 4)
+        assert next(items) == 1
+        with pytest.raises(ValueError, match='bad input'):
+            next(items)
+    
+    def test_close_stops_producer(self):
+        """Test closing the consumer stops the producer thread."""
+        produced = []
+        
+        def producer():
+            for i in range(10000):
+                produced.append(i)
+                yield i
+        
+        items = threaded(producer(), 2)
+        next(items)
+        items.close()
+        count = len(produced)
+        threading.Event().wait(0.2)
+        
+        assert count < 10000
+        assert len(produced) == count
+
+
+class TestOrderedMap:
+    """Tests for ordered_map function."""
+    
+    def test_order_kept(self):
+        """Test results come back in input order."""
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = list(ordered_map(lambda x: x * 2, iter(range(50)), executor, 3))
+        
+        assert result == [x * 2 for x in range(50)]
+    
+    def test_window(self):
+        """Test only window items are submitted ahead of the consumer."""
+        submitted = []
+        
+        def items():
+            for i in range(100):
+                submitted.append(i)
+                yield i
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = ordered_map(lambda x: x, items(), executor, 5)
+            assert next(results) == 0
+            assert len(submitted) == 5
+            results.close()
+
+
+class TestThreadedWriter:
+    """Tests for threaded_writer function."""
+    
+    def test_writes_on_own_thread(self):
+        """Test every record is written by a separate thread."""
+        written = []
+        threads = set()
+        
+        def write(records):
+            for record in records:
+                threads.add(threading.get_ident())
+                written.append(record)
+        
+        threaded_writer(write, iter(range(100)), 4)
+        
+        assert written == list(range(100))
+        assert threads and threading.get_ident() not in threads
+    
+    def test_writer_error_raised(self):
+        """Test an error in the writer is raised and does not block."""
+        def write(records):
+            next(records)
+            raise IOError('disk full')
+        
+        with pytest.raises(IOError, match='disk full'):
+            threaded_writer(write, iter(range(1000)), 2)
+    
+    def test_records_error_raised(self):
+        """Test an error producing records stops the writer and is raised."""
+        written = []
+        
+        def records():
+            yield 1
+            yield 2
+            raise KeyError('bad record')
+        
+        with pytest.raises(KeyError, match='bad record'):
+            threaded_writer(written.extend, records(), 1)
+        
+        assert written == [1, 2]
+
+
+class TestCandidateBatches:
+    """Tests for candidate_batches function."""
+    
+    def test_batches_per_transform(self):
+        """Test batches hold one transform and are capped in size."""
+        candidates = [
+            Candidate('core_bio', 'city', 'original', 'york', None),
+            Candidate('core_bio', 'city', 'synonym', 'a', None),
+            Candidate('core_bio', 'city', 'synonym', 'b', None),
+            Candidate('core_bio', 'city', 'synonym', 'c', None)
+        ]
+        
+        batches = list(candidate_batches([('0:John', iter(candidates))], 2))
+        
+        assert [(k, [c.clear_text for c in b]) for k, b in batches] == [
+            ('0:John', ['york']), ('0:John', ['a', 'b']), ('0:John', ['c'])]
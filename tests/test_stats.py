@@ -0,0 +1,149 @@
+"""
+Unit tests for the stats module.
+"""
+import json
+import pytest
+from unittest.mock import patch
+from pata_password_cracker.stats import Stats, stats, timed, timed_iter
+
+
+class TestStats:
+    """Tests for Stats class."""
+    
+    @patch('pata_password_cracker.stats.time.perf_counter')
+    def test_nested_stages_are_exclusive(self, mock_clock):
+        """Test time in a nested stage is only counted against it."""
+        mock_clock.side_effect = [0.0, 1.0, 2.0, 5.0, 6.0]
+        run = Stats()
+        
+        run.start('output')
+        run.start('hash')
+        run.stop(10)
+        run.stop()
+        
+        assert run.stages['hash'] == [1, 10, 3.0]
+        assert run.stages['output'] == [1, 0, 2.0]
+    
+    def test_iterate_counts_items(self):
+        """Test iterate counts one call and every item."""
+        run = Stats()
+        
+        assert list(run.iterate('input', ['a', 'b', 'c'])) == ['a', 'b', 'c']
+        assert run.stages['input'][:2] == [1, 3]
+    
+    def test_iterate_records_errors(self):
+        """Test a failing iterator still closes its stage."""
+        run = Stats()
+        
+        def failing():
+            yield 'a'
+            raise ValueError('bad input')
+        
+        with pytest.raises(ValueError):
+            list(run.iterate('input', failing()))
+        
+        assert run.stages['input'][:2] == [1, 1]
+        assert run.stack == []
+    
+    def test_threads_keep_own_stack(self):
+        """Test stages started on another thread do not nest in this one."""
+        import threading
+        
+        run = Stats()
+        run.start('generate')
+        other = threading.Thread(target=lambda: (run.start('hash'), run.stop(5)))
+        other.start()
+        other.join()
+        run.stop(1)
+        
+        assert run.stack == []
+        assert run.stages['hash'][:2] == [1, 5]
+        assert run.stages['generate'][:2] == [1, 1]
+    
+    def test_merge(self):
+        """Test stages from another process are added."""
+        run = Stats()
+        run.merge({'hash': [2, 20, 1.5]})
+        run.merge({'hash': [1, 5, 0.5], 'output': [1, 0, 0.25]})
+        
+        assert run.stages == {'hash': [3, 25, 2.0], 'output': [1, 0, 0.25]}
+    
+    def test_count(self):
+        """Test counted stages record calls without time."""
+        run = Stats()
+        run.count('cache.hits')
+        run.count('cache.hits', 2)
+        
+        assert run.stages == {'cache.hits': [3, 0, 0.0]}
+    
+    def test_table_and_json(self, tmp_path):
+        """Test the human and machine readable reports."""
+        run = Stats()
+        run.merge({'hash': [3, 25, 2.0], 'output': [1, 0, 4.0]})
+        
+        table = run.table().splitlines()
+        assert table[0].split() == ['stage', 'calls', 'items', 'seconds', 'share']
+        assert table[1].split()[0] == 'output'
+        assert table[2].split()[:3] == ['hash', '3', '25']
+        assert table[-1].split()[0] == 'total'
+        
+        run.write_json(str(tmp_path / 'stats.json'))
+        with open(tmp_path / 'stats.json') as f:
+            saved = json.load(f)
+        assert saved['stages']['hash'] == {'calls': 3, 'items': 25, 'seconds': 2.0}
+        assert 'total_seconds' in saved
+
+
+class TestDecorators:
+    """Tests for the timed and timed_iter decorators."""
+    
+    def test_disabled_records_nothing(self):
+        """Test nothing is recorded while stats are disabled."""
+        stats.reset()
+        
+        @timed('hash', len)
+        def hash_all(values):
+            return values
+        
+        @timed_iter('input')
+        def read(values):
+            return iter(values)
+        
+        assert hash_all(['a']) == ['a']
+        assert list(read(['a'])) == ['a']
+        assert stats.stages == {}
+    
+    def test_enabled_records_stages(self):
+        """Test calls, items and time are recorded when enabled."""
+        stats.reset()
+        stats.enabled = True
+        
+        @timed('hash', len)
+        def hash_all(values):
+            return values
+        
+        @timed_iter('input')
+        def read(values):
+            return iter(values)
+        
+        hash_all(['a', 'b'])
+        hash_all(['c'])
+        list(read(['a', 'b']))
+        
+        assert stats.stages['hash'][:2] == [2, 3]
+        assert stats.stages['input'][:2] == [1, 2]
+    
+    def test_enabled_records_failures(self):
+        """Test a failing call is still recorded and unwound."""
+        stats.reset()
+        stats.enabled = True
+        
+        @timed('output')
+        def write():
+            raise IOError('disk full')
+        
+        with pytest.raises(IOError):
+            write()
+        
+        assert stats.stages['output'][0] == 1
+        assert stats.stack == []
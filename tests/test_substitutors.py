@@ -3,9 +3,12 @@ Unit tests for substitutor modules.
 """
 import pytest
 from unittest.mock import patch, Mock
-from pata_password_cracker.substitutors.simple import MungSubstitutor
+from pata_password_cracker.substitutors.simple import MungSubstitutor, chain_replace, compile_table
 from pata_password_cracker.substitutors.common import MungSubstitutorCommon
 from pata_password_cracker.substitutors.simplerandom import MungSubstitutorRandom
+from pata_password_cracker.substitutors.leet import MungSubstitutorLeet
+from pata_password_cracker.substitutors.rules import (
+    RuleSubstitutor, parse_rule, compile_rule, compile_rules, load_rules)
 
 
 class TestMungSubstitutor:
@@ -90,6 +93,52 @@ class TestMungSubstitutor:
         assert result == expected
 
 
+    def test_munger_multi_character_keys(self):
+        """Test munger falls back to chained replaces for multi character keys."""
+        substitutor = MungSubstitutor()
+        test_table = [('ab', 'X'), ('X', 'Y')]
+        result = substitutor.munger("abcab", test_table)
+        assert result == "YcY"
+    
+    def test_substitute_many(self):
+        """Test batch substitution keeps input order."""
+        substitutor = MungSubstitutor()
+        result = substitutor.substitute_many(["hello", "", "xyz"])
+        assert result == ["#3110", "", "%yz"]
+
+
+class TestCompiledTables:
+    """Tests for the compiled single pass substitution tables."""
+    
+    @pytest.mark.parametrize('substitutor,table', [
+        (MungSubstitutor(), MungSubstitutor.substitution_table_simple),
+        (MungSubstitutorCommon(), MungSubstitutorCommon.substitution_table_common)
+    ])
+    def test_compiled_matches_chained_replace(self, substitutor, table):
+        """Test the single pass translation reproduces the chained replaces."""
+        samples = [
+            "hello", "013", "/-", "AaEe", "Broadway", "James1982-05-06",
+            "wow", "SOS", "iI1", "Tin Tin", "qwertyuiopasdfghjklzxcvbnm",
+            "QWERTYUIOPASDFGHJKLZXCVBNM", "0123456789/-"
+        ]
+        for sample in samples:
+            assert substitutor.substitute(sample) == chain_replace(sample, table.items())
+    
+    def test_compile_table_chains_rules(self):
+        """Test each character maps to the end of its rule chain."""
+        translation = compile_table((('i', '1'), ('1', 'I')))
+        assert translation == {ord('i'): 'I', ord('1'): 'I'}
+    
+    def test_compile_table_multi_character_keys(self):
+        """Test tables with multi character keys are not compiled."""
+        assert compile_table((('ab', 'X'),)) is None
+    
+    def test_tables_compiled_once_at_class_level(self):
+        """Test the class tables are compiled when the class is defined."""
+        assert MungSubstitutor.translation_simple[ord('w')] == 'uu'
+        assert MungSubstitutorCommon.translation_common[ord('S')] == '2'
+
+
 class TestMungSubstitutorCommon:
     """Tests for MungSubstitutorCommon class."""
     
@@ -216,6 +265,161 @@ class TestMungSubstitutorRandom:
         assert mock_sample.call_count >= 1
 
 
+class TestMungSubstitutorLeet:
+    """Tests for MungSubstitutorLeet class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.substitutor = MungSubstitutorLeet()
+    
+    def test_single_substitutions_first(self):
+        """Test variants with one substituted character come first."""
+        result = self.substitutor.substitute('sea')
+        assert result[:5] == ['$ea', '5ea', 's3a', 'se@', 'se4']
+    
+    def test_all_variants(self):
+        """Test every partial substitution is enumerated."""
+        result = self.substitutor.substitute('at')
+        assert result == ['@t', '4t', 'a7', 'a+', '@7', '@+', '47', '4+']
+    
+    def test_no_original_in_variants(self):
+        """Test the unchanged password is not returned."""
+        result = self.substitutor.substitute('password')
+        assert 'password' not in result
+        assert len(result) == len(set(result))
+    
+    def test_max_variants_cap(self):
+        """Test the number of variants is capped."""
+        self.substitutor.max_variants = 3
+        result = self.substitutor.substitute('password')
+        assert result == ['p@ssword', 'p4ssword', 'pa$sword']
+    
+    def test_max_variants_no_cap(self):
+        """Test a cap of 0 or None gives every variant."""
+        for max_variants in (0, None):
+            self.substitutor.max_variants = max_variants
+            assert len(self.substitutor.substitute('password')) == 3 * 3 * 3 * 2 - 1
+    
+    def test_class_max_variants(self):
+        """Test the cap is read from the base class."""
+        with patch.object(MungSubstitutor, 'max_variants', 2):
+            assert len(MungSubstitutorLeet().substitute('password')) == 2
+    
+    def test_no_substitutable_characters(self):
+        """Test passwords without leet characters."""
+        assert self.substitutor.substitute('xyw') == []
+        assert self.substitutor.substitute('') == []
+    
+    def test_substitute_many(self):
+        """Test batch substitution returns a flat list of variants."""
+        result = self.substitutor.substitute_many(['at', 'xyw', 'a'])
+        assert result == ['@t', '4t', 'a7', 'a+', '@7', '@+', '47', '4+', '@', '4']
+    
+    def test_variants_lazy(self):
+        """Test variants are generated lazily."""
+        variants = self.substitutor.variants('a' * 40)
+        assert next(variants) == '@' + 'a' * 39
+
+
+class TestRuleSubstitutor:
+    """Tests for the hashcat style rule engine."""
+    
+    def test_parse_rule(self):
+        """Test rules are split into functions and parameters."""
+        assert parse_rule('c $1 sa@ TA') == [
+            ('c', ()), ('$', ('1',)), ('s', ('a', '@')), ('T', (10,))]
+    
+    def test_parse_rule_space_parameter(self):
+        """Test a space is taken as a parameter after a function."""
+        assert parse_rule('$ $!') == [('$', (' ',)), ('$', ('!',))]
+    
+    def test_case_rules(self):
+        """Test the case toggling functions."""
+        assert compile_rule('l')('PassWord') == 'password'
+        assert compile_rule('u')('PassWord') == 'PASSWORD'
+        assert compile_rule('c')('passWord') == 'Password'
+        assert compile_rule('C')('password') == 'pASSWORD'
+        assert compile_rule('t')('PassWord') == 'pASSwORD'
+        assert compile_rule('T0')('password') == 'Password'
+        assert compile_rule('T9')('password') == 'password'
+        assert compile_rule('E')('the cat') == 'The Cat'
+    
+    def test_append_prepend_rules(self):
+        """Test appending and prepending characters."""
+        assert compile_rule('$1 $2 $3')('pass') == 'pass123'
+        assert compile_rule('^3 ^2 ^1')('pass') == '123pass'
+        assert compile_rule('c $!')('pass') == 'Pass!'
+    
+    def test_duplicate_reverse_rules(self):
+        """Test duplicating, reflecting and reversing."""
+        assert compile_rule('d')('ab') == 'abab'
+        assert compile_rule('p2')('ab') == 'ababab'
+        assert compile_rule('f')('ab') == 'abba'
+        assert compile_rule('r')('abc') == 'cba'
+        assert compile_rule('q')('ab') == 'aabb'
+        assert compile_rule('z2')('ab') == 'aaab'
+        assert compile_rule('Z2')('ab') == 'abbb'
+    
+    def test_position_rules(self):
+        """Test rotating, deleting, inserting and swapping."""
+        assert compile_rule('{')('abc') == 'bca'
+        assert compile_rule('}')('abc') == 'cab'
+        assert compile_rule('[')('abc') == 'bc'
+        assert compile_rule(']')('abc') == 'ab'
+        assert compile_rule('D1')('abc') == 'ac'
+        assert compile_rule('x12')('abcd') == 'bc'
+        assert compile_rule('O12')('abcd') == 'ad'
+        assert compile_rule('i1!')('abc') == 'a!bc'
+        assert compile_rule('o1!')('abc') == 'a!c'
+        assert compile_rule("'2")('abc') == 'ab'
+        assert compile_rule('k')('abc') == 'bac'
+        assert compile_rule('K')('abc') == 'acb'
+        assert compile_rule('*02')('abc') == 'cba'
+    
+    def test_substitution_rules(self):
+        """Test replacing and purging characters."""
+        assert compile_rule('sa@ so0')('foobar') == 'f00b@r'
+        assert compile_rule('@o')('foobar') == 'fbar'
+    
+    def test_rejection_rules(self):
+        """Test rejected words give None."""
+        assert compile_rule('>3 $1')('abc') is None
+        assert compile_rule('>2 $1')('abc') == 'abc1'
+        assert compile_rule('<4')('abcd') is None
+        assert compile_rule('_3')('abc') == 'abc'
+        assert compile_rule('!a')('abc') is None
+        assert compile_rule('/a')('abc') == 'abc'
+    
+    def test_compile_rules_skips(self):
+        """Test comments are ignored and unsupported rules counted."""
+        compiled, skipped = compile_rules(['# comment', '', 'u', 'M', '$'])
+        assert len(compiled) == 1
+        assert skipped == 2
+    
+    def test_load_rules_file(self, tmp_path):
+        """Test a rule file is compiled once and remembered."""
+        rule_file = tmp_path / 'test.rule'
+        rule_file.write_text('u\n$1\n')
+        first = load_rules(str(rule_file))
+        assert [rule('ab') for rule in first] == ['AB', 'ab1']
+        assert load_rules(str(rule_file)) is first
+    
+    def test_substitute_many(self, tmp_path):
+        """Test a batch gives distinct variants without the originals."""
+        rule_file = tmp_path / 'test.rule'
+        rule_file.write_text(':\nu\nl\n>3 $1\n')
+        RuleSubstitutor.rules_file = str(rule_file)
+        result = RuleSubstitutor().substitute_many(['cat', 'Dogs'])
+        assert result == ['CAT', 'DOGS', 'dogs', 'Dogs1']
+    
+    def test_substitute_default_rules(self):
+        """Test the default rules are used without a rule file."""
+        result = RuleSubstitutor().substitute('pass')
+        assert 'Pass1' in result
+        assert 'p@ss' in result
+        assert 'pass' not in result
+
+
 class TestSubstitutorComparison:
     """Tests comparing different substitutor classes."""
     
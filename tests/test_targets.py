@@ -0,0 +1,183 @@
+"""
+Unit tests for the target hashes module.
+"""
+import hashlib
+import threading
+import pytest
+import bcrypt
+from pata_password_cracker.targets import TargetHashes, target_hashes
+from pata_password_cracker.encryption.md5 import MD5Encryption
+from pata_password_cracker.encryption.sha256 import SHA256Encryption
+from pata_password_cracker.encryption.bcrypt import BcryptEncryption
+
+
+def md5(value):
+    return hashlib.md5(value.encode('utf-8')).hexdigest()
+
+
+class TestTargetHashes:
+    """Tests for TargetHashes class."""
+    
+    def test_identify(self):
+        """Test hashes are identified by their format."""
+        targets = TargetHashes()
+        
+        assert targets.identify('a' * 32) == 'md5'
+        assert targets.identify('a' * 40) == 'sha1'
+        assert targets.identify('a' * 64) == 'sha256'
+        assert targets.identify('a' * 128) == 'sha512'
+        assert targets.identify('$2b$04$' + 'a' * 53) == 'bcrypt'
+        assert targets.identify('a' * 33) is None
+        assert targets.identify('z' * 32) is None
+    
+    def test_load(self, tmp_path):
+        """Test a hash file is loaded into a set per encryption."""
+        hash_file = tmp_path / 'hashes.txt'
+        hash_file.write_text(
+            '# captured\n'
+            + md5('london').upper() + '\n'
+            + '\n'
+            + 'sha1:' + hashlib.sha1(b'paris').hexdigest() + '\n'
+            + 'not-a-hash\n')
+        
+        targets = TargetHashes().load(str(hash_file))
+        
+        assert targets.hashes == {
+            'md5': {md5('london')},
+            'sha1': {hashlib.sha1(b'paris').hexdigest()}}
+        assert len(targets) == 2
+        assert targets.unknown == 1
+    
+    def test_bcrypt_grouped_by_salt(self):
+        """Test bcrypt hashes are kept per salt."""
+        first = bcrypt.hashpw(b'london', bcrypt.gensalt(4)).decode('ascii')
+        second = bcrypt.hashpw(b'paris', bcrypt.gensalt(4)).decode('ascii')
+        targets = TargetHashes()
+        targets.add(first)
+        targets.add(second)
+        
+        assert targets.hashes == {
+            'bcrypt' + first[:29]: {first.encode('ascii')},
+            'bcrypt' + second[:29]: {second.encode('ascii')}}
+        assert set(targets.algorithms.values()) == {'bcrypt'}
+    
+    def test_encryption_dict(self):
+        """Test only selected encryptions with targets are used."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.add('b' * 64)
+        
+        encryption = targets.encryption_dict(
+            {'md5': MD5Encryption, 'sha1': object})
+        
+        assert encryption == {'md5': MD5Encryption}
+        assert targets.missing({'md5': MD5Encryption}) == ['sha256']
+    
+    def test_encryption_dict_bcrypt_salt(self):
+        """Test bcrypt hashes with each target salt."""
+        captured = bcrypt.hashpw(b'london', bcrypt.gensalt(4))
+        targets = TargetHashes()
+        targets.add(captured.decode('ascii'))
+        
+        encryption = targets.encryption_dict({'bcrypt': BcryptEncryption})
+        key, encryptor = encryption.popitem()
+        
+        assert encryptor().hash('london') == captured
+        assert targets.matches({key: captured}) == {'bcrypt': captured}
+    
+    def test_matches(self):
+        """Test only hashes in the targets are returned."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.add(SHA256Encryption().hash('paris'))
+        
+        assert targets.matches({'md5': md5('london')}) == {'md5': md5('london')}
+        assert targets.matches({'md5': md5('paris')}) == {}
+        assert targets.matches({
+            'md5': md5('paris'),
+            'sha256': SHA256Encryption().hash('paris')}) == {
+                'sha256': SHA256Encryption().hash('paris')}
+
+    
+    def test_matches_removes_cracked(self):
+        """Test a cracked hash is only reported once."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.add(md5('paris'))
+        
+        assert targets.matches({'md5': md5('london')}) == {'md5': md5('london')}
+        assert targets.matches({'md5': md5('london')}) == {}
+        assert len(targets) == 1
+        assert not targets.done()
+        
+        targets.matches({'md5': md5('paris')})
+        assert targets.done()
+    
+    def test_discard_sets_cancel(self):
+        """Test cancel is set once every target is cracked."""
+        cancel = threading.Event()
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.cancel = cancel
+        
+        targets.discard({'md5': md5('paris')})
+        assert not cancel.is_set()
+        
+        targets.discard({'md5': md5('london')})
+        assert cancel.is_set()
+    
+    def test_done_when_cancelled(self):
+        """Test another process can cancel the run."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.cancel = threading.Event()
+        
+        assert not targets.done()
+        targets.cancel.set()
+        assert targets.done()
+    
+    def test_cracked_ignores_cancel(self):
+        """Test cracked only counts the hashes cracked in this process."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.cancel = threading.Event()
+        targets.cancel.set()
+        
+        assert targets.done()
+        assert not targets.cracked()
+        targets.discard({'md5': md5('london')})
+        assert targets.cracked()
+    
+    def test_report(self):
+        """Test a crack is only reported the first time it is seen."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        
+        assert targets.report({'md5': md5('london')}) == {'md5': md5('london')}
+        assert targets.report({'md5': md5('london')}) == {}
+        assert targets.cracked()
+    
+    def test_select(self):
+        """Test hashes of unselected encryptions are dropped."""
+        targets = TargetHashes()
+        targets.add(md5('london'))
+        targets.add('sha1:' + hashlib.sha1(b'paris').hexdigest())
+        
+        assert targets.select({'md5': MD5Encryption}) is targets
+        assert len(targets) == 1
+        assert targets.missing({'md5': MD5Encryption}) == []
+        targets.discard({'md5': md5('london')})
+        assert targets.done()
+
+class TestTargetHashesLoader:
+    """Tests for target_hashes function."""
+    
+    def test_target_hashes_loaded_once(self, tmp_path):
+        """Test the same file is only loaded once."""
+        hash_file = tmp_path / 'hashes.txt'
+        hash_file.write_text(md5('london') + '\n')
+        
+        first = target_hashes(str(hash_file))
+        
+        assert target_hashes(str(hash_file)) is first
+        assert first.hashes == {'md5': {md5('london')}}
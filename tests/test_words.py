@@ -0,0 +1,175 @@
+"""
+Unit tests for the memory mapped word list.
+"""
+import os
+import pickle
+import pytest
+import tempfile
+from pata_password_cracker.words import (
+    MappedWords,
+    NeighbourIndex,
+    deletions,
+    neighbour_index
+)
+
+
+@pytest.fixture
+def word_file():
+    """Create a word list in a temporary directory."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, 'words.txt')
+        with open(path, 'w') as f:
+            f.write("apple\nbanana \ncherry\r\ndog\nfox\ncafé\nguitar")
+        yield path
+
+
+class TestMappedWords:
+    """Tests for MappedWords class."""
+    
+    def test_matches_word_list(self, word_file):
+        """Test words are read as ProcessInputWords reads them."""
+        words = MappedWords(word_file)
+        
+        assert len(words) == 7
+        assert list(words) == ['apple', 'banana', 'cherry', 'dog', 'fox', 'café', 'guitar']
+    
+    def test_indexing(self, word_file):
+        """Test words can be indexed and sliced."""
+        words = MappedWords(word_file)
+        
+        assert words[0] == 'apple'
+        assert words[-1] == 'guitar'
+        assert words[1:3] == ['banana', 'cherry']
+        assert 'dog' in words
+        with pytest.raises(IndexError):
+            words[7]
+    
+    def test_empty_file(self):
+        """Test an empty word list."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'empty.txt')
+            open(path, 'w').close()
+            
+            words = MappedWords(path)
+            assert len(words) == 0
+            assert list(words) == []
+    
+    def test_index_in_memory(self, word_file):
+        """Test no index file is written without an index directory."""
+        words = MappedWords(word_file)
+        
+        assert words.index_path() is None
+        assert os.listdir(os.path.dirname(word_file)) == ['words.txt']
+        assert list(words.offsets) == [0, 6, 14, 22, 26, 30, 36, 42]
+    
+    def test_index_saved_and_reused(self, word_file):
+        """Test the offset index is saved and loaded on the next run."""
+        with tempfile.TemporaryDirectory() as index_dir:
+            MappedWords(word_file, index_dir)
+            
+            words = MappedWords(word_file, index_dir)
+            assert isinstance(words.offsets, memoryview)
+            assert list(words)[:2] == ['apple', 'banana']
+    
+    def test_stale_index_rebuilt(self, word_file):
+        """Test a changed word list is indexed again."""
+        with tempfile.TemporaryDirectory() as index_dir:
+            MappedWords(word_file, index_dir)
+            with open(word_file, 'a') as f:
+                f.write("\nhouse")
+            os.utime(word_file, ns=(0, 0))
+            
+            words = MappedWords(word_file, index_dir)
+            assert words[-1] == 'house'
+            assert len(words) == 8
+    
+    def test_index_dir(self, word_file):
+        """Test indexes can be kept in a separate directory."""
+        with tempfile.TemporaryDirectory() as index_dir:
+            words = MappedWords(word_file, index_dir)
+            
+            assert not os.path.exists(word_file + '.idx')
+            assert os.listdir(index_dir) == [os.path.basename(words.index_path())]
+    
+    def test_unwritable_index(self, word_file):
+        """Test the word list still loads when the index cannot be saved."""
+        words = MappedWords(word_file, os.path.join(word_file, 'not_a_dir'))
+        assert len(words) == 7
+    
+    def test_fingerprint(self, word_file):
+        """Test the fingerprint changes with the word list."""
+        first = MappedWords(word_file).fingerprint
+        assert MappedWords(word_file).fingerprint == first
+        
+        with open(word_file, 'a') as f:
+            f.write("\nhouse")
+        os.utime(word_file, ns=(0, 0))
+        assert MappedWords(word_file).fingerprint != first
+    
+    def test_pickle(self, word_file):
+        """Test only the path is pickled and the file mapped again."""
+        words = MappedWords(word_file)
+        data = pickle.dumps(words)
+        
+        assert b'banana' not in data
+        assert list(pickle.loads(data)) == list(words)
+    
+    def test_length_index(self, word_file):
+        """Test words are indexed by length in list order."""
+        words = MappedWords(word_file)
+        lengths = words.length_index()
+        
+        assert {k: list(v) for k, v in lengths.items()} == {
+            5: [0], 6: [1, 2, 6], 3: [3, 4], 4: [5]}
+        assert words.length_index() is lengths
+
+
+class TestNeighbourIndex:
+    """Tests for NeighbourIndex class."""
+    
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.words = ['smith', 'smiht', 'smit', 'smiths', 'smyth', 'jones', 'smth', 'smith']
+        self.index = NeighbourIndex(self.words)
+    
+    def test_deletions(self):
+        """Test every single character deletion is generated."""
+        assert deletions('cat') == ['at', 'ct', 'ca']
+        assert deletions('') == []
+    
+    def test_neighbours_by_edit(self):
+        """Test words one insertion, deletion, substitution or transposition away."""
+        result = list(self.index.neighbours('smith', 1, 6))
+        
+        assert result == ['smith', 'smiht', 'smit', 'smiths', 'smyth', 'smth', 'smith']
+        assert 'jones' not in result
+    
+    def test_neighbours_length_range(self):
+        """Test only words within the length range are returned."""
+        assert list(self.index.neighbours('smith', 5, 5)) == ['smith', 'smiht', 'smyth', 'smith']
+        assert list(self.index.neighbours('smith', 4, 4)) == ['smit', 'smth']
+    
+    def test_buckets_built_lazily(self):
+        """Test only the word lengths needed are indexed."""
+        assert self.index.buckets == {}
+        
+        self.index.neighbours('smith', 3, 5)
+        
+        assert set(self.index.buckets) == {4, 5}
+        assert list(self.index.buckets[5]['smth']) == [0, 4, 7]
+    
+    def test_mapped_words(self, word_file):
+        """Test the index uses a mapped word lists length index."""
+        words = MappedWords(word_file)
+        index = NeighbourIndex(words)
+        
+        assert list(index.neighbours('dot', 2, 3)) == ['dog']
+        assert index.lengths is None
+        assert words.lengths is not None
+    
+    def test_neighbour_index_reused(self):
+        """Test the index for the last word list seen is reused."""
+        first = neighbour_index(self.words)
+        
+        assert neighbour_index(self.words) is first
+        assert neighbour_index(list(self.words)) is not first